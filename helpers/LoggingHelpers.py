@@ -67,19 +67,25 @@ def save_mismatch_report(
         filename: str,
         test_name: str,
         timestamp: Optional[str] = None,
+        chunk_size: int = 100_000,
 ):
-    """Save mismatch DataFrame to CSV with metadata."""
-    if df.empty:
+    """Save mismatch DataFrame to CSV with metadata, streaming rows in chunks."""
+    if df is None or df.empty:
         return
 
     timestamp = timestamp or datetime.now().strftime("%Y%m%d_%H%M%S")
     report_path = Path(f"reports/mismatches/{test_name}_{timestamp}.csv")
-    report_path.parent.mkdir(exist_ok=True)
+    report_path.parent.mkdir(parents=True, exist_ok=True)
 
-    # Add metadata row
+    # Metadata row first, then the detail rows under the same header (no concat copy)
     meta_df = pd.DataFrame([{"test_name": test_name, "timestamp": timestamp, "row_count": len(df)}])
-    combined = pd.concat([meta_df, df], ignore_index=True)
-    combined.to_csv(report_path, index=False)
+    columns = list(meta_df.columns) + [col for col in df.columns if col not in meta_df.columns]
+    meta_df.reindex(columns=columns).to_csv(report_path, index=False)
+
+    for start in range(0, len(df), chunk_size):
+        df.iloc[start:start + chunk_size].reindex(columns=columns).to_csv(
+            report_path, mode="a", header=False, index=False
+        )
 
     return str(report_path)
 
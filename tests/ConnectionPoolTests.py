@@ -0,0 +1,212 @@
+import threading
+import time
+
+import pytest
+
+from utilities import ConnectionPool as connection_pool
+from utilities.ConnectionPool import ConnectionPool, get_pool
+
+
+class FakeCursor:
+    def __init__(self, conn):
+        self.conn = conn
+
+    def execute(self, query):
+        if self.conn.broken:
+            raise ConnectionError("connection reset")
+        self.conn.queries.append(query)
+
+    def fetchall(self):
+        return [(1,)]
+
+    def close(self):
+        pass
+
+
+class FakeConnection:
+    def __init__(self, number):
+        self.number = number
+        self.broken = False
+        self.closed = False
+        self.queries = []
+
+    def cursor(self):
+        return FakeCursor(self)
+
+    def close(self):
+        self.closed = True
+
+
+class FakeFactory:
+    def __init__(self, fail=False):
+        self.created = []
+        self.fail = fail
+        self._lock = threading.Lock()
+
+    def __call__(self):
+        if self.fail:
+            raise ConnectionError("login failed")
+        with self._lock:
+            conn = FakeConnection(len(self.created))
+            self.created.append(conn)
+            return conn
+
+
+def test_checkin_reuses_connection():
+    factory = FakeFactory()
+    pool = ConnectionPool(factory)
+
+    first = pool.checkout()
+    pool.checkin(first)
+    second = pool.checkout()
+
+    assert second is first
+    assert len(factory.created) == 1
+    assert pool.stats()["hits"] == 1
+    assert pool.stats()["misses"] == 1
+
+
+def test_min_size_connections_are_opened_up_front():
+    factory = FakeFactory()
+    pool = ConnectionPool(factory, min_size=2, max_size=3)
+
+    assert len(factory.created) == 2
+    assert pool.stats()["idle"] == 2
+
+
+@pytest.mark.parametrize("min_size, max_size", [(0, 0), (-1, 2), (3, 2)])
+def test_invalid_sizes_raise(min_size, max_size):
+    with pytest.raises(ValueError, match="Pool sizes"):
+        ConnectionPool(FakeFactory(), min_size=min_size, max_size=max_size)
+
+
+def test_concurrent_checkout_never_exceeds_max_size():
+    factory = FakeFactory()
+    pool = ConnectionPool(factory, max_size=2, checkout_timeout=5)
+    lock = threading.Lock()
+    in_use, peak, errors = [0], [0], []
+
+    def worker():
+        try:
+            with pool.connection():
+                with lock:
+                    in_use[0] += 1
+                    peak[0] = max(peak[0], in_use[0])
+                time.sleep(0.02)
+                with lock:
+                    in_use[0] -= 1
+        except Exception as exc:
+            errors.append(exc)
+
+    threads = [threading.Thread(target=worker) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert errors == []
+    assert peak[0] == 2
+    assert len(factory.created) == 2
+    stats = pool.stats()
+    assert stats["waits"] > 0
+    assert stats["size"] == 2
+
+
+def test_checkout_times_out_when_pool_is_exhausted():
+    pool = ConnectionPool(FakeFactory(), max_size=1)
+    pool.checkout()
+
+    started = time.monotonic()
+    with pytest.raises(TimeoutError, match="max_size=1"):
+        pool.checkout(timeout=0.05)
+
+    assert time.monotonic() - started >= 0.05
+    assert pool.stats()["waits"] == 1
+
+
+def test_waiting_checkout_gets_returned_connection():
+    pool = ConnectionPool(FakeFactory(), max_size=1, checkout_timeout=5)
+    conn = pool.checkout()
+    timer = threading.Timer(0.05, pool.checkin, args=(conn,))
+    timer.start()
+
+    assert pool.checkout() is conn
+    timer.join()
+
+
+def test_stale_connection_failing_liveness_is_replaced():
+    factory = FakeFactory()
+    pool = ConnectionPool(factory, liveness_interval=0)
+    conn = pool.checkout()
+    pool.checkin(conn)
+    conn.broken = True
+    time.sleep(0.01)
+
+    replacement = pool.checkout()
+
+    assert replacement is not conn
+    assert conn.closed
+    stats = pool.stats()
+    assert stats["liveness_failures"] == 1
+    assert stats["size"] == 1
+
+
+def test_fresh_connection_skips_liveness_check():
+    pool = ConnectionPool(FakeFactory(), liveness_interval=60)
+    conn = pool.checkout()
+    pool.checkin(conn)
+
+    assert pool.checkout() is conn
+    assert conn.queries == []
+
+
+def test_idle_eviction_keeps_min_size():
+    factory = FakeFactory()
+    pool = ConnectionPool(factory, min_size=1, max_size=3, idle_timeout=0)
+    connections = [pool.checkout() for _ in range(3)]
+    for conn in connections:
+        pool.checkin(conn)
+    time.sleep(0.01)
+
+    kept = pool.checkout()
+
+    stats = pool.stats()
+    assert stats["evicted"] == 2
+    assert stats["size"] == 1
+    assert sum(conn.closed for conn in connections) == 2
+    assert not kept.closed
+
+
+def test_connection_is_discarded_after_error():
+    pool = ConnectionPool(FakeFactory())
+
+    with pytest.raises(RuntimeError):
+        with pool.connection() as conn:
+            raise RuntimeError("query failed")
+
+    assert conn.closed
+    assert pool.stats()["size"] == 0
+
+
+def test_factory_failure_releases_the_slot():
+    factory = FakeFactory(fail=True)
+    pool = ConnectionPool(factory, max_size=1)
+
+    with pytest.raises(ConnectionError):
+        pool.checkout()
+    factory.fail = False
+
+    assert pool.checkout(timeout=0.05) is factory.created[0]
+
+
+def test_get_pool_shares_pools_per_config(monkeypatch):
+    monkeypatch.setattr(connection_pool, "_POOLS", {})
+    factory = FakeFactory()
+
+    first = get_pool("snowflake", {"account": "a"}, factory, max_size=2)
+    same = get_pool("SNOWFLAKE", {"account": "a"}, factory, max_size=9)
+    other = get_pool("snowflake", {"account": "b"}, factory)
+
+    assert first is same
+    assert first.max_size == 2
+    assert other is not first
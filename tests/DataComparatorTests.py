@@ -0,0 +1,214 @@
+from decimal import Decimal
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from utilities.DataComparator import DataComparator
+
+
+def _frame(keys, values, dtype=None):
+    return pd.DataFrame({"ID": keys, "VALUE": pd.array(values, dtype=dtype) if dtype else values})
+
+
+def _mismatches(result):
+    if result.details is None:
+        return {}
+    rows = result.details[result.details["ISSUE_TYPE"] == "VALUE_MISMATCH"]
+    return dict(zip(rows["ID"], zip(rows["ACTUAL_VALUE"], rows["EXPECTED_VALUE"])))
+
+
+@pytest.fixture(params=[
+    {},
+    {"encode_keys": True},
+    {"use_fingerprint": True},
+    {"engine": "duckdb"},
+], ids=["default", "encode_keys", "fingerprint", "duckdb"])
+def comparator(request):
+    if request.param.get("engine") == "duckdb":
+        pytest.importorskip("duckdb")
+    return DataComparator(**request.param)
+
+
+def test_nulls_on_both_sides_match(comparator):
+    actual = _frame([1, 2, 3], [1.5, np.nan, None])
+    expected = _frame([1, 2, 3], [1.5, None, np.nan])
+
+    result = comparator.compare_by_keys(actual, expected, ["ID"])
+
+    assert result.success, result.message
+
+
+def test_null_against_value_is_a_mismatch(comparator):
+    actual = _frame([1, 2], [1.0, np.nan])
+    expected = _frame([1, 2], [np.nan, 2.0])
+
+    result = comparator.compare_by_keys(actual, expected, ["ID"])
+
+    assert not result.success
+    assert result.meta["mismatched_count"] == 2
+    assert set(_mismatches(result)) == {1, 2}
+
+
+@pytest.mark.parametrize("dtype, actual_values, expected_values", [
+    ("string", ["a", None, "b", None], ["a", None, "c", "d"]),
+    ("boolean", [True, None, False, None], [True, None, True, False]),
+    ("Int64", [1, None, 3, None], [1, None, 4, 5]),
+    ("Float64", [1.5, None, 3.5, None], [1.5, None, 4.5, 5.5]),
+])
+def test_extension_dtypes_with_missing_values(comparator, dtype, actual_values, expected_values):
+    actual = _frame([1, 2, 3, 4], actual_values, dtype)
+    expected = _frame([1, 2, 3, 4], expected_values, dtype)
+
+    result = comparator.compare_by_keys(actual, expected, ["ID"])
+
+    assert not result.success
+    assert result.meta["mismatched_count"] == 2
+    assert set(_mismatches(result)) == {3, 4}
+
+
+def test_string_extension_against_object_column(comparator):
+    actual = _frame([1, 2, 3], ["a", None, "b"], "string")
+    expected = _frame([1, 2, 3], ["a", None, "c"], object)
+
+    result = comparator.compare_by_keys(actual, expected, ["ID"])
+
+    assert set(_mismatches(result)) == {3}
+
+
+def test_absolute_tolerance(comparator):
+    actual = _frame([1, 2, 3], [10.0, 10.0, 10.0])
+    expected = _frame([1, 2, 3], [10.05, 10.1, 10.2])
+
+    result = comparator.compare_by_keys(actual, expected, ["ID"], numeric_tolerance=0.1)
+
+    assert set(_mismatches(result)) == {3}
+
+
+def test_relative_tolerance(comparator):
+    actual = _frame([1, 2], [1000.0, 1.0])
+    expected = _frame([1, 2], [1001.0, 1.01])
+
+    result = comparator.compare_by_keys(actual, expected, ["ID"], relative_tolerance=0.005)
+
+    assert set(_mismatches(result)) == {2}
+
+
+def test_per_column_tolerance(comparator):
+    actual = pd.DataFrame({"ID": [1, 2], "PRICE": [1.0, 2.0], "QTY": [5, 7]})
+    expected = pd.DataFrame({"ID": [1, 2], "PRICE": [1.05, 2.0], "QTY": [5, 8]})
+
+    result = comparator.compare_by_keys(actual, expected, ["ID"], numeric_tolerance={"PRICE": 0.1})
+
+    assert result.meta["mismatched_count_by_column"] == {"QTY": 1}
+
+
+def test_tolerance_treats_equal_infinities_as_equal(comparator):
+    actual = _frame([1, 2], [np.inf, np.inf])
+    expected = _frame([1, 2], [np.inf, -np.inf])
+
+    result = comparator.compare_by_keys(actual, expected, ["ID"], numeric_tolerance=0.5)
+
+    assert set(_mismatches(result)) == {2}
+
+
+def test_tolerance_on_nullable_integers(comparator):
+    actual = _frame([1, 2, 3], [100, None, 100], "Int64")
+    expected = _frame([1, 2, 3], [101, None, 103], "Int64")
+
+    result = comparator.compare_by_keys(actual, expected, ["ID"], numeric_tolerance=1)
+
+    assert set(_mismatches(result)) == {3}
+
+
+@pytest.mark.parametrize("tolerance", [0, 1])
+def test_int64_extremes_do_not_overflow(comparator, tolerance):
+    actual = _frame([1, 2], [2**62, 5])
+    expected = _frame([1, 2], [-(2**62), 5])
+
+    result = comparator.compare_by_keys(actual, expected, ["ID"], numeric_tolerance=tolerance)
+
+    assert set(_mismatches(result)) == {1}
+
+
+def test_values_of_different_types_do_not_match(comparator):
+    actual = pd.DataFrame({"ID": [1, 2, 3], "VALUE": [1, 2, None]})
+    expected = pd.DataFrame({"ID": [1, 2, 3], "VALUE": pd.Series(["1", 2, None], dtype=object)})
+
+    result = comparator.compare_by_keys(actual, expected, ["ID"])
+
+    assert set(_mismatches(result)) == {1}
+
+
+@pytest.mark.parametrize("engine", ["pandas", "duckdb"])
+def test_keys_of_incompatible_types_raise(engine):
+    if engine == "duckdb":
+        pytest.importorskip("duckdb")
+    comparator = DataComparator(engine=engine)
+    actual = pd.DataFrame({"ID": [1, 2], "VALUE": [1, 2]})
+    expected = pd.DataFrame({"ID": ["1", "2"], "VALUE": [1, 2]})
+
+    with pytest.raises(ValueError, match="merge on"):
+        comparator.compare_by_keys(actual, expected, ["ID"])
+
+
+def test_int_and_float_keys_join(comparator):
+    actual = pd.DataFrame({"ID": [1, 2, 3], "VALUE": [1, 2, 3]})
+    expected = pd.DataFrame({"ID": [1.0, 2.0, np.nan], "VALUE": [1, 2, 3]})
+
+    result = comparator.compare_by_keys(actual, expected, ["ID"])
+
+    assert result.meta["missing_in_actual_count"] == 1
+    assert result.meta["missing_in_expected_count"] == 1
+    assert result.meta["mismatched_count"] == 0
+
+
+def test_fixed_point_numbers_honour_tolerance(comparator):
+    actual = pd.DataFrame({"ID": [1, 2], "AMT": [Decimal("10.00"), Decimal("20.00")]})
+    actual.attrs["numeric_scales"] = {"AMT": (38, 2)}
+    expected = pd.DataFrame({"ID": [1, 2], "AMT": [10.001, 20.5]})
+
+    result = comparator.compare_by_keys(actual, expected, ["ID"], numeric_tolerance=0.01)
+
+    assert set(_mismatches(result)) == {2}
+    assert "tolerance_not_applied" not in result.meta
+
+
+def test_wide_decimals_are_compared_exactly(comparator):
+    actual = pd.DataFrame({"ID": [1, 2], "AMT": [Decimal("123456789012345.67"), Decimal("1.00")]})
+    expected = pd.DataFrame({"ID": [1, 2], "AMT": [Decimal("123456789012345.68"), Decimal("1.00")]})
+    for frame in (actual, expected):
+        frame.attrs["numeric_scales"] = {"AMT": (38, 2)}
+
+    result = comparator.compare_by_keys(actual, expected, ["ID"])
+
+    assert _mismatches(result) == {1: (Decimal("123456789012345.67"), Decimal("123456789012345.68"))}
+
+
+def test_large_decimals_are_not_rounded(comparator):
+    actual = pd.DataFrame({"ID": [1], "AMT": [Decimal("12345678901234567890")]})
+    expected = pd.DataFrame({"ID": [1], "AMT": [Decimal("12345678901234567891")]})
+
+    result = comparator.compare_by_keys(actual, expected, ["ID"])
+
+    assert set(_mismatches(result)) == {1}
+
+
+def test_unconvertible_decimals_record_skipped_tolerance(comparator):
+    values = [Decimal("12345678901234567890.5"), None]
+    actual = pd.DataFrame({"ID": [1, 2], "AMT": pd.Series(values, dtype=object)})
+    expected = pd.DataFrame({"ID": [1, 2], "AMT": pd.Series(values, dtype=object)})
+
+    result = comparator.compare_by_keys(actual, expected, ["ID"], numeric_tolerance=0.01)
+
+    assert result.success
+    assert result.meta["tolerance_not_applied"] == ["AMT"]
+
+
+def test_aggregate_keeps_all_null_groups_null(comparator):
+    actual = pd.DataFrame({"ID": [1, 1, 2, 2], "AMT": [np.nan, np.nan, 1.0, 2.0], "NAME": ["a", "b", "c", "d"]})
+    expected = pd.DataFrame({"ID": [1, 2], "AMT": [np.nan, 3.0], "NAME": ["a", "c"]})
+
+    result = comparator.compare_by_keys(actual, expected, ["ID"], duplicate_policy="aggregate")
+
+    assert result.success, result.message
@@ -0,0 +1,165 @@
+import json
+import sys
+from datetime import date, datetime
+
+import pyarrow as pa
+import pyarrow.parquet as pq
+import pytest
+
+from utilities.LakehouseReader import LakehouseConnection
+
+
+def _sales():
+    return pa.table({
+        "ID": pa.array([1, 2, 3, 4, 5, 6], type=pa.int64()),
+        "REGION": ["north", "south", "north", None, "east", "south"],
+        "AMOUNT": [10.5, 20.0, None, 40.25, 50.0, 60.0],
+        "SOLD_AT": pa.array([
+            datetime(2024, 1, 1, 8, 0, 0),
+            datetime(2024, 1, 1, 8, 0, 0, 500000),
+            datetime(2024, 1, 2, 9, 30, 0),
+            datetime(2024, 1, 3, 10, 0, 0),
+            None,
+            datetime(2024, 1, 5, 12, 0, 0),
+        ], type=pa.timestamp("us")),
+        "SOLD_ON": pa.array([
+            date(2024, 1, 1), date(2024, 1, 1), date(2024, 1, 2), date(2024, 1, 3), None, date(2024, 1, 5),
+        ]),
+    })
+
+
+@pytest.fixture
+def lakehouse(tmp_path):
+    table = _sales()
+    sales = tmp_path / "SALES"
+    sales.mkdir()
+    pq.write_table(table.slice(0, 3), sales / "part-0.parquet")
+    pq.write_table(table.slice(3), sales / "part-1.parquet")
+
+    # Delta table: commit 0 adds two files, commit 1 removes one and adds its rewrite
+    events = tmp_path / "EVENTS"
+    (events / "_delta_log").mkdir(parents=True)
+    pq.write_table(pa.table({"ID": [1, 2], "STATUS": ["new", "new"]}), events / "a.parquet")
+    pq.write_table(pa.table({"ID": [3], "STATUS": ["new"]}), events / "b.parquet")
+    pq.write_table(pa.table({"ID": [3], "STATUS": ["done"]}), events / "c.parquet")
+    commits = [
+        [{"add": {"path": "a.parquet"}}, {"add": {"path": "b.parquet"}}],
+        [{"remove": {"path": "b.parquet"}}, {"add": {"path": "c.parquet"}}],
+    ]
+    for version, actions in enumerate(commits):
+        (events / "_delta_log" / f"{version:020d}.json").write_text(
+            "\n".join(json.dumps(action) for action in actions), encoding="utf-8"
+        )
+
+    conn = LakehouseConnection({"path": str(tmp_path)})
+    yield conn
+    conn.close()
+
+
+def _ids(conn, where):
+    table = conn.query_arrow(f"SELECT ID FROM SALES WHERE {where}")
+    return sorted(table.column("ID").to_pylist())
+
+
+@pytest.mark.parametrize("where, expected", [
+    ("REGION = 'north' AND AMOUNT > 5", [1]),
+    ("REGION = 'east' OR ID = 2", [2, 5]),
+    ("NOT (REGION = 'south')", [1, 3, 5]),
+    ("REGION IN ('north', 'east')", [1, 3, 5]),
+    ("REGION NOT IN ('north', 'south')", [5]),
+    ("ID IN (2, 4, 9)", [2, 4]),
+    ("ID BETWEEN 2 AND 4", [2, 3, 4]),
+    ("ID NOT BETWEEN 2 AND 4", [1, 5, 6]),
+    ("AMOUNT IS NULL", [3]),
+    ("REGION IS NOT NULL AND AMOUNT IS NOT NULL", [1, 2, 5, 6]),
+    ("(ID < 3 OR ID >= 6) AND NOT REGION = 'south'", [1]),
+    ("ID <> 1 AND ID != 2 AND ID <= 3", [3]),
+])
+def test_where_predicates(lakehouse, where, expected):
+    assert _ids(lakehouse, where) == expected
+
+
+@pytest.mark.parametrize("where, expected", [
+    ("SOLD_AT >= '2024-01-01 08:00:00.5'", [2, 3, 4, 6]),
+    ("SOLD_AT = '2024-01-01 08:00:00'", [1]),
+    ("SOLD_AT BETWEEN '2024-01-02' AND '2024-01-03 10:00:00'", [3, 4]),
+    ("SOLD_ON = '2024-01-01'", [1, 2]),
+    ("SOLD_ON > '2024-01-02'", [4, 6]),
+])
+def test_timestamp_and_date_literals(lakehouse, where, expected):
+    assert _ids(lakehouse, where) == expected
+
+
+def test_order_by_and_limit(lakehouse):
+    table = lakehouse.query_arrow("SELECT ID, AMOUNT FROM SALES WHERE AMOUNT IS NOT NULL ORDER BY AMOUNT DESC LIMIT 2")
+
+    assert table.column("ID").to_pylist() == [6, 5]
+
+
+def test_limit_without_order_by(lakehouse):
+    assert lakehouse.query_arrow("SELECT * FROM SALES LIMIT 4").num_rows == 4
+
+
+def test_distinct(lakehouse):
+    table = lakehouse.query_arrow("SELECT DISTINCT REGION FROM SALES")
+
+    assert table.num_rows == 4
+    assert set(table.column("REGION").to_pylist()) == {"east", "north", "south", None}
+
+
+def test_aggregates(lakehouse):
+    table = lakehouse.query_arrow(
+        "SELECT COUNT(1) AS N, COUNT(AMOUNT) AS N_AMOUNT, MIN(SOLD_AT) AS FIRST_SALE, MAX(ID) AS LAST_ID "
+        "FROM SALES WHERE ID > 1"
+    )
+
+    assert table.to_pylist() == [{
+        "N": 5, "N_AMOUNT": 4, "FIRST_SALE": datetime(2024, 1, 1, 8, 0, 0, 500000), "LAST_ID": 6,
+    }]
+
+
+def test_count_without_filter(lakehouse):
+    assert lakehouse.query_arrow("SELECT COUNT(*) FROM SALES").to_pylist() == [{"COUNT_ALL": 6}]
+
+
+def test_schema_probe(lakehouse):
+    sql = "SELECT * FROM SALES WHERE 1 = 0"
+
+    assert lakehouse.columns(sql) == ["ID", "REGION", "AMOUNT", "SOLD_AT", "SOLD_ON"]
+    table = lakehouse.query_arrow(sql)
+    assert table.num_rows == 0
+    assert table.schema.names == ["ID", "REGION", "AMOUNT", "SOLD_AT", "SOLD_ON"]
+
+
+def test_columns_are_case_insensitive(lakehouse):
+    table = lakehouse.query_arrow("SELECT id, Region FROM SALES WHERE region = 'east'")
+
+    assert table.to_pylist() == [{"ID": 5, "REGION": "east"}]
+
+
+def test_iter_arrow_chunks_respect_limit(lakehouse):
+    chunks = list(lakehouse.iter_arrow("SELECT ID FROM SALES WHERE ID > 1 LIMIT 4", chunk_rows=2))
+
+    assert all(chunk.num_rows <= 2 for chunk in chunks)
+    assert sum(chunk.num_rows for chunk in chunks) == 4
+
+
+def test_delta_log_replay(lakehouse, monkeypatch):
+    # Force the JSON commit log replay even where deltalake is installed
+    monkeypatch.setitem(sys.modules, "deltalake", None)
+
+    table = lakehouse.query_arrow("SELECT ID, STATUS FROM EVENTS ORDER BY ID")
+
+    assert table.to_pylist() == [
+        {"ID": 1, "STATUS": "new"}, {"ID": 2, "STATUS": "new"}, {"ID": 3, "STATUS": "done"},
+    ]
+
+
+def test_unknown_table_raises(lakehouse):
+    with pytest.raises(ValueError, match="not found"):
+        lakehouse.query_arrow("SELECT * FROM MISSING")
+
+
+def test_unsupported_syntax_raises(lakehouse):
+    with pytest.raises(ValueError, match="Lakehouse SQL"):
+        lakehouse.query_arrow("SELECT ID FROM SALES WHERE ID LIKE 1")
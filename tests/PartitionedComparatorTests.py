@@ -0,0 +1,127 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from utilities.DataComparator import DataComparator
+from utilities.PartitionedComparator import PartitionedComparator
+
+
+def _frame(keys, values):
+    return pd.DataFrame({"ID": keys, "VALUE": values})
+
+
+def _chunks(df, size):
+    return (df.iloc[start:start + size] for start in range(0, len(df), size))
+
+
+def _issues(result):
+    if result.details is None:
+        return {}
+    return dict(zip(result.details["ID"], result.details["ISSUE_TYPE"]))
+
+
+@pytest.fixture
+def comparator(tmp_path):
+    return PartitionedComparator(num_buckets=4, spill_dir=str(tmp_path))
+
+
+def test_matches_in_memory_comparison(comparator):
+    actual = _frame(range(100), np.arange(100) * 1.5)
+    expected = _frame(range(5, 105), np.arange(5, 105) * 1.5)
+    expected.loc[expected["ID"] == 50, "VALUE"] = -1.0
+
+    result = comparator.compare_by_keys(actual, expected, ["ID"])
+    in_memory = DataComparator().compare_by_keys(actual, expected, ["ID"])
+
+    for key in ("missing_in_actual_count", "missing_in_expected_count", "mismatched_count"):
+        assert result.meta[key] == in_memory.meta[key]
+    assert result.meta["num_buckets"] == 4
+    assert _issues(result)[50] == "VALUE_MISMATCH"
+
+
+def test_chunked_inputs(comparator):
+    actual = _frame(range(50), range(50))
+    expected = actual.copy()
+    expected.loc[expected["ID"].isin([3, 31]), "VALUE"] = 0
+
+    result = comparator.compare_by_keys(_chunks(actual, 7), _chunks(expected, 11), ["ID"])
+
+    assert not result.success
+    assert _issues(result) == {3: "VALUE_MISMATCH", 31: "VALUE_MISMATCH"}
+
+
+def test_duplicates_split_across_chunks_are_detected(comparator):
+    actual = _frame([1, 2, 3, 3], [1, 2, 3, 3])
+    expected = _frame([1, 2, 3], [1, 2, 3])
+
+    result = comparator.compare_by_keys(_chunks(actual, 3), expected, ["ID"])
+
+    assert set(result.details["ISSUE_TYPE"]) == {"DUPLICATE_KEY"}
+    assert result.meta["failed_key_count"] == 1
+
+
+def test_int_and_float_keys_land_in_the_same_bucket(tmp_path):
+    comparator = PartitionedComparator(num_buckets=16, spill_dir=str(tmp_path))
+    actual = _frame(pd.array(range(40), dtype="int64"), range(40))
+    # NULL keys turn the expected key column into float64
+    expected = _frame([float(i) for i in range(40)] + [np.nan], list(range(40)) + [0])
+
+    result = comparator.compare_by_keys(actual, expected, ["ID"])
+
+    assert result.meta["missing_in_actual_count"] == 1
+    assert result.meta["missing_in_expected_count"] == 0
+    assert result.meta["mismatched_count"] == 0
+
+
+@pytest.mark.parametrize("empty_side", ["actual", "expected"])
+def test_empty_side(comparator, empty_side):
+    full = _frame(range(10), range(10))
+    empty = full.iloc[0:0]
+    actual, expected = (empty, full) if empty_side == "actual" else (full, empty)
+
+    result = comparator.compare_by_keys(actual, expected, ["ID"])
+
+    missing = "missing_in_actual_count" if empty_side == "actual" else "missing_in_expected_count"
+    assert result.meta[missing] == 10
+    assert not result.success
+
+
+def test_side_without_chunks(comparator):
+    expected = _frame(range(5), range(5))
+
+    result = comparator.compare_by_keys(iter([]), expected, ["ID"])
+
+    assert result.meta["missing_in_actual_count"] == 5
+
+
+def test_missing_key_column_raises(comparator):
+    with pytest.raises(ValueError, match="missing in input chunk"):
+        comparator.compare_by_keys(pd.DataFrame({"OTHER": [1]}), _frame([1], [1]), ["ID"])
+
+
+def test_details_are_written_once(tmp_path):
+    details_dir = tmp_path / "details"
+    comparator = PartitionedComparator(
+        DataComparator(details_dir=str(details_dir)), num_buckets=4, spill_dir=str(tmp_path)
+    )
+    actual = _frame(range(1000), range(1000))
+    expected = actual.copy()
+    expected.loc[:99, "VALUE"] += 1
+
+    result = comparator.compare_by_keys(actual, expected, ["ID"])
+
+    written = sum(len(pd.read_parquet(path)) for path in details_dir.rglob("*.parquet"))
+    assert written == 100
+    assert result.meta["mismatched_count"] == 100
+    assert "partitions_total" not in result.meta
+
+
+def test_spill_directory_is_cleaned_up(comparator, tmp_path):
+    comparator.compare_by_keys(_frame([1], [1]), _frame([1], [1]), ["ID"])
+
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_num_buckets_must_be_positive():
+    with pytest.raises(ValueError, match="num_buckets"):
+        PartitionedComparator(num_buckets=0)
@@ -0,0 +1,115 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from utilities.DataComparator import DataComparator
+from utilities.SortedMergeComparator import SortedMergeComparator
+
+
+def _frame(keys, values=None):
+    return pd.DataFrame({"ID": keys, "VALUE": values if values is not None else [1] * len(keys)})
+
+
+def _chunks(df, size):
+    return [df.iloc[start:start + size] for start in range(0, len(df), size)]
+
+
+def _issues(result):
+    if result.details is None:
+        return {}
+    return dict(zip(result.details["ID"], result.details["ISSUE_TYPE"]))
+
+
+@pytest.fixture
+def comparator():
+    return SortedMergeComparator()
+
+
+@pytest.mark.parametrize("actual_size, expected_size", [(1, 1), (3, 7), (7, 3), (100, 100)])
+def test_chunk_boundaries_match_in_memory_comparison(comparator, actual_size, expected_size):
+    actual = _frame(range(0, 60, 2), np.arange(30))
+    expected = _frame(range(0, 60, 3), np.arange(20))
+
+    result = comparator.compare_by_keys(_chunks(actual, actual_size), _chunks(expected, expected_size), ["ID"])
+    in_memory = DataComparator().compare_by_keys(actual, expected, ["ID"])
+
+    for key in ("missing_in_actual_count", "missing_in_expected_count", "mismatched_count"):
+        assert result.meta[key] == in_memory.meta[key]
+
+
+def test_keys_on_one_side_only(comparator):
+    actual = _frame([1, 2, 4, 6])
+    expected = _frame([2, 3, 4, 5])
+
+    result = comparator.compare_by_keys(_chunks(actual, 2), _chunks(expected, 2), ["ID"])
+
+    assert _issues(result) == {
+        1: "MISSING_IN_EXPECTED", 6: "MISSING_IN_EXPECTED", 3: "MISSING_IN_ACTUAL", 5: "MISSING_IN_ACTUAL",
+    }
+
+
+def test_exhausted_side(comparator):
+    actual = _frame([1, 2])
+    expected = _frame(range(1, 9))
+
+    result = comparator.compare_by_keys(_chunks(actual, 1), _chunks(expected, 3), ["ID"])
+
+    assert result.meta["missing_in_actual_count"] == 6
+    assert result.meta["missing_in_expected_count"] == 0
+
+
+def test_empty_side(comparator):
+    result = comparator.compare_by_keys([], _chunks(_frame([1, 2, 3]), 2), ["ID"])
+
+    assert result.meta["missing_in_actual_count"] == 3
+
+
+def test_composite_keys(comparator):
+    actual = pd.DataFrame({"A": [1, 1, 2, 2], "B": ["x", "y", "x", "y"], "VALUE": [1, 2, 3, 4]})
+    expected = actual.copy()
+    expected.loc[2, "VALUE"] = 30
+
+    result = comparator.compare_by_keys(_chunks(actual, 3), _chunks(expected, 1), ["A", "B"])
+
+    assert result.meta["mismatched_count"] == 1
+    assert result.details[["A", "B"]].values.tolist() == [[2, "x"]]
+
+
+@pytest.mark.parametrize("chunks", [
+    [_frame([1, 3, 2])],
+    [_frame([1, 2, 3]), _frame([2, 4])],
+])
+def test_unsorted_input_raises(comparator, chunks):
+    with pytest.raises(ValueError, match="not sorted"):
+        comparator.compare_by_keys(chunks, [_frame([1, 2, 3, 4])], ["ID"])
+
+
+def test_duplicate_key_across_chunk_boundary(comparator):
+    actual = [_frame([1, 2, 3]), _frame([3, 4])]
+    expected = [_frame([1, 2, 3, 4])]
+
+    result = comparator.compare_by_keys(actual, expected, ["ID"])
+
+    assert _issues(result) == {3: "DUPLICATE_KEY"}
+    assert result.meta["missing_in_expected_count"] == 0
+
+
+def test_duplicate_key_across_chunk_boundary_is_deduped(comparator):
+    actual = [_frame([1, 2, 3]), _frame([3]), _frame([3, 4])]
+    expected = [_frame([1, 2]), _frame([3, 4])]
+
+    result = comparator.compare_by_keys(actual, expected, ["ID"], duplicate_policy="dedupe")
+
+    assert result.success, result.message
+    assert result.meta["duplicate_key_groups_actual"] == 1
+
+
+def test_iter_compare_by_keys_yields_slices_before_the_end(comparator):
+    def actual_chunks():
+        yield _frame([1, 2])
+        yield _frame([3, 4])
+        raise AssertionError("read past the first slices")
+
+    slices = comparator.iter_compare_by_keys(actual_chunks(), [_frame([1, 2]), _frame([3, 4])], ["ID"])
+
+    assert next(slices).success
@@ -0,0 +1,91 @@
+import json
+import re
+from datetime import date, datetime
+from pathlib import Path
+from typing import Any, List, Optional
+
+import numpy as np
+import pandas as pd
+
+from .DataComparator import row_fingerprints
+
+FINGERPRINT_COLUMN = "ROW_FINGERPRINT"
+
+
+class BaselineStore:
+    """
+    Persisted state for incremental validations, one directory per view:
+    - watermark.json: last validated watermark value, its kind (datetime / date / value)
+      and the column it applies to
+    - baseline.parquet: key columns + ROW_FINGERPRINT of every validated row
+
+    The fingerprint baseline is compact (keys + one uint64 per row) and tells whether a
+    re-delivered row actually changed since it was last validated.
+    """
+
+    def __init__(self, base_dir: str):
+        """
+        :param base_dir: Directory holding one sub-directory per view
+        """
+        self.base_dir = Path(base_dir)
+
+    def _view_dir(self, view_name: str) -> Path:
+        return self.base_dir / re.sub(r"[^A-Za-z0-9_.-]", "_", view_name)
+
+    def load_watermark(self, view_name: str) -> Optional[Any]:
+        path = self._view_dir(view_name) / "watermark.json"
+        if not path.exists():
+            return None
+        state = json.loads(path.read_text(encoding="utf-8"))
+        if state.get("kind") in ("datetime", "timestamp"):
+            return pd.Timestamp(state["value"])
+        if state.get("kind") == "date":
+            return date.fromisoformat(state["value"])
+        return state["value"]
+
+    def save_watermark(self, view_name: str, watermark: Any, watermark_column: str):
+        view_dir = self._view_dir(view_name)
+        view_dir.mkdir(parents=True, exist_ok=True)
+        if isinstance(watermark, (datetime, np.datetime64)):
+            state = {"kind": "datetime", "value": pd.Timestamp(watermark).isoformat()}
+        elif isinstance(watermark, date):
+            # DATE columns come back as datetime.date; keep it a date so comparisons stay date vs date
+            state = {"kind": "date", "value": watermark.isoformat()}
+        else:
+            state = {"kind": "value", "value": watermark.item() if hasattr(watermark, "item") else watermark}
+        state["column"] = watermark_column
+        (view_dir / "watermark.json").write_text(json.dumps(state), encoding="utf-8")
+
+    def load_baseline(self, view_name: str) -> Optional[pd.DataFrame]:
+        path = self._view_dir(view_name) / "baseline.parquet"
+        return pd.read_parquet(path) if path.exists() else None
+
+    def fingerprints(self, df: pd.DataFrame, key_columns: List[str], value_columns: List[str]) -> pd.DataFrame:
+        """
+        Keys + ROW_FINGERPRINT of the value columns for a batch of rows.
+        """
+        baseline = df[key_columns].reset_index(drop=True)
+        baseline[FINGERPRINT_COLUMN] = row_fingerprints(df, value_columns)
+        return baseline
+
+    def merge_baseline(self, view_name: str, delta: pd.DataFrame, key_columns: List[str]) -> pd.DataFrame:
+        """
+        Upsert delta fingerprints (keys + ROW_FINGERPRINT) into the stored baseline and persist it.
+        """
+        baseline = self.load_baseline(view_name)
+        if baseline is not None:
+            delta = pd.concat([baseline, delta], ignore_index=True)
+        merged = delta.drop_duplicates(subset=key_columns, keep="last").reset_index(drop=True)
+
+        view_dir = self._view_dir(view_name)
+        view_dir.mkdir(parents=True, exist_ok=True)
+        merged.to_parquet(view_dir / "baseline.parquet", index=False)
+        return merged
+
+    def reset(self, view_name: str):
+        """
+        Forget the watermark and baseline of a view (next run validates it in full).
+        """
+        view_dir = self._view_dir(view_name)
+        for name in ("watermark.json", "baseline.parquet"):
+            (view_dir / name).unlink(missing_ok=True)
@@ -0,0 +1,176 @@
+import asyncio
+import threading
+import time
+from concurrent.futures import Future, InvalidStateError, ThreadPoolExecutor
+from typing import Dict, List, Sequence, Tuple
+
+import pandas as pd
+
+
+class ConcurrentQueryRunner:
+    """
+    Runs many queries at once across MultiDBConnectionManager instances.
+
+    - Snowflake queries are submitted with execute_async and their query ids are
+      polled by one background thread, so a running warehouse query does not hold
+      a worker thread or a connection.
+    - Other backends run execute_query on a bounded thread pool. Pooled managers
+      (use_pool=True) run their queries in parallel; a non-pooled manager owns a
+      single connection, so its queries are serialized.
+
+    Results come back as concurrent.futures.Future objects (submit / run_all) or
+    through asyncio (execute_async / gather).
+    """
+
+    def __init__(self, max_workers: int = 8, poll_interval: float = 0.5, use_snowflake_async: bool = True):
+        """
+        :param max_workers: Size of the thread pool running blocking queries and fetches
+        :param poll_interval: Seconds between Snowflake query-status polls
+        :param use_snowflake_async: Use execute_async + query-id polling for Snowflake
+        """
+        self.executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="query")
+        self.poll_interval = poll_interval
+        self.use_snowflake_async = use_snowflake_async
+
+        self._lock = threading.Lock()
+        self._manager_locks: Dict[int, threading.Lock] = {}
+        self._pending: List[Tuple[object, str, Future]] = []
+        self._poller = None
+        self._poller_stop = False
+        self._shutdown = False
+
+    def submit(self, manager, query: str) -> "Future[pd.DataFrame]":
+        """
+        Start a query and return a Future resolving to its DataFrame.
+        """
+        if self.use_snowflake_async and manager.db_type == 'snowflake':
+            with self._lock:
+                if self._shutdown:
+                    raise RuntimeError("cannot submit queries after shutdown")
+            future: Future = Future()
+            try:
+                query_id = manager.submit_async(query)
+            except Exception as exc:
+                future.set_exception(exc)
+                return future
+            with self._lock:
+                self._pending.append((manager, query_id, future))
+                self._ensure_poller()
+            return future
+
+        return self.executor.submit(self._execute, manager, query)
+
+    def run_all(self, jobs: Sequence[Tuple[object, str]]) -> List[pd.DataFrame]:
+        """
+        Run (manager, query) jobs concurrently and return the DataFrames in job order.
+        The first failing job raises once all jobs have been submitted.
+        """
+        futures = [self.submit(manager, query) for manager, query in jobs]
+        return [future.result() for future in futures]
+
+    async def execute_async(self, manager, query: str) -> pd.DataFrame:
+        """
+        asyncio entry point: await a single query.
+        """
+        return await asyncio.wrap_future(self.submit(manager, query))
+
+    async def gather(self, jobs: Sequence[Tuple[object, str]]) -> List[pd.DataFrame]:
+        """
+        asyncio entry point: await many (manager, query) jobs, results in job order.
+        """
+        return await asyncio.gather(*(self.execute_async(manager, query) for manager, query in jobs))
+
+    def shutdown(self, wait: bool = True):
+        """
+        Stop accepting queries. wait=True first lets the Snowflake queries being polled
+        finish (like ThreadPoolExecutor.shutdown); whatever is still pending afterwards
+        (always, with wait=False) has its future cancelled, so no caller blocks forever.
+        """
+        with self._lock:
+            self._shutdown = True
+            poller = self._poller
+        if wait and poller is not None:
+            poller.join()
+        with self._lock:
+            self._poller_stop = True
+            pending, self._pending = self._pending, []
+        for _, _, future in pending:
+            future.cancel()
+        self.executor.shutdown(wait=wait)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.shutdown()
+
+    def _execute(self, manager, query: str) -> pd.DataFrame:
+        if getattr(manager, 'use_pool', False):
+            return manager.execute_query(query)
+        with self._lock:
+            manager_lock = self._manager_locks.setdefault(id(manager), threading.Lock())
+        with manager_lock:
+            return manager.execute_query(query)
+
+    def _ensure_poller(self):
+        # Called with self._lock held
+        if self._poller is None or not self._poller.is_alive():
+            self._poller_stop = False
+            self._poller = threading.Thread(target=self._poll_loop, name="snowflake-poller", daemon=True)
+            self._poller.start()
+
+    def _poll_loop(self):
+        while True:
+            with self._lock:
+                pending = list(self._pending)
+                if not pending or self._poller_stop:
+                    self._poller = None
+                    return
+
+            finished = []
+            for manager, query_id, future in pending:
+                try:
+                    running = manager.is_query_running(query_id)
+                except Exception as exc:
+                    self._settle(future, exc=exc)
+                    finished.append(query_id)
+                    continue
+                if not running:
+                    # Result download is blocking I/O, hand it to the worker pool
+                    try:
+                        download = self.executor.submit(manager.fetch_query_result, query_id)
+                    except RuntimeError as exc:
+                        # shutdown(wait=False) raced this poll; never leave the future hanging
+                        self._settle(future, exc=exc)
+                    else:
+                        self._chain(download, future)
+                    finished.append(query_id)
+
+            with self._lock:
+                self._pending = [job for job in self._pending if job[1] not in finished]
+            time.sleep(self.poll_interval)
+
+    @staticmethod
+    def _settle(future: Future, result=None, exc=None):
+        # The future may already be cancelled by shutdown()
+        try:
+            if exc is not None:
+                future.set_exception(exc)
+            else:
+                future.set_result(result)
+        except InvalidStateError:
+            pass
+
+    @classmethod
+    def _chain(cls, source: Future, target: Future):
+        def _copy(done: Future):
+            if done.cancelled():
+                target.cancel()
+                return
+            exc = done.exception()
+            if exc is not None:
+                cls._settle(target, exc=exc)
+            else:
+                cls._settle(target, result=done.result())
+
+        source.add_done_callback(_copy)
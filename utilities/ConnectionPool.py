@@ -0,0 +1,236 @@
+import hashlib
+import json
+import threading
+import time
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+
+def config_fingerprint(db_type: str, config: Dict[str, Any]) -> str:
+    """
+    Stable fingerprint of a backend + connection config (used as pool / cache key).
+    """
+    payload = json.dumps({"db_type": db_type.lower(), "config": config}, sort_keys=True, default=str)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+class ConnectionPool:
+    """
+    Thread-safe pool of DB-API connections for one backend/config.
+
+    - min_size connections are kept open, at most max_size exist at once
+    - checkout blocks (up to checkout_timeout seconds) when all connections are in use
+    - idle connections beyond min_size are closed after idle_timeout seconds
+    - a connection idle for longer than liveness_interval is checked with
+      liveness_query before it is handed out again
+    """
+
+    def __init__(
+        self,
+        factory: Callable[[], Any],
+        min_size: int = 0,
+        max_size: int = 5,
+        idle_timeout: float = 300.0,
+        liveness_query: Optional[str] = "SELECT 1",
+        liveness_interval: float = 30.0,
+        checkout_timeout: float = 30.0,
+    ):
+        if max_size < 1 or min_size < 0 or min_size > max_size:
+            raise ValueError("Pool sizes must satisfy 0 <= min_size <= max_size and max_size >= 1")
+        self.factory = factory
+        self.min_size = min_size
+        self.max_size = max_size
+        self.idle_timeout = idle_timeout
+        self.liveness_query = liveness_query
+        self.liveness_interval = liveness_interval
+        self.checkout_timeout = checkout_timeout
+
+        self._lock = threading.Condition()
+        self._idle: List[Tuple[Any, float]] = []
+        self._size = 0
+        self._stats = {
+            "hits": 0,
+            "misses": 0,
+            "waits": 0,
+            "wait_seconds": 0.0,
+            "created": 0,
+            "evicted": 0,
+            "liveness_failures": 0,
+        }
+
+        for _ in range(min_size):
+            self._idle.append((self._create(), time.monotonic()))
+
+    def checkout(self, timeout: Optional[float] = None) -> Any:
+        """
+        Get a live connection from the pool, creating one if the pool is below max_size.
+        """
+        timeout = self.checkout_timeout if timeout is None else timeout
+        deadline = time.monotonic() + timeout
+        waited = False
+
+        while True:
+
+            with self._lock:
+                self._evict_idle()
+                if self._idle:
+                    conn, idle_since = self._idle.pop()
+                    stale = time.monotonic() - idle_since > self.liveness_interval
+                elif self._size < self.max_size:
+                    self._stats["misses"] += 1
+                    self._size += 1
+                    break
+                else:
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        raise TimeoutError(
+                            f"No connection available within {timeout}s (max_size={self.max_size})."
+                        )
+                    if not waited:
+                        self._stats["waits"] += 1
+                        waited = True
+                    started = time.monotonic()
+                    self._lock.wait(remaining)
+                    self._stats["wait_seconds"] += time.monotonic() - started
+                    continue
+
+            # Liveness round-trip outside the lock; the popped connection keeps its slot
+            if stale and not self._is_alive(conn):
+                with self._lock:
+                    self._stats["liveness_failures"] += 1
+                    self._discard(conn)
+                    self._lock.notify()
+                continue
+            with self._lock:
+                self._stats["hits"] += 1
+            return conn
+
+        # Handshake outside the lock; the slot is already reserved
+        try:
+            conn = self.factory()
+        except Exception:
+            with self._lock:
+                self._size -= 1
+                self._lock.notify()
+            raise
+        with self._lock:
+            self._stats["created"] += 1
+        return conn
+
+    def checkin(self, conn: Any, discard: bool = False):
+        """
+        Return a connection to the pool (or close it when discard=True, e.g. after an error).
+        """
+        with self._lock:
+            if discard:
+                self._discard(conn)
+            else:
+                self._idle.append((conn, time.monotonic()))
+            self._lock.notify()
+
+    @contextmanager
+    def connection(self):
+        """
+        Context manager: checkout, yield, checkin (discarding the connection on errors).
+        """
+        conn = self.checkout()
+        discard = False
+        try:
+            yield conn
+        except Exception:
+            discard = True
+            raise
+        finally:
+            # Also runs on GeneratorExit when a streaming consumer stops early
+            self.checkin(conn, discard=discard)
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            stats = dict(self._stats)
+            stats.update({"size": self._size, "idle": len(self._idle)})
+            return stats
+
+    def close_all(self):
+        """
+        Close all idle connections (checked-out ones are closed when returned with discard).
+        """
+        with self._lock:
+            while self._idle:
+                conn, _ = self._idle.pop()
+                self._discard(conn)
+
+    def _create(self) -> Any:
+        conn = self.factory()
+        self._size += 1
+        self._stats["created"] += 1
+        return conn
+
+    def _evict_idle(self):
+        now = time.monotonic()
+        keep = []
+        for conn, idle_since in self._idle:
+            if self._size > self.min_size and now - idle_since > self.idle_timeout:
+                self._stats["evicted"] += 1
+                self._discard(conn)
+            else:
+                keep.append((conn, idle_since))
+        self._idle = keep
+
+    def _discard(self, conn: Any):
+        self._size -= 1
+        try:
+            conn.close()
+        except Exception:
+            pass
+
+    def _is_alive(self, conn: Any) -> bool:
+        if not self.liveness_query:
+            return True
+        try:
+            cursor = conn.cursor()
+            try:
+                cursor.execute(self.liveness_query)
+                cursor.fetchall()
+            finally:
+                cursor.close()
+            return True
+        except Exception:
+            return False
+
+
+_POOLS: Dict[str, ConnectionPool] = {}
+_POOLS_LOCK = threading.Lock()
+
+
+def get_pool(
+    db_type: str,
+    config: Dict[str, Any],
+    factory: Callable[[], Any],
+    **pool_options,
+) -> ConnectionPool:
+    """
+    Process-wide pool for a backend + config fingerprint; created on first use.
+    pool_options only apply when the pool is created.
+    """
+    key = config_fingerprint(db_type, config)
+    with _POOLS_LOCK:
+        pool = _POOLS.get(key)
+        if pool is None:
+            pool = ConnectionPool(factory, **pool_options)
+            _POOLS[key] = pool
+        return pool
+
+
+def pool_stats() -> Dict[str, Dict[str, Any]]:
+    """
+    Stats of every process-wide pool keyed by config fingerprint.
+    """
+    with _POOLS_LOCK:
+        return {key: pool.stats() for key, pool in _POOLS.items()}
+
+
+def close_all_pools():
+    with _POOLS_LOCK:
+        for pool in _POOLS.values():
+            pool.close_all()
+        _POOLS.clear()
@@ -0,0 +1,571 @@
+import threading
+from decimal import Decimal
+from typing import Dict, Type
+
+import pandas as pd
+
+from .DataComparator import FLOAT64_DIGITS, FLOAT64_EXACT_INTEGER, INT64_MAX
+
+# Entry point group third-party packages use to register extra backends:
+#   [project.entry-points."pythonframework.db_backends"]
+#   teradata = "my_package.backends:TeradataBackend"
+ENTRY_POINT_GROUP = "pythonframework.db_backends"
+
+# Rows per executemany round trip when bulk-loading temp tables
+TEMP_LOAD_BATCH_ROWS = 50_000
+
+
+def numeric_scales(description):
+    """
+    {column: (precision, scale)} for the fixed-point columns of a DB-API cursor.description,
+    so Decimal columns can later be converted to int64/float64 without guessing.
+    """
+    scales = {}
+    for desc in description or []:
+        precision, scale = desc[4], desc[5]
+        if precision is not None and scale is not None:
+            scales[desc[0]] = (precision, scale)
+    return scales
+
+
+def timestamp_text(value, digits):
+    """
+    'YYYY-MM-DD HH:MM:SS.fff' of a timestamp truncated to `digits` fractional digits.
+    tz-aware values are converted to UTC and end in ' +00:00'.
+    """
+    ts = pd.Timestamp(value)
+    if ts.tzinfo is not None:
+        ts = ts.tz_convert('UTC')
+    text = ts.strftime('%Y-%m-%d %H:%M:%S')
+    if digits:
+        text += '.' + f"{ts.microsecond:06d}{ts.nanosecond:03d}"[:digits]
+    if ts.tzinfo is not None:
+        text += ' +00:00'
+    return text
+
+
+def frame_from_cursor(cursor):
+    """
+    Build a DataFrame from an executed DB-API cursor (fetchall), recording numeric scales.
+    """
+    df = pd.DataFrame(cursor.fetchall(), columns=[desc[0] for desc in cursor.description])
+    df.attrs["numeric_scales"] = numeric_scales(cursor.description)
+    return df
+
+
+def arrow_decimals_to_numeric(table):
+    """
+    Cast decimal128/256 columns of a pyarrow Table to int64 / float64 in one vectorized
+    pass where that is exact, following the same rule as DataComparator's
+    reconcile_numeric_dtypes:
+    - scale 0 -> int64 if every value fits (and fits float64 when there are nulls, since
+      to_pandas turns nullable int64 into float64)
+    - scale > 0 -> float64 if every value has at most 15 significant digits
+    - otherwise the column stays decimal (Decimal objects in pandas) and is converted
+      exactly later on, using the recorded precision/scale
+    Returns the new table and {column: (precision, scale)} of all decimal columns.
+    """
+    import pyarrow as pa
+    import pyarrow.compute as pc
+
+    scales = {}
+    for i, field in enumerate(table.schema):
+        if not pa.types.is_decimal(field.type):
+            continue
+        precision, scale = field.type.precision, field.type.scale
+        scales[field.name] = (precision, scale)
+        column = table.column(i)
+
+        bounds = pc.min_max(column)
+        largest = max(
+            (abs(value.as_py()) for value in (bounds["min"], bounds["max"]) if value.as_py() is not None),
+            default=Decimal(0),
+        )
+        if scale == 0:
+            limit = FLOAT64_EXACT_INTEGER if column.null_count else INT64_MAX
+            target = pa.int64() if largest <= limit else None
+        else:
+            target = pa.float64() if largest < Decimal(10) ** (FLOAT64_DIGITS - scale) else None
+        if target is None:
+            continue
+        # Exactness is checked above; decimal -> float64 casts need safe=False regardless
+        table = table.set_column(i, field.name, column.cast(target, safe=target == pa.int64()))
+    return table, scales
+
+
+def _arrow_chunk_to_pandas(table):
+    table, scales = arrow_decimals_to_numeric(table)
+    # self_destruct releases each Arrow column once converted; split_blocks is not used
+    # because its zero-copy blocks are read-only (and memory-mapped for lakehouse files)
+    df = table.to_pandas(self_destruct=True)
+    df.attrs["numeric_scales"] = scales
+    return df
+
+
+def _temp_column_type(dtype, db_type):
+    """
+    Column type for a pandas dtype in a temp table DDL (Azure SQL / Oracle).
+    """
+    oracle = db_type == 'oracle'
+    if pd.api.types.is_bool_dtype(dtype):
+        return 'NUMBER(1)' if oracle else 'BIT'
+    if pd.api.types.is_integer_dtype(dtype):
+        return 'NUMBER(19)' if oracle else 'BIGINT'
+    if pd.api.types.is_float_dtype(dtype):
+        return 'BINARY_DOUBLE' if oracle else 'FLOAT'
+    if pd.api.types.is_datetime64_any_dtype(dtype):
+        return 'TIMESTAMP' if oracle else 'DATETIME2'
+    return 'VARCHAR2(4000)' if oracle else 'NVARCHAR(4000)'
+
+
+class DBBackend:
+    """
+    One database type for MultiDBConnectionManager. Drivers are imported inside the
+    methods, so only the backends that are actually used need their driver installed.
+
+    Connection-level methods receive a DB-API connection from the manager (its own or a
+    pooled one). The Arrow methods receive the manager itself, since some Arrow readers
+    (arrow-odbc) open their own connection from the config.
+    """
+
+    name = None
+    liveness_query = 'SELECT 1'
+    supports_arrow = False
+    # Fractional-second digits the backend's timestamp type stores; literals are truncated to it
+    timestamp_digits = 6
+
+    def connect(self, config):
+        raise NotImplementedError
+
+    def timestamp_literal(self, value):
+        """
+        SQL literal for a pd.Timestamp (see SemanticViewDataFetcher.sql_literal).
+        """
+        return f"'{timestamp_text(value, self.timestamp_digits)}'"
+
+    def date_literal(self, value):
+        return f"'{value.isoformat()}'"
+
+    def read_frame(self, conn, query):
+        cursor = conn.cursor()
+        try:
+            cursor.execute(query)
+            return frame_from_cursor(cursor)
+        finally:
+            cursor.close()
+
+    def iter_frames(self, conn, query, chunk_rows):
+        cursor = conn.cursor()
+        try:
+            cursor.execute(query)
+            columns = [desc[0] for desc in cursor.description]
+            scales = numeric_scales(cursor.description)
+            while True:
+                rows = cursor.fetchmany(chunk_rows)
+                if not rows:
+                    break
+                df = pd.DataFrame(rows, columns=columns)
+                df.attrs["numeric_scales"] = scales
+                yield df
+        finally:
+            cursor.close()
+
+    def fetch_columns(self, conn, query):
+        cursor = conn.cursor()
+        try:
+            cursor.execute(query)
+            return [desc[0] for desc in cursor.description]
+        finally:
+            cursor.close()
+
+    def fetch_arrow(self, manager, query):
+        raise ValueError(f"Arrow fetch not supported for DB type: {self.name}")
+
+    def iter_arrow(self, manager, query, chunk_rows):
+        raise ValueError(f"Arrow fetch not supported for DB type: {self.name}")
+
+    def load_temp_table(self, conn, df, table_name):
+        raise ValueError(f"Temp table bulk load not supported for DB type: {self.name}")
+
+    def submit_async(self, conn, query):
+        raise ValueError(f"Asynchronous submission not supported for DB type: {self.name}")
+
+    def is_query_running(self, conn, query_id):
+        raise ValueError(f"Asynchronous submission not supported for DB type: {self.name}")
+
+    def fetch_query_result(self, conn, query_id):
+        raise ValueError(f"Asynchronous submission not supported for DB type: {self.name}")
+
+    def close(self, conn):
+        conn.close()
+
+
+class _ExecutemanyTempTableMixin:
+    """
+    Temp table bulk load through CREATE TABLE + batched executemany (Azure SQL, Oracle).
+    """
+
+    def _temp_table_ddl(self, df, table_name):
+        raise NotImplementedError
+
+    def _prepare_cursor(self, cursor):
+        pass
+
+    def load_temp_table(self, conn, df, table_name):
+        table, create, placeholders = self._temp_table_ddl(df, table_name)
+        insert = f"INSERT INTO {table} ({', '.join(df.columns)}) VALUES ({placeholders})"
+        rows = df.astype(object).where(df.notna(), None)
+        cursor = conn.cursor()
+        try:
+            cursor.execute(create)
+            self._prepare_cursor(cursor)
+            for start in range(0, len(rows), TEMP_LOAD_BATCH_ROWS):
+                batch = rows.iloc[start:start + TEMP_LOAD_BATCH_ROWS]
+                cursor.executemany(insert, list(batch.itertuples(index=False, name=None)))
+            conn.commit()
+        finally:
+            cursor.close()
+        return table
+
+
+class AzureSQLBackend(_ExecutemanyTempTableMixin, DBBackend):
+    name = 'azure_sql'
+    supports_arrow = True
+    timestamp_digits = 7
+
+    def timestamp_literal(self, value):
+        # DATETIME only takes 3 fractional digits in a string; DATETIME2(7) takes all 7
+        target = 'DATETIMEOFFSET(7)' if value.tzinfo is not None else 'DATETIME2(7)'
+        return f"CAST('{timestamp_text(value, self.timestamp_digits)}' AS {target})"
+
+    def date_literal(self, value):
+        return f"CAST('{value.isoformat()}' AS DATE)"
+
+    def connect(self, config):
+        import pyodbc
+
+        return pyodbc.connect(config.get('connection_string'))
+
+    def read_frame(self, conn, query):
+        return pd.read_sql(query, conn)
+
+    def iter_frames(self, conn, query, chunk_rows):
+        yield from pd.read_sql(query, conn, chunksize=chunk_rows)
+
+    def fetch_arrow(self, manager, query):
+        import pyarrow as pa
+        from arrow_odbc import read_arrow_batches_from_odbc
+
+        reader = read_arrow_batches_from_odbc(
+            query=query,
+            connection_string=manager.config.get('connection_string'),
+            batch_size=manager.config.get('arrow_batch_size', 100_000),
+        )
+        return pa.Table.from_batches(list(reader), schema=reader.schema)
+
+    def iter_arrow(self, manager, query, chunk_rows):
+        import pyarrow as pa
+        from arrow_odbc import read_arrow_batches_from_odbc
+
+        reader = read_arrow_batches_from_odbc(
+            query=query,
+            connection_string=manager.config.get('connection_string'),
+            batch_size=chunk_rows,
+        )
+        for batch in reader:
+            yield pa.Table.from_batches([batch])
+
+    def _temp_table_ddl(self, df, table_name):
+        table = f"#{table_name}"
+        columns = ", ".join(f"{col} {_temp_column_type(dtype, self.name)}" for col, dtype in df.dtypes.items())
+        placeholders = ", ".join("?" for _ in df.columns)
+        return table, f"CREATE TABLE {table} ({columns})", placeholders
+
+    def _prepare_cursor(self, cursor):
+        cursor.fast_executemany = True
+
+
+class SnowflakeBackend(DBBackend):
+    name = 'snowflake'
+    supports_arrow = True
+    timestamp_digits = 9
+
+    def timestamp_literal(self, value):
+        target = 'TIMESTAMP_TZ(9)' if value.tzinfo is not None else 'TIMESTAMP_NTZ(9)'
+        return f"CAST('{timestamp_text(value, self.timestamp_digits)}' AS {target})"
+
+    def date_literal(self, value):
+        return f"DATE '{value.isoformat()}'"
+
+    def connect(self, config):
+        import snowflake.connector
+
+        return snowflake.connector.connect(
+            user=config.get('user'),
+            password=config.get('password'),
+            account=config.get('account'),
+            warehouse=config.get('warehouse'),
+            database=config.get('database'),
+            schema=config.get('schema')
+        )
+
+    def fetch_arrow(self, manager, query):
+        with manager.connection() as conn:
+            cursor = conn.cursor()
+            try:
+                cursor.execute(query)
+                return cursor.fetch_arrow_all(force_return_table=True)
+            finally:
+                cursor.close()
+
+    def iter_arrow(self, manager, query, chunk_rows):
+        with manager.connection() as conn:
+            cursor = conn.cursor()
+            try:
+                cursor.execute(query)
+                # Batch sizes are decided by the server (one per result chunk)
+                yield from cursor.fetch_arrow_batches()
+            finally:
+                cursor.close()
+
+    def load_temp_table(self, conn, df, table_name):
+        from snowflake.connector.pandas_tools import write_pandas
+
+        write_pandas(
+            conn,
+            df,
+            table_name,
+            auto_create_table=True,
+            table_type='temporary',
+            quote_identifiers=False,
+        )
+        return table_name
+
+    def submit_async(self, conn, query):
+        cursor = conn.cursor()
+        try:
+            cursor.execute_async(query)
+            return cursor.sfqid
+        finally:
+            cursor.close()
+
+    def is_query_running(self, conn, query_id):
+        status = conn.get_query_status_throw_if_error(query_id)
+        return conn.is_still_running(status)
+
+    def fetch_query_result(self, conn, query_id):
+        cursor = conn.cursor()
+        try:
+            cursor.get_results_from_sfqid(query_id)
+            return frame_from_cursor(cursor)
+        finally:
+            cursor.close()
+
+
+class DatabricksBackend(DBBackend):
+    name = 'databricks'
+    supports_arrow = True
+
+    def timestamp_literal(self, value):
+        return f"TIMESTAMP '{timestamp_text(value, self.timestamp_digits)}'"
+
+    def date_literal(self, value):
+        return f"DATE '{value.isoformat()}'"
+
+    def connect(self, config):
+        from databricks import sql as databricks_sql
+
+        return databricks_sql.connect(
+            server_hostname=config.get('server_hostname'),
+            http_path=config.get('http_path'),
+            access_token=config.get('access_token')
+        )
+
+    def fetch_arrow(self, manager, query):
+        with manager.connection() as conn:
+            cursor = conn.cursor()
+            try:
+                cursor.execute(query)
+                return cursor.fetchall_arrow()
+            finally:
+                cursor.close()
+
+    def iter_arrow(self, manager, query, chunk_rows):
+        with manager.connection() as conn:
+            cursor = conn.cursor()
+            try:
+                cursor.execute(query)
+                while True:
+                    table = cursor.fetchmany_arrow(chunk_rows)
+                    if table.num_rows == 0:
+                        break
+                    yield table
+            finally:
+                cursor.close()
+
+
+def _oracle_driver():
+    """
+    python-oracledb (cx_Oracle's successor, same DB-API) when installed, else cx_Oracle.
+    """
+    try:
+        import oracledb
+        return oracledb
+    except ImportError:
+        import cx_Oracle
+        return cx_Oracle
+
+
+class OracleBackend(_ExecutemanyTempTableMixin, DBBackend):
+    name = 'oracle'
+    liveness_query = 'SELECT 1 FROM DUAL'
+    timestamp_digits = 9
+
+    def timestamp_literal(self, value):
+        # ANSI literal / explicit mask, so the session's NLS formats do not matter
+        text = timestamp_text(value, self.timestamp_digits)
+        if value.tzinfo is not None:
+            return f"TO_TIMESTAMP_TZ('{text}', 'YYYY-MM-DD HH24:MI:SS.FF9 TZH:TZM')"
+        return f"TIMESTAMP '{text}'"
+
+    def date_literal(self, value):
+        return f"DATE '{value.isoformat()}'"
+
+    @property
+    def supports_arrow(self):
+        # Only python-oracledb connections fetch Arrow data (fetch_df_all); with cx_Oracle
+        # the Arrow path would merely convert the pandas result
+        try:
+            return hasattr(_oracle_driver().Connection, 'fetch_df_all')
+        except ImportError:
+            return False
+
+    def connect(self, config):
+        driver = _oracle_driver()
+
+        dsn = driver.makedsn(
+            config.get('host'), config.get('port'), service_name=config.get('service_name')
+        )
+        return driver.connect(
+            user=config.get('user'),
+            password=config.get('password'),
+            dsn=dsn
+        )
+
+    def read_frame(self, conn, query):
+        return pd.read_sql(query, conn)
+
+    def iter_frames(self, conn, query, chunk_rows):
+        yield from pd.read_sql(query, conn, chunksize=chunk_rows)
+
+    def fetch_arrow(self, manager, query):
+        import pyarrow as pa
+
+        with manager.connection() as conn:
+            if hasattr(conn, 'fetch_df_all'):
+                # python-oracledb >= 2.4 exposes an Arrow-backed data frame
+                return pa.table(conn.fetch_df_all(statement=query))
+            return pa.Table.from_pandas(pd.read_sql(query, conn), preserve_index=False)
+
+    def iter_arrow(self, manager, query, chunk_rows):
+        import pyarrow as pa
+
+        with manager.connection() as conn:
+            if hasattr(conn, 'fetch_df_batches'):
+                for odf in conn.fetch_df_batches(statement=query, size=chunk_rows):
+                    yield pa.table(odf)
+            else:
+                for df in pd.read_sql(query, conn, chunksize=chunk_rows):
+                    yield pa.Table.from_pandas(df, preserve_index=False)
+
+    def _temp_table_ddl(self, df, table_name):
+        table = f"ORA$PTT_{table_name}"
+        columns = ", ".join(f"{col} {_temp_column_type(dtype, self.name)}" for col, dtype in df.dtypes.items())
+        placeholders = ", ".join(f":{i + 1}" for i in range(len(df.columns)))
+        return table, f"CREATE PRIVATE TEMPORARY TABLE {table} ({columns}) ON COMMIT PRESERVE DEFINITION", placeholders
+
+
+class LakehouseBackend(DBBackend):
+    """
+    Local Parquet / Delta tables read with pyarrow.dataset (see utilities.LakehouseReader).
+    config: path (root directory), tables ({name: directory}, optional),
+    partitioning (default 'hive'), memory_map (default True).
+    """
+
+    name = 'lakehouse'
+    liveness_query = None
+    supports_arrow = True
+
+    def connect(self, config):
+        from .LakehouseReader import LakehouseConnection
+
+        return LakehouseConnection(config)
+
+    def read_frame(self, conn, query):
+        return _arrow_chunk_to_pandas(conn.query_arrow(query))
+
+    def iter_frames(self, conn, query, chunk_rows):
+        for table in conn.iter_arrow(query, chunk_rows):
+            yield _arrow_chunk_to_pandas(table)
+
+    def fetch_columns(self, conn, query):
+        return conn.columns(query)
+
+    def fetch_arrow(self, manager, query):
+        with manager.connection() as conn:
+            return conn.query_arrow(query)
+
+    def iter_arrow(self, manager, query, chunk_rows):
+        with manager.connection() as conn:
+            yield from conn.iter_arrow(query, chunk_rows)
+
+
+_BACKENDS: Dict[str, Type[DBBackend]] = {
+    backend.name: backend
+    for backend in (AzureSQLBackend, SnowflakeBackend, DatabricksBackend, OracleBackend, LakehouseBackend)
+}
+_ENTRY_POINTS_LOADED = False
+_REGISTRY_LOCK = threading.Lock()
+
+
+def register_backend(name: str, backend: Type[DBBackend]):
+    """
+    Register (or replace) the backend class used for db_type == name.
+    """
+    with _REGISTRY_LOCK:
+        _BACKENDS[name.lower()] = backend
+
+
+def _load_entry_points():
+    global _ENTRY_POINTS_LOADED
+    from importlib.metadata import entry_points
+
+    try:
+        found = entry_points(group=ENTRY_POINT_GROUP)
+    except TypeError:
+        # Python < 3.10: entry_points() returns a dict of groups
+        found = entry_points().get(ENTRY_POINT_GROUP, [])
+    for entry_point in found:
+        _BACKENDS.setdefault(entry_point.name.lower(), entry_point.load())
+    _ENTRY_POINTS_LOADED = True
+
+
+def get_backend(db_type: str) -> DBBackend:
+    """
+    Backend instance for a db_type; entry point backends are loaded on the first unknown name.
+    """
+    key = db_type.lower()
+    with _REGISTRY_LOCK:
+        if key not in _BACKENDS and not _ENTRY_POINTS_LOADED:
+            _load_entry_points()
+        backend = _BACKENDS.get(key)
+    if backend is None:
+        raise ValueError(f"Unsupported DB type: {db_type}")
+    return backend()
+
+
+def available_backends():
+    with _REGISTRY_LOCK:
+        if not _ENTRY_POINTS_LOADED:
+            _load_entry_points()
+        return sorted(_BACKENDS)
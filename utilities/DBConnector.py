@@ -1,75 +1,213 @@
-import pyodbc
-import snowflake.connector
-from databricks import sql as databricks_sql
-import cx_Oracle
 import pandas as pd
+import uuid
+from contextlib import contextmanager
+
+from .ConnectionPool import config_fingerprint, get_pool
+# frame_from_cursor / numeric_scales / arrow_decimals_to_numeric are re-exported for
+# existing imports from this module
+from .DBBackends import (
+    _arrow_chunk_to_pandas,
+    arrow_decimals_to_numeric,
+    frame_from_cursor,
+    get_backend,
+    numeric_scales,
+)
+
+
+def rebatch_by_bytes(chunks, chunk_bytes):
+    """
+    Re-batch a stream of DataFrames or pyarrow Tables into chunks of roughly chunk_bytes:
+    small chunks are coalesced, large ones are sliced.
+    """
+    pending, pending_bytes = [], 0
+    for chunk in chunks:
+        is_frame = isinstance(chunk, pd.DataFrame)
+        rows = len(chunk)
+        if rows == 0:
+            continue
+        size = int(chunk.memory_usage(index=False).sum()) if is_frame else chunk.nbytes
+        rows_per_chunk = max(1, int(rows * chunk_bytes / max(size, 1)))
+
+        for start in range(0, rows, rows_per_chunk):
+            piece = chunk.iloc[start:start + rows_per_chunk] if is_frame else chunk.slice(start, rows_per_chunk)
+            pending.append(piece)
+            pending_bytes += size * len(piece) / rows
+            if pending_bytes >= chunk_bytes:
+                yield _concat_chunks(pending)
+                pending, pending_bytes = [], 0
+    if pending:
+        yield _concat_chunks(pending)
+
+
+def _concat_chunks(pieces):
+    if len(pieces) == 1:
+        return pieces[0]
+    if isinstance(pieces[0], pd.DataFrame):
+        df = pd.concat(pieces, ignore_index=True)
+        df.attrs = dict(pieces[0].attrs)
+        return df
+    import pyarrow as pa
+
+    return pa.concat_tables(pieces)
+
 
 class MultiDBConnectionManager:
-    def __init__(self, db_type, config):
+    def __init__(self, db_type, config, use_arrow=False, use_pool=False, pool_options=None):
+        """
+        :param db_type: Name of a registered backend (see utilities.DBBackends: azure_sql,
+            snowflake, databricks, oracle, lakehouse, or one added via register_backend /
+            entry points). The backend's driver is only imported when it is first used.
+        :param use_arrow: Fetch results through the columnar Arrow path (execute_query_arrow)
+            and convert to pandas from there instead of building frames from Python tuples.
+        :param use_pool: Run queries on connections from the process-wide pool shared by all
+            managers with the same backend and config (see utilities.ConnectionPool).
+        :param pool_options: ConnectionPool options (min_size, max_size, idle_timeout, ...)
+            used when the shared pool is first created.
+        """
         self.db_type = db_type.lower()
         self.config = config
+        self.backend = get_backend(self.db_type)
+        self.use_arrow = use_arrow
+        self.use_pool = use_pool
+        self.pool_options = pool_options or {}
+        self.pool = None
         self.conn = None
 
     def connect(self):
-        if self.db_type == 'azure_sql':
-            conn_str = self.config.get('connection_string')
-            self.conn = pyodbc.connect(conn_str)
-        elif self.db_type == 'snowflake':
-            self.conn = snowflake.connector.connect(
-                user=self.config.get('user'),
-                password=self.config.get('password'),
-                account=self.config.get('account'),
-                warehouse=self.config.get('warehouse'),
-                database=self.config.get('database'),
-                schema=self.config.get('schema')
-            )
-        elif self.db_type == 'databricks':
-            self.conn = databricks_sql.connect(
-                server_hostname=self.config.get('server_hostname'),
-                http_path=self.config.get('http_path'),
-                access_token=self.config.get('access_token')
-            )
-        elif self.db_type == 'oracle':
-            dsn = cx_Oracle.makedsn(
-                self.config.get('host'), self.config.get('port'), service_name=self.config.get('service_name')
-            )
-            self.conn = cx_Oracle.connect(
-                user=self.config.get('user'),
-                password=self.config.get('password'),
-                dsn=dsn
-            )
-        elif self.db_type == 'lakehouse':
-            # Connect using appropriate connector or API (e.g., Databricks Lakehouse)
-            pass
+        if self.use_pool:
+            # Pooled managers check connections out per query instead of holding one
+            return
+        self.conn = self._create_connection()
+
+    def _create_connection(self):
+        return self.backend.connect(self.config)
+
+    @property
+    def fingerprint(self):
+        return config_fingerprint(self.db_type, self.config)
+
+    @property
+    def max_concurrency(self):
+        """
+        Number of statements this manager can run at once: the shared pool's max_size
+        when use_pool=True, otherwise 1 (the manager's own connection).
+        """
+        return self._get_pool().max_size if self.use_pool else 1
+
+    def _get_pool(self):
+        if self.pool is None:
+            options = dict(self.pool_options)
+            options.setdefault('liveness_query', self.backend.liveness_query)
+            self.pool = get_pool(self.db_type, self.config, self._create_connection, **options)
+        return self.pool
+
+    @contextmanager
+    def connection(self):
+        """
+        Connection to run one statement on: a pooled connection (checked out for the
+        duration of the block) when use_pool=True, otherwise the manager's own connection.
+        """
+        if self.use_pool:
+            with self._get_pool().connection() as conn:
+                yield conn
         else:
-            raise ValueError(f"Unsupported DB type: {self.db_type}")
+            if not self.conn:
+                self.connect()
+            yield self.conn
 
     def execute_query(self, query):
-        if not self.conn:
-            self.connect()
-        if self.db_type in ['azure_sql', 'oracle']:
-            return pd.read_sql(query, self.conn)
-        elif self.db_type == 'snowflake':
-            cursor = self.conn.cursor()
-            cursor.execute(query)
-            df = pd.DataFrame(cursor.fetchall(), columns=[col[0] for col in cursor.description])
-            cursor.close()
-            return df
-        elif self.db_type == 'databricks':
-            cursor = self.conn.cursor()
-            cursor.execute(query)
-            rows = cursor.fetchall()
-            columns = [desc[0] for desc in cursor.description]
-            cursor.close()
-            return pd.DataFrame(rows, columns=columns)
+        if self.use_arrow and self.backend.supports_arrow:
+            return _arrow_chunk_to_pandas(self.execute_query_arrow(query))
+        with self.connection() as conn:
+            return self.backend.read_frame(conn, query)
+
+    def query_with_temp_table(self, df, queries, table_name=None):
+        """
+        Bulk-load df into a session temporary table, run queries against it on the same
+        connection and drop the table again. Each query is a format string in which
+        {table} is replaced by the temp table name. Returns one DataFrame per query.
+
+        Loaders: Snowflake write_pandas, Azure SQL fast_executemany into a #temp table,
+        Oracle array binds into a private temporary table (18c+).
+        """
+        table_name = table_name or f"VALIDATION_{uuid.uuid4().hex[:8].upper()}"
+        with self.connection() as conn:
+            table = self.backend.load_temp_table(conn, df, table_name)
+            try:
+                return [self.backend.read_frame(conn, query.format(table=table)) for query in queries]
+            finally:
+                cursor = conn.cursor()
+                try:
+                    cursor.execute(f"DROP TABLE {table}")
+                except Exception:
+                    pass
+                finally:
+                    cursor.close()
+
+    def fetch_columns(self, query):
+        """
+        Column names of a query's result from cursor.description, without fetching rows.
+        Meant for zero-row queries (e.g. WHERE 1 = 0) used for schema checks.
+        """
+        with self.connection() as conn:
+            return self.backend.fetch_columns(conn, query)
+
+    def submit_async(self, query):
+        """
+        Snowflake only: start a query without waiting for it (execute_async) and return its query id.
+        """
+        with self.connection() as conn:
+            return self.backend.submit_async(conn, query)
+
+    def is_query_running(self, query_id):
+        """
+        Snowflake only: poll an asynchronous query; raises if the query failed.
+        """
+        with self.connection() as conn:
+            return self.backend.is_query_running(conn, query_id)
+
+    def fetch_query_result(self, query_id):
+        """
+        Snowflake only: fetch the result of a finished asynchronous query as a DataFrame.
+        """
+        with self.connection() as conn:
+            return self.backend.fetch_query_result(conn, query_id)
+
+    def execute_query_iter(self, query, chunk_rows=100_000, chunk_bytes=None, as_arrow=False):
+        """
+        Execute a query and yield the result in chunks instead of one materialized frame.
+
+        :param chunk_rows: Rows fetched per round trip (fetchmany / read_sql chunksize / batch size)
+        :param chunk_bytes: If set, re-batch the stream into chunks of roughly this many bytes
+        :param as_arrow: Yield pyarrow Tables instead of pandas DataFrames
+        """
+        if as_arrow or self.use_arrow:
+            chunks = self.backend.iter_arrow(self, query, chunk_rows)
+            if not as_arrow:
+                chunks = (_arrow_chunk_to_pandas(table) for table in chunks)
         else:
-            # Implement other DB query executions
-            pass
+            chunks = self._iter_frames(query, chunk_rows)
+
+        if chunk_bytes:
+            chunks = rebatch_by_bytes(chunks, chunk_bytes)
+        yield from chunks
+
+    def _iter_frames(self, query, chunk_rows):
+        with self.connection() as conn:
+            yield from self.backend.iter_frames(conn, query, chunk_rows)
+
+    def execute_query_arrow(self, query):
+        """
+        Execute a query and return the result as a pyarrow Table without going through
+        per-cell Python objects:
+        - Snowflake: fetch_arrow_all
+        - Databricks: fetchall_arrow
+        - Azure SQL: arrow-odbc batch reader on the configured connection string
+        - Oracle: python-oracledb fetch_df_all when available, else read_sql + from_pandas
+        """
+        return self.backend.fetch_arrow(self, query)
 
     def close(self):
         if self.conn:
-            if self.db_type in ['snowflake', 'databricks']:
-                self.conn.close()
-            else:
-                self.conn.close()
+            self.backend.close(self.conn)
             self.conn = None
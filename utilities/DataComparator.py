@@ -1,6 +1,472 @@
-from typing import List, Dict, Any, Optional, Tuple
+import time
+from decimal import Decimal, InvalidOperation
+from typing import List, Dict, Any, Optional, Tuple, Union
+import numpy as np
 import pandas as pd
 
+from .MismatchCollector import MismatchCollector
+
+
+def row_fingerprints(df: pd.DataFrame, columns: List[str]) -> np.ndarray:
+    """
+    Hash each row of the given columns into a single 64-bit fingerprint.
+    Rows with equal values (and equal dtypes) always get equal fingerprints.
+    """
+    if not columns:
+        return np.zeros(len(df), dtype="uint64")
+    return pd.util.hash_pandas_object(df[columns], index=False).to_numpy()
+
+
+# String form of null keys in canonical_key_strings (cannot clash with real key values)
+NULL_KEY = "\x00NULL"
+
+
+def _canonical_key(value: Any) -> str:
+    if value is None or (not isinstance(value, str) and pd.isna(value)):
+        return NULL_KEY
+    if isinstance(value, (bool, np.bool_)):
+        return str(bool(value))
+    if isinstance(value, (int, np.integer)):
+        return str(int(value))
+    if isinstance(value, Decimal):
+        if not value.is_finite():
+            return repr(float(value))
+        return str(int(value)) if value == value.to_integral_value() else repr(float(value))
+    if isinstance(value, (float, np.floating)):
+        value = float(value)
+        return str(int(value)) if value.is_integer() else repr(value)
+    return str(value)
+
+
+def canonical_key_strings(values: pd.Series) -> pd.Series:
+    """
+    dtype-independent string form of a key column: keys that compare equal in a merge
+    render equally, e.g. 1, 1.0 and Decimal("1") -> "1". Used to hash or index keys
+    coming from sources with different key dtypes (int vs float with nulls vs NUMBER).
+    """
+    if isinstance(values.dtype, np.dtype) and values.dtype.kind in "iub":
+        return values.astype(str)
+    return values.map(_canonical_key).astype(str)
+
+
+# Largest integer magnitude float64 holds exactly, and decimal digits that survive a round trip
+FLOAT64_EXACT_INTEGER = 2 ** 53
+FLOAT64_DIGITS = 15
+INT64_MAX = 2 ** 63 - 1
+# Largest scale used for the scaled int64 representation (10**18 still fits in int64)
+MAX_INT64_SCALE = 18
+# dtype_reconciled note of numeric columns that had to stay Decimal/object
+KEPT_EXACT = "kept exact (tolerance not applied)"
+
+
+def reconcile_numeric_dtypes(
+    actual: pd.DataFrame,
+    expected: pd.DataFrame,
+    columns: List[str],
+) -> Tuple[pd.DataFrame, pd.DataFrame, Dict[str, str], Dict[str, int]]:
+    """
+    Convert object columns holding only Decimal/Python numbers (e.g. Snowflake/Oracle NUMBER
+    fetched via fetchall) into int64/float64 vectors and align both sides of every column
+    to one numeric dtype, without losing precision:
+    - int64 when every value is integral at a common scale: value * 10**scale, with the
+      scale from df.attrs["numeric_scales"] (recorded by MultiDBConnectionManager) or from
+      the values; fixed-point NUMBER(38, s) columns stay exact this way
+    - else float64 when every value fits it exactly (<= 15 significant digits)
+    - else float64 anyway if the other side is a float column (its precision is the limit)
+    - else the Decimal objects are kept and compared exactly, noted as KEPT_EXACT
+    Pass value columns only - key columns are joined on their original values.
+    Returns the (possibly new) frames, {column: "<actual dtype>/<expected dtype> -> dtype"}
+    and {column: scale} of the columns converted to scaled int64 (scale > 0).
+    """
+    actual_scales = actual.attrs.get("numeric_scales", {})
+    expected_scales = expected.attrs.get("numeric_scales", {})
+    actual_updates: Dict[str, pd.Series] = {}
+    expected_updates: Dict[str, pd.Series] = {}
+    conversions: Dict[str, str] = {}
+    scales: Dict[str, int] = {}
+
+    for col in columns:
+        if col not in actual.columns or col not in expected.columns:
+            continue
+        actual_col, expected_col = actual[col], expected[col]
+        actual_objects, expected_objects = _numeric_objects(actual_col), _numeric_objects(expected_col)
+        if actual_objects is None and expected_objects is None:
+            continue
+        if not (
+            (actual_objects is not None or _is_plain_numeric(actual_col))
+            and (expected_objects is not None or _is_plain_numeric(expected_col))
+        ):
+            continue
+        label = f"{actual_col.dtype}/{expected_col.dtype} -> "
+
+        converted = _to_common_scaled_int64(
+            actual_col, expected_col, actual_scales.get(col), expected_scales.get(col)
+        )
+        if converted is not None:
+            actual_updates[col], expected_updates[col], scale = converted
+            conversions[col] = label + ("int64/int64" if not scale else f"int64/int64 (x10**{scale})")
+            if scale:
+                scales[col] = scale
+            continue
+
+        actual_float, expected_float = _to_float64(actual_col), _to_float64(expected_col)
+        if actual_float is None and expected_col.dtype.kind == "f":
+            actual_float = _to_float64(actual_col, exact=False)
+        if expected_float is None and actual_col.dtype.kind == "f":
+            expected_float = _to_float64(expected_col, exact=False)
+        if actual_float is not None and expected_float is not None:
+            actual_updates[col], expected_updates[col] = actual_float, expected_float
+            conversions[col] = label + "float64/float64"
+            continue
+
+        conversions[col] = label + KEPT_EXACT
+
+    if actual_updates:
+        actual = actual.assign(**actual_updates)
+        expected = expected.assign(**expected_updates)
+    return actual, expected, conversions, scales
+
+
+def _is_plain_numeric(series: pd.Series) -> bool:
+    return pd.api.types.is_numeric_dtype(series) and not pd.api.types.is_bool_dtype(series)
+
+
+def _float64_exact(series: pd.Series) -> bool:
+    """
+    True if every value of a numeric column is represented exactly as float64.
+    """
+    if series.dtype.kind not in "iu":
+        return True
+    present = series.dropna()
+    return present.empty or (
+        int(present.min()) >= -FLOAT64_EXACT_INTEGER and int(present.max()) <= FLOAT64_EXACT_INTEGER
+    )
+
+
+def _value_fits_float64(value: Any) -> bool:
+    if isinstance(value, Decimal):
+        return not value.is_finite() or len(value.as_tuple().digits) <= FLOAT64_DIGITS
+    if isinstance(value, (int, np.integer)):
+        return abs(int(value)) <= FLOAT64_EXACT_INTEGER
+    return True
+
+
+def _numeric_objects(series: pd.Series) -> Optional[np.ndarray]:
+    """
+    Values of an object column holding only Decimal/Python numbers (and nulls), or None if
+    the column is not such a column. Mixed content (e.g. numbers and strings) stays object.
+    """
+    if series.dtype != object or series.empty:
+        return None
+    values = series.to_numpy()
+    present = values[~pd.isna(values)]
+    if not len(present) or not all(
+        isinstance(value, (Decimal, int, float, np.number)) and not isinstance(value, (bool, np.bool_))
+        for value in present
+    ):
+        return None
+    return values
+
+
+def _scaled_int(value: Any, scale: int) -> Optional[int]:
+    """
+    value * 10**scale as an exact int, or None if it is not integral at that scale.
+    """
+    if isinstance(value, (int, np.integer)):
+        return int(value) * 10 ** scale
+    value = Decimal(value) if isinstance(value, (float, np.floating)) else value
+    sign, digits, exponent = value.as_tuple()
+    if not isinstance(exponent, int):
+        # NaN / Infinity
+        return None
+    coefficient = int("".join(map(str, digits)) or "0")
+    shift = exponent + scale
+    if shift >= 0:
+        result = coefficient * 10 ** shift
+    else:
+        result, remainder = divmod(coefficient, 10 ** -shift)
+        if remainder:
+            return None
+    return -result if sign else result
+
+
+def _value_scale(value: Any) -> int:
+    if isinstance(value, Decimal) and value.is_finite():
+        return max(0, -value.as_tuple().exponent)
+    if isinstance(value, (float, np.floating)) and np.isfinite(value):
+        return max(0, -Decimal(float(value)).as_tuple().exponent)
+    return 0
+
+
+def _to_scaled_int64(series: pd.Series, precision_scale: Optional[Tuple[int, int]]) -> Optional[Tuple[np.ndarray, int]]:
+    """
+    (int64 values, scale) with value = int / 10**scale for an integer column or an object
+    column of numbers without nulls, or None if that cannot be done exactly.
+    """
+    if isinstance(series.dtype, np.dtype) and series.dtype.kind in "iu":
+        if series.dtype.kind == "u" and len(series) and int(series.max()) > INT64_MAX:
+            return None
+        return series.to_numpy().astype(np.int64), 0
+
+    values = _numeric_objects(series)
+    if values is None or pd.isna(values).any():
+        return None
+    if precision_scale is not None:
+        scale = max(int(precision_scale[1]), 0)
+    else:
+        scale = max(_value_scale(value) for value in values)
+    if scale > MAX_INT64_SCALE:
+        return None
+
+    scaled = []
+    for value in values:
+        number = _scaled_int(value, scale)
+        if number is None or abs(number) > INT64_MAX:
+            return None
+        scaled.append(number)
+    return np.array(scaled, dtype=np.int64), scale
+
+
+def _to_common_scaled_int64(
+    actual_col: pd.Series,
+    expected_col: pd.Series,
+    actual_precision_scale: Optional[Tuple[int, int]],
+    expected_precision_scale: Optional[Tuple[int, int]],
+) -> Optional[Tuple[pd.Series, pd.Series, int]]:
+    """
+    Both columns as int64 at one common scale, or None if either side cannot be.
+    """
+    actual_scaled = _to_scaled_int64(actual_col, actual_precision_scale)
+    expected_scaled = _to_scaled_int64(expected_col, expected_precision_scale)
+    if actual_scaled is None or expected_scaled is None:
+        return None
+
+    scale = max(actual_scaled[1], expected_scaled[1])
+    columns = []
+    for (values, own_scale), source in ((actual_scaled, actual_col), (expected_scaled, expected_col)):
+        factor = 10 ** (scale - own_scale)
+        if factor > 1 and len(values) and int(np.abs(values).max()) > INT64_MAX // factor:
+            return None
+        columns.append(pd.Series(values * factor, index=source.index, name=source.name))
+    return columns[0], columns[1], scale
+
+
+def _to_float64(series: pd.Series, exact: bool = True) -> Optional[pd.Series]:
+    """
+    float64 version of a numeric (or numeric object) column, or None if it is not numeric
+    or - with exact=True - some value would lose precision.
+    """
+    if series.dtype != object:
+        if not _is_plain_numeric(series) or (exact and not _float64_exact(series)):
+            return None
+        return pd.Series(
+            series.to_numpy(dtype=np.float64, na_value=np.nan), index=series.index, name=series.name
+        )
+
+    values = _numeric_objects(series)
+    if values is None:
+        return None
+    nulls = pd.isna(values)
+    if exact and not all(_value_fits_float64(value) for value in values[~nulls]):
+        return None
+    try:
+        return pd.Series(
+            np.where(nulls, np.nan, values).astype(np.float64), index=series.index, name=series.name
+        )
+    except (TypeError, ValueError, OverflowError, InvalidOperation):
+        return None
+
+
+# meta written by _compare_budgeted that describes one call and must not be summed
+_PER_CALL_META = ("partitions_compared", "partitions_total", "elapsed_seconds")
+
+DUPLICATE_POLICIES = ("fail", "dedupe", "aggregate")
+ENGINES = ("pandas", "duckdb")
+
+
+def find_duplicate_keys(df: pd.DataFrame, key_columns: List[str]) -> pd.DataFrame:
+    """
+    Return one row per duplicated key with its DUPLICATE_COUNT (empty if keys are unique).
+    """
+    mask = df.duplicated(subset=key_columns, keep=False).to_numpy()
+    if not mask.any():
+        return pd.DataFrame(columns=key_columns + ["DUPLICATE_COUNT"])
+    return (
+        df.loc[mask, key_columns]
+        .groupby(key_columns, dropna=False, sort=False)
+        .size()
+        .reset_index(name="DUPLICATE_COUNT")
+    )
+
+
+def _aggregate_duplicates(df: pd.DataFrame, key_columns: List[str]) -> pd.DataFrame:
+    """
+    Collapse duplicate keys: numeric columns are summed, others keep the first value.
+    A group whose values are all null sums to null (min_count=1), not 0.
+    Only the duplicated rows go through the groupby.
+    """
+    mask = df.duplicated(subset=key_columns, keep=False).to_numpy()
+    value_columns = [col for col in df.columns if col not in key_columns]
+    sum_columns = [
+        col for col in value_columns
+        if pd.api.types.is_numeric_dtype(df[col]) and not pd.api.types.is_bool_dtype(df[col])
+    ]
+    first_columns = [col for col in value_columns if col not in sum_columns]
+    grouped = df[mask].groupby(key_columns, dropna=False, sort=False)
+    aggregated = pd.concat(
+        [grouped[sum_columns].sum(min_count=1), grouped[first_columns].first()], axis=1
+    ).reset_index()
+    return pd.concat([df[~mask], aggregated[list(df.columns)]], ignore_index=True)
+
+
+KEY_CODE_COLUMN = "_KEY_CODE"
+ACTUAL_ROW_COLUMN = "_ROW_actual"
+EXPECTED_ROW_COLUMN = "_ROW_expected"
+
+
+def encode_composite_keys(
+    actual: pd.DataFrame,
+    expected: pd.DataFrame,
+    key_columns: List[str],
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Factorize (composite) key columns of both frames into a single int64 code space,
+    so equal keys get equal codes on both sides. Nulls are encoded as their own value,
+    matching how pandas merges null keys.
+    """
+    codes = np.zeros(len(actual) + len(expected), dtype=np.int64)
+    cardinality = 1
+
+    for col in key_columns:
+        values = pd.concat([actual[col], expected[col]], ignore_index=True)
+        col_codes, uniques = pd.factorize(values, use_na_sentinel=False)
+        col_cardinality = max(len(uniques), 1)
+
+        if cardinality * col_cardinality >= 2 ** 62:
+            # Re-densify so the mixed-radix code cannot overflow int64
+            codes, dense_uniques = pd.factorize(codes)
+            cardinality = max(len(dense_uniques), 1)
+
+        codes = codes * col_cardinality + col_codes
+        cardinality *= col_cardinality
+
+    return codes[:len(actual)], codes[len(actual):]
+
+
+def _partition_positions(partition_ids: np.ndarray, num_partitions: int) -> List[np.ndarray]:
+    """
+    Row positions of each partition, from one stable argsort of the partition ids.
+    """
+    order = np.argsort(partition_ids, kind="stable")
+    bounds = np.searchsorted(partition_ids[order], np.arange(num_partitions + 1))
+    return [order[bounds[i]:bounds[i + 1]] for i in range(num_partitions)]
+
+
+def _decode_keys(
+    df: pd.DataFrame,
+    row_column: str,
+    source: pd.DataFrame,
+    key_columns: List[str],
+) -> pd.DataFrame:
+    """
+    Swap a row-position column back for the original key values of the source frame.
+    """
+    rows = df[row_column].to_numpy().astype(np.int64)
+    keys = source[key_columns].iloc[rows].reset_index(drop=True)
+    rest = df.drop(columns=[row_column]).reset_index(drop=True)
+    return pd.concat([keys, rest], axis=1)
+
+
+def _block_dtype(actual_col: pd.Series, expected_col: pd.Series) -> Any:
+    """
+    Common NumPy dtype used to compare an actual/expected column pair.
+    """
+    actual_dtype, expected_dtype = actual_col.dtype, expected_col.dtype
+    if isinstance(actual_dtype, np.dtype) and actual_dtype == expected_dtype and actual_dtype.kind in "biufmM":
+        return actual_dtype
+    if (
+        pd.api.types.is_numeric_dtype(actual_dtype)
+        and pd.api.types.is_numeric_dtype(expected_dtype)
+        and not pd.api.types.is_bool_dtype(actual_dtype)
+        and not pd.api.types.is_bool_dtype(expected_dtype)
+    ):
+        # Mixed or nullable numeric dtypes are compared as float64 with NaN for nulls
+        return np.dtype("float64")
+    return np.dtype("object")
+
+
+def _to_block(df: pd.DataFrame, columns: List[str], dtype: np.dtype) -> np.ndarray:
+    """
+    Stack the given columns into one 2-D array of the block dtype.
+    """
+    if dtype.kind == "f":
+        return df[columns].to_numpy(dtype=dtype, na_value=np.nan)
+    return df[columns].to_numpy(dtype=dtype)
+
+
+def _scale_factors(scales: Optional[Dict[str, int]], columns: List[str]) -> np.ndarray:
+    """
+    10**scale per column for columns stored as scaled int64 (1.0 for the others).
+    """
+    scales = scales or {}
+    return np.array([10.0 ** scales.get(col, 0) for col in columns])
+
+
+def _tolerance_vector(tolerance: Union[float, Dict[str, float]], columns: List[str]) -> np.ndarray:
+    """
+    Per-column tolerance array from a scalar or a {column: tolerance} dict.
+    """
+    if isinstance(tolerance, dict):
+        return np.array([float(tolerance.get(col, 0.0)) for col in columns])
+    return np.full(len(columns), float(tolerance))
+
+
+def _mismatch_mask(
+    actual: np.ndarray,
+    expected: np.ndarray,
+    atol: np.ndarray,
+    rtol: np.ndarray,
+) -> np.ndarray:
+    """
+    2-D mismatch mask for one block. Nulls on both sides compare equal.
+    """
+    kind = actual.dtype.kind
+
+    if kind in "iuf":
+        if kind == "f":
+            actual_null, expected_null = np.isnan(actual), np.isnan(expected)
+        else:
+            actual_null = expected_null = np.zeros(actual.shape, dtype=bool)
+
+        if not atol.any() and not rtol.any():
+            mask = actual != expected
+        else:
+            actual_f = actual.astype(np.float64, copy=False)
+            expected_f = expected.astype(np.float64, copy=False)
+            with np.errstate(invalid="ignore"):
+                mask = np.abs(actual_f - expected_f) > atol + rtol * np.abs(expected_f)
+                # Tolerances do not apply to infinities (0 * inf is nan); inf == inf is not a mismatch
+                mask |= np.isinf(actual_f) | np.isinf(expected_f)
+                mask &= actual_f != expected_f
+        mask &= ~(actual_null & expected_null)
+        mask |= actual_null ^ expected_null
+        return mask
+
+    if kind in "mM":
+        actual_null, expected_null = np.isnat(actual), np.isnat(expected)
+        return (actual != expected) & ~(actual_null & expected_null)
+
+    if kind != "O":
+        return np.asarray(actual != expected, dtype=bool)
+
+    # Nulls first: pd.NA (string/boolean extension dtypes) has no truth value
+    actual_null, expected_null = pd.isna(actual), pd.isna(expected)
+    mask = actual_null ^ expected_null
+    present = ~(actual_null | expected_null)
+    if present.any():
+        mask[present] = np.asarray(actual[present] != expected[present], dtype=bool)
+    return mask
+
 
 class DataComparisonResult:
     """
@@ -19,6 +485,131 @@ class DataComparisonResult:
         self.meta = meta or {}
 
 
+def _build_result(
+    missing_in_actual: pd.DataFrame,
+    missing_in_expected: pd.DataFrame,
+    mismatched_df: pd.DataFrame,
+    details_meta: Dict[str, Any],
+    key_columns: List[str],
+) -> DataComparisonResult:
+    """
+    Assemble the compare_by_keys result from the key frames of missing rows and the
+    long-form mismatch table. meta["failed_key_count"] is the exact number of distinct
+    keys with any issue, independent of how many detail rows are kept.
+    """
+    if missing_in_actual.empty and missing_in_expected.empty and mismatched_df.empty:
+        return DataComparisonResult(
+            success=True,
+            message="Data matches for all key and value columns.",
+            meta=details_meta,
+        )
+
+    # Build a details object for reporting
+    details_meta.update({
+        "missing_in_actual_count": len(missing_in_actual),
+        "missing_in_expected_count": len(missing_in_expected),
+        "mismatched_count": len(mismatched_df),
+        # Missing keys are distinct and disjoint from keys present on both sides
+        "failed_key_count": len(missing_in_actual) + len(missing_in_expected) + (
+            int((~mismatched_df.duplicated(subset=key_columns)).sum()) if not mismatched_df.empty else 0
+        ),
+        "mismatched_count_by_column": (
+            {col: int(count) for col, count in mismatched_df["COLUMN_NAME"].value_counts(sort=False).items()}
+            if not mismatched_df.empty else {}
+        ),
+    })
+
+    # Optionally store a combined details DataFrame (can be large, so keep optional)
+    details_df_list = []
+
+    if not missing_in_actual.empty:
+        tmp = missing_in_actual.copy()
+        tmp["ISSUE_TYPE"] = "MISSING_IN_ACTUAL"
+        details_df_list.append(tmp)
+
+    if not missing_in_expected.empty:
+        tmp = missing_in_expected.copy()
+        tmp["ISSUE_TYPE"] = "MISSING_IN_EXPECTED"
+        details_df_list.append(tmp)
+
+    if not mismatched_df.empty:
+        tmp = mismatched_df.copy()
+        tmp["ISSUE_TYPE"] = "VALUE_MISMATCH"
+        details_df_list.append(tmp)
+
+    combined_details_df = (
+        pd.concat(details_df_list, ignore_index=True) if details_df_list else None
+    )
+
+    return DataComparisonResult(
+        success=False,
+        message="Data mismatch detected. "
+                f"Missing in actual={len(missing_in_actual)}, "
+                f"Missing in expected={len(missing_in_expected)}, "
+                f"Value mismatches={len(mismatched_df)}.",
+        details=combined_details_df,
+        meta=details_meta,
+    )
+
+
+def _quote_identifier(name: str) -> str:
+    return '"' + str(name).replace('"', '""') + '"'
+
+
+def _dtype_family(series: pd.Series) -> Optional[str]:
+    """
+    Coarse value family of a column (numeric, bool, string, datetime, date, timedelta or
+    mixed), or None if it holds only nulls. DuckDB casts implicitly between families
+    (1 vs '1' would match), so only columns of one family are compared in SQL.
+    """
+    dtype = series.dtype
+    if pd.api.types.is_bool_dtype(dtype):
+        return "bool"
+    if pd.api.types.is_numeric_dtype(dtype):
+        return "numeric"
+    if pd.api.types.is_datetime64_any_dtype(dtype):
+        return "datetime"
+    if pd.api.types.is_timedelta64_dtype(dtype):
+        return "timedelta"
+    if dtype != object and pd.api.types.is_string_dtype(dtype):
+        return "string"
+    inferred = pd.api.types.infer_dtype(series, skipna=True)
+    if inferred == "empty":
+        return None
+    return {
+        "string": "string",
+        "integer": "numeric",
+        "floating": "numeric",
+        "mixed-integer-float": "numeric",
+        "decimal": "numeric",
+        "boolean": "bool",
+        "datetime": "datetime",
+        "datetime64": "datetime",
+        "date": "date",
+        "timedelta": "timedelta",
+    }.get(inferred, "mixed")
+
+
+def _duckdb_joinable_keys(actual: pd.DataFrame, expected: pd.DataFrame, key_columns: List[str]) -> bool:
+    """
+    True if DuckDB joins the key columns exactly like pandas would. Raises the pandas
+    merge error for key columns pandas refuses to join (e.g. int64 vs str).
+    """
+    joinable = True
+    for col in key_columns:
+        families = {_dtype_family(actual[col]), _dtype_family(expected[col])} - {None}
+        if "mixed" in families:
+            joinable = False
+        elif len(families) > 1:
+            if families != {"bool", "numeric"}:
+                raise ValueError(
+                    f"You are trying to merge on {actual[col].dtype} and {expected[col].dtype} "
+                    f"columns for key '{col}'. If you wish to proceed you should use pd.concat"
+                )
+            joinable = False
+    return joinable
+
+
 class DataComparator:
     """
     Utility class to compare two pandas DataFrames for semantic view validations.
@@ -28,6 +619,50 @@ class DataComparator:
     - Key-based row-level comparison using outer join + indicator
     """
 
+    def __init__(
+        self,
+        use_fingerprint: bool = False,
+        encode_keys: bool = False,
+        budget_partitions: int = 16,
+        max_detail_rows: Optional[int] = None,
+        details_dir: Optional[str] = None,
+        engine: str = "pandas",
+        duckdb_threads: Optional[int] = None,
+    ):
+        """
+        :param use_fingerprint: Join only keys and per-row value fingerprints first and run
+            column-level diffing just for keys whose fingerprints differ (or are missing).
+        :param encode_keys: Factorize (composite) key columns into one shared int64 code
+            before joining; original key values are only decoded for reported rows.
+        :param budget_partitions: Number of key partitions used when compare_by_keys runs
+            with max_mismatches / time_budget or with bounded details.
+        :param max_detail_rows: Keep at most this many example detail rows per issue type
+            in result.details (reservoir sample); counts in meta stay exact.
+        :param details_dir: Stream the full detail rows to partitioned Parquet under this directory.
+        :param engine: "pandas" (default) or "duckdb" - run the key join, missing detection and
+            tolerance checks as one multi-threaded SQL plan in an embedded DuckDB.
+        :param duckdb_threads: DuckDB worker threads (defaults to all cores).
+        """
+        if engine not in ENGINES:
+            raise ValueError(f"Unsupported engine '{engine}'. Use one of {ENGINES}.")
+        self.use_fingerprint = use_fingerprint
+        self.encode_keys = encode_keys
+        self.budget_partitions = budget_partitions
+        self.max_detail_rows = max_detail_rows
+        self.details_dir = details_dir
+        self.engine = engine
+        self.duckdb_threads = duckdb_threads
+
+    def create_collector(self) -> MismatchCollector:
+        """
+        Collector for detail rows honouring max_detail_rows / details_dir.
+        """
+        return MismatchCollector(sample_size=self.max_detail_rows, details_dir=self.details_dir)
+
+    @property
+    def bounds_details(self) -> bool:
+        return self.max_detail_rows is not None or self.details_dir is not None
+
     def compare_row_count(
         self,
         actual: pd.DataFrame,
@@ -37,8 +672,17 @@ class DataComparator:
         """
         Compare row counts with an allowed difference (tolerance).
         """
-        actual_count = len(actual)
-        expected_count = len(expected)
+        return self.compare_counts(len(actual), len(expected), tolerance=tolerance)
+
+    def compare_counts(
+        self,
+        actual_count: int,
+        expected_count: int,
+        tolerance: int = 0,
+    ) -> DataComparisonResult:
+        """
+        Compare two already computed row counts (e.g. from a pushed-down COUNT query).
+        """
         diff = abs(actual_count - expected_count)
 
         if diff <= tolerance:
@@ -130,7 +774,11 @@ class DataComparator:
         expected: pd.DataFrame,
         key_columns: List[str],
         value_columns: Optional[List[str]] = None,
-        numeric_tolerance: float = 0.0,
+        numeric_tolerance: Union[float, Dict[str, float]] = 0.0,
+        relative_tolerance: Union[float, Dict[str, float]] = 0.0,
+        duplicate_policy: str = "fail",
+        max_mismatches: Optional[int] = None,
+        time_budget: Optional[float] = None,
     ) -> DataComparisonResult:
         """
         Compare two DataFrames by joining on key columns and checking value columns.
@@ -138,7 +786,59 @@ class DataComparator:
         - Missing in actual
         - Missing in expected
         - Mismatched values for common keys
+
+        Nulls on both sides are treated as equal. Numeric values match when
+        |actual - expected| <= numeric_tolerance + relative_tolerance * |expected|;
+        both tolerances can be given per column as a dict (missing columns -> 0).
+        Value mismatches are reported long-form: keys, COLUMN_NAME, ACTUAL_VALUE, EXPECTED_VALUE.
+
+        Keys are checked for uniqueness on both sides before the merge, since duplicate
+        keys would make the outer join explode into a cartesian product. duplicate_policy:
+        - "fail": return a failed result with the duplicate key groups (ISSUE_TYPE=DUPLICATE_KEY)
+        - "dedupe": keep the first row per key and compare
+        - "aggregate": sum numeric value columns (first value otherwise) per key and compare
+
+        Fail-fast mode: with max_mismatches (total issues) and/or time_budget (seconds) the
+        data is compared in key partitions and the comparison stops after the first partition
+        that exceeds the budget. The partial result has meta["truncated"] = True.
+        With max_detail_rows / details_dir the comparison also runs in key partitions, each
+        partition's details going straight into the collector.
+        """
+        return self._compare_by_keys(
+            actual,
+            expected,
+            key_columns,
+            value_columns,
+            numeric_tolerance,
+            relative_tolerance,
+            duplicate_policy,
+            max_mismatches=max_mismatches,
+            time_budget=time_budget,
+            bound_details=self.bounds_details,
+        )
+
+    def _compare_by_keys(
+        self,
+        actual: pd.DataFrame,
+        expected: pd.DataFrame,
+        key_columns: List[str],
+        value_columns: Optional[List[str]],
+        numeric_tolerance: Union[float, Dict[str, float]],
+        relative_tolerance: Union[float, Dict[str, float]],
+        duplicate_policy: str,
+        max_mismatches: Optional[int] = None,
+        time_budget: Optional[float] = None,
+        bound_details: bool = False,
+    ) -> DataComparisonResult:
         """
+        compare_by_keys body. With bound_details=False the full details are returned and
+        nothing goes to a collector, so callers that compare slice by slice (partitioned,
+        sorted merge) can fold every slice into their own collector exactly once.
+        """
+        if duplicate_policy not in DUPLICATE_POLICIES:
+            raise ValueError(
+                f"Unsupported duplicate_policy '{duplicate_policy}'. Use one of {DUPLICATE_POLICIES}."
+            )
 
         # Ensure keys exist
         for col in key_columns:
@@ -161,12 +861,129 @@ class DataComparator:
             ) - set(key_columns)
             value_columns = sorted(list(common_cols))
 
+        details_meta: Dict[str, Any] = {}
+
+        # Decimal/object numerics -> int64/float64, both sides aligned per column
+        actual, expected, conversions, scales = reconcile_numeric_dtypes(
+            actual, expected, [col for col in value_columns if col not in key_columns]
+        )
+        if conversions:
+            details_meta["dtype_reconciled"] = conversions
+            # Decimal columns that could not be vectorized are compared exactly
+            exact_columns = [col for col, note in conversions.items() if note.endswith(KEPT_EXACT)]
+            skipped = [
+                col for col in exact_columns
+                if _tolerance_vector(numeric_tolerance, [col])[0] or _tolerance_vector(relative_tolerance, [col])[0]
+            ]
+            if skipped:
+                details_meta["tolerance_not_applied"] = skipped
+
+        # Guard against cartesian explosion before the expensive merge starts
+        actual_duplicates = find_duplicate_keys(actual, key_columns)
+        expected_duplicates = find_duplicate_keys(expected, key_columns)
+        if not actual_duplicates.empty or not expected_duplicates.empty:
+            details_meta["duplicate_key_groups_actual"] = len(actual_duplicates)
+            details_meta["duplicate_key_groups_expected"] = len(expected_duplicates)
+
+            if duplicate_policy == "fail":
+                actual_duplicates["SIDE"] = "ACTUAL"
+                expected_duplicates["SIDE"] = "EXPECTED"
+                duplicates_df = pd.concat([actual_duplicates, expected_duplicates], ignore_index=True)
+                duplicates_df["ISSUE_TYPE"] = "DUPLICATE_KEY"
+                details_meta["failed_key_count"] = len(duplicates_df[key_columns].drop_duplicates())
+                return DataComparisonResult(
+                    success=False,
+                    message="Duplicate keys detected; comparison not run. "
+                            f"Duplicate key groups in actual={len(actual_duplicates)}, "
+                            f"in expected={len(expected_duplicates)}.",
+                    details=duplicates_df,
+                    meta=details_meta,
+                )
+
+            if duplicate_policy == "dedupe":
+                if not actual_duplicates.empty:
+                    actual = actual.drop_duplicates(subset=key_columns, keep="first")
+                if not expected_duplicates.empty:
+                    expected = expected.drop_duplicates(subset=key_columns, keep="first")
+            else:
+                if not actual_duplicates.empty:
+                    actual = _aggregate_duplicates(actual, key_columns)
+                if not expected_duplicates.empty:
+                    expected = _aggregate_duplicates(expected, key_columns)
+
+        # Bounded details also go partition by partition, so the full mismatch table and
+        # the combined details frame are never materialized at once
+        if max_mismatches is not None or time_budget is not None or bound_details:
+            return self._compare_budgeted(
+                actual,
+                expected,
+                key_columns,
+                value_columns,
+                numeric_tolerance,
+                relative_tolerance,
+                details_meta,
+                max_mismatches=max_mismatches,
+                time_budget=time_budget,
+                scales=scales,
+            )
+
+        return self._compare_unique_keys(
+            actual,
+            expected,
+            key_columns,
+            value_columns,
+            numeric_tolerance,
+            relative_tolerance,
+            details_meta,
+            scales=scales,
+        )
+
+    def _compare_unique_keys(
+        self,
+        actual: pd.DataFrame,
+        expected: pd.DataFrame,
+        key_columns: List[str],
+        value_columns: List[str],
+        numeric_tolerance: Union[float, Dict[str, float]],
+        relative_tolerance: Union[float, Dict[str, float]],
+        details_meta: Dict[str, Any],
+        scales: Optional[Dict[str, int]] = None,
+    ) -> DataComparisonResult:
+        """
+        Merge + diff step of compare_by_keys once keys are known to be unique.
+        scales: {column: scale} of value columns holding value * 10**scale as int64.
+        """
+        details_meta = dict(details_meta)
+        if self.engine == "duckdb" and _duckdb_joinable_keys(actual, expected, key_columns):
+            return self._compare_unique_keys_duckdb(
+                actual,
+                expected,
+                key_columns,
+                value_columns,
+                numeric_tolerance,
+                relative_tolerance,
+                details_meta,
+                scales=scales,
+            )
+
+        source_actual, source_expected = actual, expected
+        join_keys = key_columns
+        if self.encode_keys:
+            actual, expected = self._encode_keys(actual, expected, key_columns, value_columns)
+            join_keys = [KEY_CODE_COLUMN]
+
+        if self.use_fingerprint:
+            actual, expected, identical_count = self._drop_identical_rows(
+                actual, expected, join_keys, value_columns
+            )
+            details_meta["fingerprint_identical_count"] = identical_count
+
         # Suffixes for merged columns
         suffixes = ("_actual", "_expected")
 
         merged = actual.merge(
             expected,
-            on=key_columns,
+            on=join_keys,
             how="outer",
             indicator=True,
             suffixes=suffixes,
@@ -176,76 +993,425 @@ class DataComparator:
         missing_in_actual = merged[merged["_merge"] == "right_only"]
         missing_in_expected = merged[merged["_merge"] == "left_only"]
 
-        mismatched_rows = []
-
         # Only check rows present in both
-        both = merged[merged["_merge"] == "both"].copy()
+        both = merged[merged["_merge"] == "both"]
+
+        mismatched_df = self._find_value_mismatches(
+            both,
+            join_keys + [ACTUAL_ROW_COLUMN] if self.encode_keys else join_keys,
+            value_columns,
+            numeric_tolerance=numeric_tolerance,
+            relative_tolerance=relative_tolerance,
+            suffixes=suffixes,
+            scales=scales,
+        )
+
+        if self.encode_keys:
+            missing_in_actual = _decode_keys(
+                missing_in_actual[[EXPECTED_ROW_COLUMN]], EXPECTED_ROW_COLUMN, source_expected, key_columns
+            )
+            missing_in_expected = _decode_keys(
+                missing_in_expected[[ACTUAL_ROW_COLUMN]], ACTUAL_ROW_COLUMN, source_actual, key_columns
+            )
+            if not mismatched_df.empty:
+                mismatched_df = _decode_keys(
+                    mismatched_df.drop(columns=[KEY_CODE_COLUMN]), ACTUAL_ROW_COLUMN, source_actual, key_columns
+                )
+        else:
+            missing_in_actual = missing_in_actual[key_columns]
+            missing_in_expected = missing_in_expected[key_columns]
 
-        for col in value_columns:
-            col_actual = f"{col}{suffixes[0]}"
-            col_expected = f"{col}{suffixes[1]}"
+        return _build_result(missing_in_actual, missing_in_expected, mismatched_df, details_meta, key_columns)
+
+    def _compare_unique_keys_duckdb(
+        self,
+        actual: pd.DataFrame,
+        expected: pd.DataFrame,
+        key_columns: List[str],
+        value_columns: List[str],
+        numeric_tolerance: Union[float, Dict[str, float]],
+        relative_tolerance: Union[float, Dict[str, float]],
+        details_meta: Dict[str, Any],
+        scales: Optional[Dict[str, int]] = None,
+    ) -> DataComparisonResult:
+        """
+        DuckDB engine: both frames are registered zero-copy in an in-memory DuckDB and a
+        single full outer join returns only the row positions of missing keys and of
+        rows with at least one out-of-tolerance column. Those few rows are then run
+        through the regular mismatch kernel, so the result shape is unchanged.
+
+        Columns DuckDB cannot compare exactly (different value families, object numerics)
+        flag every row that is not null on both sides, leaving the decision to the kernel.
+        Keys of mixed types are joined by the pandas engine instead.
+        """
+        import duckdb
 
-            if col_actual not in both.columns or col_expected not in both.columns:
-                continue
+        columns = [col for col in value_columns if col in actual.columns and col in expected.columns]
+        atol = _tolerance_vector(numeric_tolerance, columns) * _scale_factors(scales, columns)
+        rtol = _tolerance_vector(relative_tolerance, columns)
 
-            if pd.api.types.is_numeric_dtype(both[col_actual]) and pd.api.types.is_numeric_dtype(
-                both[col_expected]
+        flags = []
+        for col, col_atol, col_rtol in zip(columns, atol, rtol):
+            a_col, e_col = f"a.{_quote_identifier(col)}", f"e.{_quote_identifier(col)}"
+            actual_family, expected_family = _dtype_family(actual[col]), _dtype_family(expected[col])
+            if _is_plain_numeric(actual[col]) and _is_plain_numeric(expected[col]):
+                if col_atol or col_rtol:
+                    # Subtract as DOUBLE (like the pandas kernel): BIGINT a - e overflows past 2**63
+                    a_num, e_num = f"CAST({a_col} AS DOUBLE)", f"CAST({e_col} AS DOUBLE)"
+                    differs = (
+                        f"{a_col} <> {e_col} AND (isinf({a_num}) OR isinf({e_num}) OR "
+                        f"abs({a_num} - {e_num}) > {float(col_atol)!r} + {float(col_rtol)!r} * abs({e_num}))"
+                    )
+                else:
+                    differs = f"{a_col} <> {e_col}"
+                flags.append(
+                    f"(CASE WHEN {a_col} IS NULL AND {e_col} IS NULL THEN FALSE "
+                    f"WHEN {a_col} IS NULL OR {e_col} IS NULL THEN TRUE "
+                    f"ELSE {differs} END)"
+                )
+            elif actual_family == expected_family != "mixed" and (
+                actual_family == "string" or actual[col].dtype == expected[col].dtype != object
             ):
-                diff_series = (both[col_actual] - both[col_expected]).abs()
-                mask = diff_series > numeric_tolerance
+                flags.append(f"({a_col} IS DISTINCT FROM {e_col})")
             else:
-                mask = both[col_actual] != both[col_expected]
+                flags.append(f"NOT ({a_col} IS NULL AND {e_col} IS NULL)")
+
+        join_condition = " AND ".join(
+            f"a.{_quote_identifier(col)} IS NOT DISTINCT FROM e.{_quote_identifier(col)}"
+            for col in key_columns
+        )
+        any_mismatch = " OR ".join(flags) if flags else "FALSE"
+        # Row positions from row_number() over the original frames (a streaming window
+        # that keeps scan order), so neither frame is copied to add a position column
+        selected = ", ".join(_quote_identifier(col) for col in dict.fromkeys(key_columns + columns))
+        query = (
+            f"WITH a AS (SELECT {selected}, row_number() OVER () - 1 AS {ACTUAL_ROW_COLUMN} FROM actual_df), "
+            f"e AS (SELECT {selected}, row_number() OVER () - 1 AS {EXPECTED_ROW_COLUMN} FROM expected_df) "
+            f"SELECT a.{ACTUAL_ROW_COLUMN}, e.{EXPECTED_ROW_COLUMN} "
+            f"FROM a FULL OUTER JOIN e ON {join_condition} "
+            f"WHERE a.{ACTUAL_ROW_COLUMN} IS NULL OR e.{EXPECTED_ROW_COLUMN} IS NULL OR {any_mismatch}"
+        )
+
+        con = duckdb.connect()
+        try:
+            if self.duckdb_threads:
+                con.execute(f"SET threads TO {int(self.duckdb_threads)}")
+            con.register("actual_df", actual)
+            con.register("expected_df", expected)
+            positions = con.execute(query).df()
+        finally:
+            con.close()
 
-            if mask.any():
-                diff_df = both.loc[mask, key_columns + [col_actual, col_expected]].copy()
-                diff_df["COLUMN_NAME"] = col
-                mismatched_rows.append(diff_df)
+        actual_rows = positions[ACTUAL_ROW_COLUMN]
+        expected_rows = positions[EXPECTED_ROW_COLUMN]
+        in_both = actual_rows.notna() & expected_rows.notna()
 
-        mismatched_df = (
-            pd.concat(mismatched_rows, ignore_index=True) if mismatched_rows else pd.DataFrame()
+        missing_in_actual = _decode_keys(
+            positions.loc[actual_rows.isna(), [EXPECTED_ROW_COLUMN]], EXPECTED_ROW_COLUMN, expected, key_columns
+        )
+        missing_in_expected = _decode_keys(
+            positions.loc[expected_rows.isna(), [ACTUAL_ROW_COLUMN]], ACTUAL_ROW_COLUMN, actual, key_columns
         )
 
-        if missing_in_actual.empty and missing_in_expected.empty and mismatched_df.empty:
-            return DataComparisonResult(
-                success=True,
-                message="Data matches for all key and value columns.",
+        # Rebuild a small merged-style frame for the candidate rows only
+        both_actual_rows = actual_rows[in_both].to_numpy().astype(np.int64)
+        both_expected_rows = expected_rows[in_both].to_numpy().astype(np.int64)
+        both = actual[key_columns].iloc[both_actual_rows].reset_index(drop=True)
+        for col in columns:
+            both[f"{col}_actual"] = actual[col].iloc[both_actual_rows].to_numpy()
+            both[f"{col}_expected"] = expected[col].iloc[both_expected_rows].to_numpy()
+
+        mismatched_df = self._find_value_mismatches(
+            both,
+            key_columns,
+            columns,
+            numeric_tolerance=numeric_tolerance,
+            relative_tolerance=relative_tolerance,
+            scales=scales,
+        )
+        details_meta["engine"] = "duckdb"
+
+        return _build_result(missing_in_actual, missing_in_expected, mismatched_df, details_meta, key_columns)
+
+    def _compare_budgeted(
+        self,
+        actual: pd.DataFrame,
+        expected: pd.DataFrame,
+        key_columns: List[str],
+        value_columns: List[str],
+        numeric_tolerance: Union[float, Dict[str, float]],
+        relative_tolerance: Union[float, Dict[str, float]],
+        details_meta: Dict[str, Any],
+        max_mismatches: Optional[int] = None,
+        time_budget: Optional[float] = None,
+        scales: Optional[Dict[str, int]] = None,
+    ) -> DataComparisonResult:
+        """
+        Compare key partition by key partition and stop at the first partition that
+        exceeds max_mismatches or time_budget (if given).
+        """
+        started = time.monotonic()
+        num_partitions = max(int(self.budget_partitions), 1)
+
+        # Shared key codes put equal keys of both sides into the same partition
+        actual_codes, expected_codes = encode_composite_keys(actual, expected, key_columns)
+        actual_parts = _partition_positions(actual_codes % num_partitions, num_partitions)
+        expected_parts = _partition_positions(expected_codes % num_partitions, num_partitions)
+
+        results = []
+        collector = self.create_collector()
+        issues = 0
+        truncated = False
+        for partition in range(num_partitions):
+            result = self._compare_unique_keys(
+                actual.iloc[actual_parts[partition]],
+                expected.iloc[expected_parts[partition]],
+                key_columns,
+                value_columns,
+                numeric_tolerance,
+                relative_tolerance,
+                {},
+                scales=scales,
+            )
+            # Fold details into the collector as we go so only a bounded sample stays in memory
+            collector.add(result.details)
+            result.details = None
+            results.append(result)
+            issues += (
+                result.meta.get("missing_in_actual_count", 0)
+                + result.meta.get("missing_in_expected_count", 0)
+                + result.meta.get("mismatched_count", 0)
             )
 
-        # Build a details object for reporting
-        details_meta: Dict[str, Any] = {
-            "missing_in_actual_count": len(missing_in_actual),
-            "missing_in_expected_count": len(missing_in_expected),
-            "mismatched_count": len(mismatched_df),
-        }
+            over_mismatches = max_mismatches is not None and issues > max_mismatches
+            over_time = time_budget is not None and time.monotonic() - started > time_budget
+            if (over_mismatches or over_time) and partition < num_partitions - 1:
+                truncated = True
+                break
 
-        # Optionally store a combined details DataFrame (can be large, so keep optional)
-        details_df_list = []
+        merged = self.merge_results(results, collector)
+        merged.meta.update(details_meta)
+        merged.meta.update({
+            "truncated": truncated,
+            "partitions_compared": len(results),
+            "partitions_total": num_partitions,
+            "elapsed_seconds": round(time.monotonic() - started, 3),
+        })
+        if truncated:
+            merged.message = (
+                f"Comparison stopped early after {len(results)}/{num_partitions} partitions "
+                f"(max_mismatches={max_mismatches}, time_budget={time_budget}). " + merged.message
+            )
+        return merged
+
+    def _encode_keys(
+        self,
+        actual: pd.DataFrame,
+        expected: pd.DataFrame,
+        key_columns: List[str],
+        value_columns: List[str],
+    ) -> Tuple[pd.DataFrame, pd.DataFrame]:
+        """
+        Replace the key columns of both sides by one shared int64 key code and keep
+        each row's original position so keys can be decoded for the report.
+        """
+        actual_codes, expected_codes = encode_composite_keys(actual, expected, key_columns)
 
-        if not missing_in_actual.empty:
-            tmp = missing_in_actual[key_columns].copy()
-            tmp["ISSUE_TYPE"] = "MISSING_IN_ACTUAL"
-            details_df_list.append(tmp)
+        left = actual[[col for col in value_columns if col in actual.columns]].copy()
+        left[KEY_CODE_COLUMN] = actual_codes
+        left[ACTUAL_ROW_COLUMN] = np.arange(len(actual))
 
-        if not missing_in_expected.empty:
-            tmp = missing_in_expected[key_columns].copy()
-            tmp["ISSUE_TYPE"] = "MISSING_IN_EXPECTED"
-            details_df_list.append(tmp)
+        right = expected[[col for col in value_columns if col in expected.columns]].copy()
+        right[KEY_CODE_COLUMN] = expected_codes
+        right[EXPECTED_ROW_COLUMN] = np.arange(len(expected))
 
-        if not mismatched_df.empty:
-            tmp = mismatched_df.copy()
-            tmp["ISSUE_TYPE"] = "VALUE_MISMATCH"
-            details_df_list.append(tmp)
+        return left, right
 
-        combined_details_df = (
-            pd.concat(details_df_list, ignore_index=True) if details_df_list else None
-        )
+    def _find_value_mismatches(
+        self,
+        both: pd.DataFrame,
+        key_columns: List[str],
+        value_columns: List[str],
+        numeric_tolerance: Union[float, Dict[str, float]] = 0.0,
+        relative_tolerance: Union[float, Dict[str, float]] = 0.0,
+        suffixes: Tuple[str, str] = ("_actual", "_expected"),
+        scales: Optional[Dict[str, int]] = None,
+    ) -> pd.DataFrame:
+        """
+        Vectorized mismatch kernel: compares all value columns as 2-D NumPy blocks
+        grouped by dtype and returns one long-form mismatch table. Columns in scales hold
+        value * 10**scale: the absolute tolerance is scaled to match and reported values
+        are turned back into Decimals.
+        """
+        columns = [
+            col for col in value_columns
+            if f"{col}{suffixes[0]}" in both.columns and f"{col}{suffixes[1]}" in both.columns
+        ]
+
+        # Group columns into blocks that can be compared as a single 2-D array
+        blocks: Dict[Any, List[int]] = {}
+        for pos, col in enumerate(columns):
+            blocks.setdefault(
+                _block_dtype(both[f"{col}{suffixes[0]}"], both[f"{col}{suffixes[1]}"]), []
+            ).append(pos)
+
+        block_hits = []
+        total = 0
+        for dtype, positions in blocks.items():
+            block_cols = [columns[pos] for pos in positions]
+            actual_block = _to_block(both, [f"{col}{suffixes[0]}" for col in block_cols], dtype)
+            expected_block = _to_block(both, [f"{col}{suffixes[1]}" for col in block_cols], dtype)
+
+            mask = _mismatch_mask(
+                actual_block,
+                expected_block,
+                _tolerance_vector(numeric_tolerance, block_cols) * _scale_factors(scales, block_cols),
+                _tolerance_vector(relative_tolerance, block_cols),
+            )
+            # Column-major so rows come out grouped by column
+            col_idx, row_idx = np.nonzero(mask.T)
+            if len(row_idx):
+                block_hits.append((positions, actual_block, expected_block, row_idx, col_idx))
+                total += len(row_idx)
+
+        if total == 0:
+            return pd.DataFrame()
+
+        # Single allocation for the whole long-form table
+        rows = np.empty(total, dtype=np.int64)
+        column_pos = np.empty(total, dtype=np.int64)
+        actual_values = np.empty(total, dtype=object)
+        expected_values = np.empty(total, dtype=object)
+
+        offset = 0
+        for positions, actual_block, expected_block, row_idx, col_idx in block_hits:
+            stop = offset + len(row_idx)
+            rows[offset:stop] = row_idx
+            column_pos[offset:stop] = np.asarray(positions)[col_idx]
+            actual_values[offset:stop] = actual_block[row_idx, col_idx]
+            expected_values[offset:stop] = expected_block[row_idx, col_idx]
+            offset = stop
+
+        order = np.lexsort((rows, column_pos))
+        mismatched_df = both[key_columns].iloc[rows[order]].reset_index(drop=True)
+        mismatched_df["COLUMN_NAME"] = np.asarray(columns, dtype=object)[column_pos[order]]
+        mismatched_df["ACTUAL_VALUE"] = actual_values[order]
+        mismatched_df["EXPECTED_VALUE"] = expected_values[order]
+        for col, scale in (scales or {}).items():
+            rows_of_col = (mismatched_df["COLUMN_NAME"] == col).to_numpy()
+            for value_col in ("ACTUAL_VALUE", "EXPECTED_VALUE"):
+                mismatched_df.loc[rows_of_col, value_col] = [
+                    Decimal(int(value)).scaleb(-scale) for value in mismatched_df.loc[rows_of_col, value_col]
+                ]
+        return mismatched_df
+
+    def merge_results(
+        self,
+        results: List[DataComparisonResult],
+        collector: Optional[MismatchCollector] = None,
+    ) -> DataComparisonResult:
+        """
+        Merge per-partition compare_by_keys results into a single result.
+        Integer meta counters (and numeric entries of dicts) are summed, other dict entries
+        keep their first value. The fail-fast bookkeeping of a single call (partitions_*,
+        elapsed_seconds) describes that call only and is not carried over; truncated is
+        True if any result was truncated. Details come from the collector when given
+        (results are expected to have had their details folded into it already), otherwise
+        they are concatenated.
+        """
+        meta: Dict[str, Any] = {}
+        details_list = []
+        for result in results:
+            for key, value in result.meta.items():
+                if key in _PER_CALL_META:
+                    continue
+                if key == "truncated":
+                    meta[key] = meta.get(key, False) or bool(value)
+                elif isinstance(value, (int, np.integer)) and not isinstance(value, bool):
+                    meta[key] = meta.get(key, 0) + int(value)
+                elif isinstance(value, dict):
+                    merged = meta.setdefault(key, {})
+                    for sub_key, sub_value in value.items():
+                        if isinstance(sub_value, (int, float, np.number)) and not isinstance(sub_value, bool):
+                            merged[sub_key] = merged.get(sub_key, 0) + sub_value
+                        else:
+                            # Descriptive entries (e.g. dtype_reconciled) keep the first value
+                            merged.setdefault(sub_key, sub_value)
+                else:
+                    meta.setdefault(key, value)
+            if result.details is not None and not result.details.empty:
+                details_list.append(result.details)
+
+        if collector is not None:
+            for details in details_list:
+                collector.add(details)
+            details = collector.sample()
+            meta.update(collector.meta())
+        else:
+            details = pd.concat(details_list, ignore_index=True) if details_list else None
+
+        if all(result.success for result in results):
+            return DataComparisonResult(
+                success=True,
+                message="Data matches for all key and value columns.",
+                meta=meta,
+            )
+
+        missing_in_actual = meta.get("missing_in_actual_count", 0)
+        missing_in_expected = meta.get("missing_in_expected_count", 0)
+        mismatched = meta.get("mismatched_count", 0)
+        meta.setdefault("missing_in_actual_count", missing_in_actual)
+        meta.setdefault("missing_in_expected_count", missing_in_expected)
+        meta.setdefault("mismatched_count", mismatched)
 
         return DataComparisonResult(
             success=False,
             message="Data mismatch detected. "
-                    f"Missing in actual={len(missing_in_actual)}, "
-                    f"Missing in expected={len(missing_in_expected)}, "
-                    f"Value mismatches={len(mismatched_df)}.",
-            details=combined_details_df,
-            meta=details_meta,
+                    f"Missing in actual={missing_in_actual}, "
+                    f"Missing in expected={missing_in_expected}, "
+                    f"Value mismatches={mismatched}.",
+            details=details,
+            meta=meta,
+        )
+
+    def _drop_identical_rows(
+        self,
+        actual: pd.DataFrame,
+        expected: pd.DataFrame,
+        key_columns: List[str],
+        value_columns: List[str],
+    ) -> Tuple[pd.DataFrame, pd.DataFrame, int]:
+        """
+        Fingerprint fast path: inner-join keys + row fingerprints of both sides and
+        drop rows whose fingerprints are equal, so only differing or missing keys
+        go through the full merge and column-level diff.
+        """
+        hash_columns = [
+            col for col in value_columns if col in actual.columns and col in expected.columns
+        ]
+
+        actual_fp = actual[key_columns].copy()
+        actual_fp["_FINGERPRINT"] = row_fingerprints(actual, hash_columns)
+        actual_fp["_ROW"] = np.arange(len(actual))
+
+        expected_fp = expected[key_columns].copy()
+        expected_fp["_FINGERPRINT"] = row_fingerprints(expected, hash_columns)
+        expected_fp["_ROW"] = np.arange(len(expected))
+
+        # Inner join keeps the uint64 fingerprints exact (an outer join would upcast to float)
+        joined = actual_fp.merge(
+            expected_fp,
+            on=key_columns,
+            how="inner",
+            suffixes=("_actual", "_expected"),
+        )
+        identical = (
+            joined["_FINGERPRINT_actual"].to_numpy() == joined["_FINGERPRINT_expected"].to_numpy()
         )
+
+        keep_actual = np.ones(len(actual), dtype=bool)
+        keep_actual[joined["_ROW_actual"].to_numpy()[identical]] = False
+        keep_expected = np.ones(len(expected), dtype=bool)
+        keep_expected[joined["_ROW_expected"].to_numpy()[identical]] = False
+
+        return actual[keep_actual], expected[keep_expected], int(identical.sum())
@@ -1,8 +1,13 @@
-from typing import List, Optional, Dict, Any
+import math
+from datetime import date
+from statistics import NormalDist
+from typing import List, Optional, Dict, Any, Tuple, Union
 import pandas as pd
 
-from .DataComparator import DataComparator, DataComparisonResult
-from .SemanticViewDataFetcher import SemanticViewDataFetcher
+from .DataComparator import DataComparator, DataComparisonResult, row_fingerprints
+from .BaselineStore import FINGERPRINT_COLUMN, BaselineStore
+from .RowHashIndex import RowHashIndex, key_strings
+from .SemanticViewDataFetcher import SemanticViewDataFetcher, sample_buckets, sql_literal
 
 
 class DataValidator:
@@ -27,15 +32,15 @@ class DataValidator:
         tolerance: int = 0,
     ) -> DataComparisonResult:
         """
-        Fetches the semantic view and compares its row count with expected_df.
+        Counts the semantic view rows in the database (COUNT query) and compares with expected_df.
         """
-        actual_df = self.fetcher.fetch_view_data(
+        actual_count = self.fetcher.fetch_row_count(
             view_name=view_name,
             filters=filters,
         )
-        return self.comparator.compare_row_count(
-            actual=actual_df,
-            expected=expected_df,
+        return self.comparator.compare_counts(
+            actual_count=actual_count,
+            expected_count=len(expected_df),
             tolerance=tolerance,
         )
 
@@ -47,15 +52,14 @@ class DataValidator:
         ignore_order: bool = True,
     ) -> DataComparisonResult:
         """
-        Fetches the semantic view and compares schema/columns with expected_df.
+        Reads the semantic view columns from a zero-row query and compares them with expected_df.
         """
-        actual_df = self.fetcher.fetch_view_data(
+        columns = self.fetcher.fetch_view_columns(
             view_name=view_name,
             filters=filters,
-            limit=1,  # enough to get schema
         )
         return self.comparator.compare_schema(
-            actual=actual_df,
+            actual=pd.DataFrame(columns=columns),
             expected=expected_df,
             ignore_order=ignore_order,
         )
@@ -67,18 +71,32 @@ class DataValidator:
         key_columns: List[str],
         value_columns: Optional[List[str]] = None,
         filters: Optional[str] = None,
-        numeric_tolerance: float = 0.0,
+        numeric_tolerance: Union[float, Dict[str, float]] = 0.0,
+        relative_tolerance: Union[float, Dict[str, float]] = 0.0,
+        duplicate_policy: str = "fail",
+        max_mismatches: Optional[int] = None,
+        time_budget: Optional[float] = None,
         limit: Optional[int] = None,
+        push_down_keys: bool = False,
+        max_pushdown_keys: int = 1000,
     ) -> DataComparisonResult:
         """
         Full data validation for a semantic view:
-        - Fetches actual data from the view
+        - Fetches actual data from the view (only key + value columns when value_columns is given)
         - Compares against expected_df on keys and value columns
+
+        :param push_down_keys: Restrict the fetch to the keys in expected_df (see _fetch_for_keys)
+        :param max_pushdown_keys: Above this many distinct keys a MIN/MAX range filter is used instead
         """
-        actual_df = self.fetcher.fetch_view_data(
+        actual_df = self._fetch_for_keys(
             view_name=view_name,
+            keys_df=expected_df,
+            key_columns=key_columns,
+            value_columns=value_columns,
             filters=filters,
             limit=limit,
+            push_down_keys=push_down_keys,
+            max_pushdown_keys=max_pushdown_keys,
         )
 
         return self.comparator.compare_by_keys(
@@ -87,6 +105,10 @@ class DataValidator:
             key_columns=key_columns,
             value_columns=value_columns,
             numeric_tolerance=numeric_tolerance,
+            relative_tolerance=relative_tolerance,
+            duplicate_policy=duplicate_policy,
+            max_mismatches=max_mismatches,
+            time_budget=time_budget,
         )
 
     def validate_against_source(
@@ -97,21 +119,35 @@ class DataValidator:
         value_columns: Optional[List[str]] = None,
         source_filters: Optional[str] = None,
         view_filters: Optional[str] = None,
-        numeric_tolerance: float = 0.0,
+        numeric_tolerance: Union[float, Dict[str, float]] = 0.0,
+        relative_tolerance: Union[float, Dict[str, float]] = 0.0,
+        duplicate_policy: str = "fail",
+        max_mismatches: Optional[int] = None,
+        time_budget: Optional[float] = None,
         limit: Optional[int] = None,
+        push_down_keys: bool = False,
+        max_pushdown_keys: int = 1000,
     ) -> DataComparisonResult:
         """
         Pattern for 'source vs semantic view' validation where:
         - source_df is the already extracted source data DataFrame
         - semantic view is fetched and compared
+
+        :param push_down_keys: Restrict the view fetch to the keys in source_df (see _fetch_for_keys)
+        :param max_pushdown_keys: Above this many distinct keys a MIN/MAX range filter is used instead
         """
         # Optionally you can apply extra filters to source_df here if needed
         # For now, we assume source_df is already filtered.
 
-        actual_view_df = self.fetcher.fetch_view_data(
+        actual_view_df = self._fetch_for_keys(
             view_name=view_name,
+            keys_df=source_df,
+            key_columns=key_columns,
+            value_columns=value_columns,
             filters=view_filters,
             limit=limit,
+            push_down_keys=push_down_keys,
+            max_pushdown_keys=max_pushdown_keys,
         )
 
         return self.comparator.compare_by_keys(
@@ -120,4 +156,520 @@ class DataValidator:
             key_columns=key_columns,
             value_columns=value_columns,
             numeric_tolerance=numeric_tolerance,
+            relative_tolerance=relative_tolerance,
+            duplicate_policy=duplicate_policy,
+            max_mismatches=max_mismatches,
+            time_budget=time_budget,
+        )
+
+    def validate_by_checksums(
+        self,
+        view_name: str,
+        source_fetcher: SemanticViewDataFetcher,
+        source_view: str,
+        key_columns: List[str],
+        value_columns: Optional[List[str]] = None,
+        view_filters: Optional[str] = None,
+        source_filters: Optional[str] = None,
+        fanout: int = 64,
+        max_depth: int = 3,
+        detail_row_threshold: int = 100_000,
+        max_drill_buckets: int = 1000,
+        numeric_tolerance: Union[float, Dict[str, float]] = 0.0,
+        relative_tolerance: Union[float, Dict[str, float]] = 0.0,
+        duplicate_policy: str = "fail",
+    ) -> DataComparisonResult:
+        """
+        'Source vs semantic view' validation without moving the data:
+        - both databases compute COUNT + SUM(row hash) per key-hash bucket (fanout buckets)
+        - only the bucket aggregates are compared locally
+        - differing buckets are split into fanout child buckets and re-checked, until they
+          hold at most detail_row_threshold rows (or max_depth / max_drill_buckets is reached)
+        - only the rows of the remaining differing buckets are fetched and compared by keys
+
+        Both fetchers must use the same DB type and compatible column types, since hash
+        functions differ between backends. Checksums are exact, so buckets that differ only
+        within numeric_tolerance are fetched and then pass the detailed comparison.
+        """
+        db_type = self.fetcher.conn_mgr.db_type.lower()
+        if source_fetcher.conn_mgr.db_type.lower() != db_type:
+            raise ValueError(
+                "Checksum comparison needs both sides on the same DB type "
+                f"(got {db_type} and {source_fetcher.conn_mgr.db_type})."
+            )
+        if fanout < 2:
+            raise ValueError("fanout must be >= 2")
+
+        if value_columns is None:
+            view_columns = self.fetcher.fetch_view_columns(view_name)
+            source_columns = source_fetcher.fetch_view_columns(source_view)
+            value_columns = sorted((set(view_columns) & set(source_columns)) - set(key_columns))
+
+        modulus = fanout
+        parent = None
+        depth = 0
+        totals = None
+        while True:
+            depth += 1
+            actual_sums = self.fetcher.fetch_bucket_checksums(
+                view_name, key_columns, value_columns, modulus, filters=view_filters, parent=parent
+            )
+            expected_sums = source_fetcher.fetch_bucket_checksums(
+                source_view, key_columns, value_columns, modulus, filters=source_filters, parent=parent
+            )
+            if totals is None:
+                totals = (int(actual_sums["ROW_COUNT"].sum()), int(expected_sums["ROW_COUNT"].sum()))
+
+            differing = _differing_buckets(actual_sums, expected_sums)
+            if differing.empty:
+                break
+            differing_rows = int(differing[["ROW_COUNT_actual", "ROW_COUNT_expected"]].max(axis=1).sum())
+            if (
+                differing_rows <= detail_row_threshold
+                or depth >= max_depth
+                or len(differing) * fanout > max_drill_buckets
+            ):
+                break
+            parent = (modulus, differing["BUCKET_ID"].tolist())
+            modulus *= fanout
+
+        meta = {
+            "actual_count": totals[0],
+            "expected_count": totals[1],
+            "checksum_depth": depth,
+            "checksum_modulus": modulus,
+            "differing_buckets": len(differing),
+        }
+        if differing.empty:
+            return DataComparisonResult(
+                success=True,
+                message=f"All {fanout} bucket checksums match. Rows={totals[0]}",
+                meta=meta,
+            )
+
+        columns = list(dict.fromkeys(list(key_columns) + list(value_columns)))
+        buckets = differing["BUCKET_ID"].tolist()
+        view_predicate = self.fetcher.bucket_filter(key_columns, modulus, buckets)
+        source_predicate = source_fetcher.bucket_filter(key_columns, modulus, buckets)
+        actual_df = self.fetcher.fetch_view_data(
+            view_name=view_name,
+            columns=columns,
+            filters=f"({view_filters}) AND {view_predicate}" if view_filters else view_predicate,
+        )
+        expected_df = source_fetcher.fetch_view_data(
+            view_name=source_view,
+            columns=columns,
+            filters=f"({source_filters}) AND {source_predicate}" if source_filters else source_predicate,
+        )
+
+        result = self.comparator.compare_by_keys(
+            actual=actual_df,
+            expected=expected_df,
+            key_columns=key_columns,
+            value_columns=value_columns,
+            numeric_tolerance=numeric_tolerance,
+            relative_tolerance=relative_tolerance,
+            duplicate_policy=duplicate_policy,
+        )
+        meta["detail_rows_fetched"] = len(actual_df) + len(expected_df)
+        result.meta.update(meta)
+        return result
+
+    def validate_in_database(
+        self,
+        view_name: str,
+        expected_df: pd.DataFrame,
+        key_columns: List[str],
+        value_columns: Optional[List[str]] = None,
+        filters: Optional[str] = None,
+        numeric_tolerance: Union[float, Dict[str, float]] = 0.0,
+        relative_tolerance: Union[float, Dict[str, float]] = 0.0,
+        duplicate_policy: str = "fail",
+    ) -> DataComparisonResult:
+        """
+        Validation for a locally built expected_df (Excel, source extract) against a view
+        in Snowflake, Azure SQL or Oracle without downloading the view:
+        - expected_df is bulk-loaded into a session temp table
+        - rows without an exact match on the other side are found with EXCEPT / MINUS
+        - only those rows are compared by keys, so missing / extra / mismatched rows are
+          classified and numeric tolerances still apply
+
+        Set operations are distinct, so exact duplicate rows are not detected in this mode.
+        """
+        if value_columns is None:
+            view_columns = self.fetcher.fetch_view_columns(view_name)
+            value_columns = sorted((set(view_columns) & set(expected_df.columns)) - set(key_columns))
+        columns = list(dict.fromkeys(list(key_columns) + list(value_columns)))
+
+        view_only, expected_only = self.fetcher.diff_against_frame(
+            view_name=view_name,
+            expected_df=expected_df,
+            columns=columns,
+            filters=filters,
+        )
+        result = self.comparator.compare_by_keys(
+            actual=view_only,
+            expected=expected_only,
+            key_columns=key_columns,
+            value_columns=value_columns,
+            numeric_tolerance=numeric_tolerance,
+            relative_tolerance=relative_tolerance,
+            duplicate_policy=duplicate_policy,
+        )
+        result.meta.update({
+            "expected_count": len(expected_df),
+            "view_only_rows": len(view_only),
+            "expected_only_rows": len(expected_only),
+        })
+        return result
+
+    def validate_incremental(
+        self,
+        source_df: pd.DataFrame,
+        view_name: str,
+        key_columns: List[str],
+        watermark_column: str,
+        baseline_store: BaselineStore,
+        value_columns: Optional[List[str]] = None,
+        view_filters: Optional[str] = None,
+        numeric_tolerance: Union[float, Dict[str, float]] = 0.0,
+        relative_tolerance: Union[float, Dict[str, float]] = 0.0,
+        duplicate_policy: str = "fail",
+        advance_on_failure: bool = False,
+    ) -> DataComparisonResult:
+        """
+        Incremental 'source vs semantic view' validation:
+        - only view rows with watermark_column >= the last validated watermark are fetched
+          (>= so rows landing late with the boundary value are not skipped)
+        - source_df is cut to the same watermark range (pass the full extract or just the delta)
+        - the delta is compared by keys; its fingerprints are upserted into the view baseline
+          and the watermark advances to the newest validated value
+
+        The first run (no stored watermark) validates the whole view. On failure the
+        watermark stays where it was unless advance_on_failure=True, so the failing rows
+        are validated again on the next run.
+        """
+        watermark = baseline_store.load_watermark(view_name)
+
+        filters = view_filters
+        if watermark is not None:
+            backend = getattr(self.fetcher.conn_mgr, "backend", None)
+            predicate = f"{watermark_column} >= {sql_literal(watermark, backend)}"
+            filters = f"({view_filters}) AND {predicate}" if view_filters else predicate
+            source_df = source_df[_since_watermark(source_df[watermark_column], watermark)]
+
+        if value_columns is None:
+            view_columns = self.fetcher.fetch_view_columns(view_name)
+            value_columns = sorted((set(view_columns) & set(source_df.columns)) - set(key_columns))
+        columns = list(dict.fromkeys(list(key_columns) + list(value_columns) + [watermark_column]))
+        view_delta = self.fetcher.fetch_view_data(view_name=view_name, columns=columns, filters=filters)
+
+        result = self.comparator.compare_by_keys(
+            actual=view_delta,
+            expected=source_df,
+            key_columns=key_columns,
+            value_columns=value_columns,
+            numeric_tolerance=numeric_tolerance,
+            relative_tolerance=relative_tolerance,
+            duplicate_policy=duplicate_policy,
+        )
+
+        delta = baseline_store.fingerprints(view_delta, key_columns, value_columns)
+        baseline = baseline_store.load_baseline(view_name)
+        if baseline is not None and not delta.empty:
+            known = delta.merge(baseline, on=key_columns, how="inner", suffixes=("", "_baseline"))
+            updated_keys = len(known)
+            unchanged_rows = int((known[FINGERPRINT_COLUMN] == known[f"{FINGERPRINT_COLUMN}_baseline"]).sum())
+        else:
+            updated_keys = unchanged_rows = 0
+
+        meta = {
+            "watermark_from": None if watermark is None else str(watermark),
+            "delta_rows": len(view_delta),
+            "new_keys": len(delta) - updated_keys,
+            "updated_keys": updated_keys,
+            "unchanged_rows": unchanged_rows,
+        }
+        if (result.success or advance_on_failure) and not view_delta.empty:
+            new_watermark = view_delta[watermark_column].max()
+            baseline = baseline_store.merge_baseline(view_name, delta, key_columns)
+            baseline_store.save_watermark(view_name, new_watermark, watermark_column)
+            meta["watermark_to"] = str(new_watermark)
+        meta["baseline_rows"] = 0 if baseline is None else len(baseline)
+
+        result.meta.update(meta)
+        return result
+
+    def validate_changed_rows(
+        self,
+        source_df: pd.DataFrame,
+        view_name: str,
+        key_columns: List[str],
+        index: RowHashIndex,
+        value_columns: Optional[List[str]] = None,
+        view_filters: Optional[str] = None,
+        max_pushdown_keys: int = 1000,
+        full_fetch_ratio: float = 0.5,
+        numeric_tolerance: Union[float, Dict[str, float]] = 0.0,
+        relative_tolerance: Union[float, Dict[str, float]] = 0.0,
+        duplicate_policy: str = "fail",
+    ) -> DataComparisonResult:
+        """
+        Change-only 'source vs semantic view' validation for views without a watermark:
+        - key + row hash of every view row is computed in the database (fetch_row_hashes),
+          source_df rows are fingerprinted locally
+        - both are diffed against the persistent RowHashIndex of the last passing run
+        - only new / changed / deleted keys (on either side) are fetched in full and compared
+
+        The index is replaced only when the validation passes, so failing rows are
+        validated again next time. The first run validates everything.
+        """
+        if value_columns is None:
+            view_columns = self.fetcher.fetch_view_columns(view_name)
+            value_columns = sorted((set(view_columns) & set(source_df.columns)) - set(key_columns))
+
+        view_hashes = self.fetcher.fetch_row_hashes(view_name, key_columns, value_columns, filters=view_filters)
+        view_keys = key_strings(view_hashes, key_columns)
+        source_keys = key_strings(source_df, key_columns)
+        source_hashes = row_fingerprints(source_df, value_columns)
+
+        view_namespace, source_namespace = f"{view_name}:view", f"{view_name}:source"
+        changed = index.changed_keys(view_namespace, view_keys, view_hashes["ROW_HASH"])
+        changed |= index.changed_keys(source_namespace, source_keys, source_hashes)
+
+        fetch_keys = view_hashes.loc[view_keys.isin(changed).to_numpy(), key_columns]
+        columns = list(dict.fromkeys(list(key_columns) + list(value_columns)))
+        if len(fetch_keys) > full_fetch_ratio * len(view_hashes):
+            actual_df = self.fetcher.fetch_view_data(view_name=view_name, columns=columns, filters=view_filters)
+            actual_df = actual_df[key_strings(actual_df, key_columns).isin(changed).to_numpy()]
+        else:
+            parts = []
+            for start in range(0, len(fetch_keys), max_pushdown_keys):
+                key_filter = self.fetcher.build_key_filter(
+                    key_columns, fetch_keys.iloc[start:start + max_pushdown_keys], max_keys=max_pushdown_keys
+                )
+                filters = f"({view_filters}) AND {key_filter}" if view_filters else key_filter
+                parts.append(self.fetcher.fetch_view_data(view_name=view_name, columns=columns, filters=filters))
+            actual_df = pd.concat(parts, ignore_index=True) if parts else pd.DataFrame(columns=columns)
+
+        result = self.comparator.compare_by_keys(
+            actual=actual_df,
+            expected=source_df[source_keys.isin(changed).to_numpy()],
+            key_columns=key_columns,
+            value_columns=value_columns,
+            numeric_tolerance=numeric_tolerance,
+            relative_tolerance=relative_tolerance,
+            duplicate_policy=duplicate_policy,
+        )
+        if result.success:
+            index.replace(view_namespace, view_keys, view_hashes["ROW_HASH"])
+            index.replace(source_namespace, source_keys, source_hashes)
+
+        result.meta.update({
+            "view_rows": len(view_hashes),
+            "source_rows": len(source_df),
+            "changed_keys": len(changed),
+            "rows_fetched": len(actual_df),
+        })
+        return result
+
+    def validate_sample(
+        self,
+        view_name: str,
+        expected_df: pd.DataFrame,
+        key_columns: List[str],
+        sample_rate: float = 0.01,
+        value_columns: Optional[List[str]] = None,
+        filters: Optional[str] = None,
+        modulus: int = 10_000,
+        confidence: float = 0.95,
+        numeric_tolerance: Union[float, Dict[str, float]] = 0.0,
+        relative_tolerance: Union[float, Dict[str, float]] = 0.0,
+        duplicate_policy: str = "fail",
+    ) -> DataComparisonResult:
+        """
+        Sampled validation: both sides keep the same keys, MOD(MD5(keys), modulus) < keep,
+        pushed into the view query and applied to expected_df with sample_buckets.
+        Unlike limit=, the two samples line up key for key.
+
+        meta reports the sampled coverage and the mismatch rate over sampled keys with a
+        Wilson score interval at the given confidence. Keys should be integers or strings,
+        since other types may render differently in SQL and Python.
+        """
+        if not 0 < sample_rate <= 1:
+            raise ValueError("sample_rate must be in (0, 1]")
+        keep = max(1, int(round(sample_rate * modulus)))
+
+        columns = None
+        if value_columns is not None:
+            columns = list(dict.fromkeys(list(key_columns) + list(value_columns)))
+        actual_df = self.fetcher.fetch_view_sample(
+            view_name, key_columns, modulus, keep, columns=columns, filters=filters
+        )
+        expected_sample = expected_df[sample_buckets(expected_df, key_columns, modulus) < keep]
+
+        result = self.comparator.compare_by_keys(
+            actual=actual_df,
+            expected=expected_sample,
+            key_columns=key_columns,
+            value_columns=value_columns,
+            numeric_tolerance=numeric_tolerance,
+            relative_tolerance=relative_tolerance,
+            duplicate_policy=duplicate_policy,
         )
+
+        sampled_keys = len(
+            pd.concat([actual_df[key_columns], expected_sample[key_columns]], ignore_index=True).drop_duplicates()
+        )
+        # Exact count from the comparator; details may only be a sample of the failures
+        failed_keys = result.meta.get("failed_key_count", 0)
+        low, high = _wilson_interval(failed_keys, sampled_keys, confidence)
+
+        result.meta.update({
+            "sample_rate": keep / modulus,
+            "sampled_keys": sampled_keys,
+            "sampled_view_rows": len(actual_df),
+            "sampled_expected_rows": len(expected_sample),
+            "coverage": len(expected_sample) / len(expected_df) if len(expected_df) else 0.0,
+            "failed_keys": failed_keys,
+            "mismatch_rate": failed_keys / sampled_keys if sampled_keys else 0.0,
+            "mismatch_rate_interval": (low, high),
+            "confidence": confidence,
+        })
+        result.message += (
+            f" Sampled {sampled_keys} keys ({keep / modulus:.2%}); mismatch rate upper bound "
+            f"{high:.4%} at {confidence:.0%} confidence."
+        )
+        return result
+
+    def validate_profiles(
+        self,
+        view_name: str,
+        source_fetcher: SemanticViewDataFetcher,
+        source_view: str,
+        columns: Optional[List[str]] = None,
+        view_filters: Optional[str] = None,
+        source_filters: Optional[str] = None,
+        quantiles: Tuple[float, ...] = (0.25, 0.5, 0.75),
+        numeric_tolerance: Union[float, Dict[str, float]] = 0.0,
+        relative_tolerance: Optional[Union[float, Dict[str, float]]] = None,
+    ) -> DataComparisonResult:
+        """
+        Compares column profiles (profile_columns) of a view and a source without
+        transferring rows, keyed on the profiled column name.
+
+        By default exact statistics (count, null_count, min, max, mean) must match and
+        approximate ones (approx_distinct, quantiles) may differ by 2%, since each backend
+        approximates differently.
+        """
+        if columns is None:
+            view_columns = self.fetcher.fetch_view_columns(view_name)
+            source_columns = set(source_fetcher.fetch_view_columns(source_view))
+            columns = [col for col in view_columns if col in source_columns]
+
+        actual = self.fetcher.profile_columns(view_name, columns, filters=view_filters, quantiles=quantiles)
+        numeric_columns = actual.loc[actual["mean"].notna(), "column"].tolist()
+        expected = source_fetcher.profile_columns(
+            source_view, columns, filters=source_filters, quantiles=quantiles, numeric_columns=numeric_columns
+        )
+
+        if relative_tolerance is None:
+            approximate = ["approx_distinct"] + [col for col in actual.columns if col.startswith("p")]
+            relative_tolerance = {col: 0.02 for col in approximate}
+
+        return self.comparator.compare_by_keys(
+            actual=actual,
+            expected=expected,
+            key_columns=["column"],
+            numeric_tolerance=numeric_tolerance,
+            relative_tolerance=relative_tolerance,
+        )
+
+    def _fetch_for_keys(
+        self,
+        view_name: str,
+        keys_df: pd.DataFrame,
+        key_columns: List[str],
+        value_columns: Optional[List[str]],
+        filters: Optional[str],
+        limit: Optional[int],
+        push_down_keys: bool,
+        max_pushdown_keys: int,
+    ) -> pd.DataFrame:
+        """
+        Fetch the view with projection and (optionally) key predicate pushdown:
+        - only key + value columns are selected when value_columns is given
+        - with push_down_keys, the WHERE clause is restricted to the keys of keys_df
+
+        Note: with push_down_keys, view rows whose keys are not in keys_df are not
+        fetched, so they cannot be reported as missing on the expected side
+        (except those outside the MIN/MAX range fallback, which are filtered too).
+        """
+        columns = None
+        if value_columns is not None:
+            columns = list(dict.fromkeys(list(key_columns) + list(value_columns)))
+
+        if push_down_keys:
+            key_filter = self.fetcher.build_key_filter(key_columns, keys_df, max_keys=max_pushdown_keys)
+            if key_filter:
+                filters = f"({filters}) AND {key_filter}" if filters else key_filter
+
+        return self.fetcher.fetch_view_data(
+            view_name=view_name,
+            columns=columns,
+            filters=filters,
+            limit=limit,
+        )
+
+
+def _differing_buckets(actual_sums: pd.DataFrame, expected_sums: pd.DataFrame) -> pd.DataFrame:
+    """
+    Buckets whose ROW_COUNT or ROW_CHECKSUM differ (or that exist on one side only).
+    """
+    merged = pd.merge(
+        actual_sums,
+        expected_sums,
+        on="BUCKET_ID",
+        how="outer",
+        suffixes=("_actual", "_expected"),
+    )
+    for col in ("ROW_COUNT_actual", "ROW_COUNT_expected"):
+        merged[col] = merged[col].fillna(0).astype("int64")
+    differs = (
+        (merged["ROW_COUNT_actual"] != merged["ROW_COUNT_expected"])
+        | (merged["ROW_CHECKSUM_actual"].fillna("") != merged["ROW_CHECKSUM_expected"].fillna(""))
+    )
+    return merged.loc[differs].sort_values("BUCKET_ID").reset_index(drop=True)
+
+
+def _since_watermark(values: pd.Series, watermark: Any) -> pd.Series:
+    """
+    Mask of values >= watermark. Date/datetime watermarks are compared as timestamps, so a
+    column of datetime.date objects, strings or datetime64 (naive or tz-aware) works with
+    either kind of stored watermark.
+    """
+    if not isinstance(watermark, date):
+        return values >= watermark
+
+    values = pd.to_datetime(values)
+    watermark = pd.Timestamp(watermark)
+    column_tz = getattr(values.dt, "tz", None)
+    if column_tz is None and watermark.tz is not None:
+        watermark = watermark.tz_convert("UTC").tz_localize(None)
+    elif column_tz is not None and watermark.tz is None:
+        watermark = watermark.tz_localize("UTC")
+    return values >= watermark
+
+
+def _wilson_interval(failures: int, trials: int, confidence: float) -> Tuple[float, float]:
+    """
+    Wilson score interval for a binomial proportion (stays sensible at 0 failures).
+    """
+    if trials == 0:
+        return 0.0, 1.0
+    z = NormalDist().inv_cdf(0.5 + confidence / 2)
+    p = failures / trials
+    denominator = 1 + z ** 2 / trials
+    center = (p + z ** 2 / (2 * trials)) / denominator
+    margin = z * math.sqrt(p * (1 - p) / trials + z ** 2 / (4 * trials ** 2)) / denominator
+    return max(0.0, center - margin), min(1.0, center + margin)
@@ -0,0 +1,420 @@
+import json
+import re
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.dataset as ds
+from pyarrow import fs
+
+
+_TOKEN_RE = re.compile(
+    r"\s*(?:"
+    r"(?P<string>'(?:[^']|'')*')"
+    r"|(?P<number>-?\d+(?:\.\d*)?(?:[eE][-+]?\d+)?)"
+    r"|(?P<op><>|!=|<=|>=|=|<|>|\(|\)|,|\*)"
+    r"|(?P<ident>[A-Za-z_][A-Za-z0-9_$.]*|\"[^\"]+\"|`[^`]+`)"
+    r")"
+)
+_KEYWORDS = {
+    "SELECT", "DISTINCT", "FROM", "WHERE", "ORDER", "BY", "LIMIT", "AS", "AND", "OR",
+    "NOT", "IN", "BETWEEN", "IS", "NULL", "TRUE", "FALSE", "ASC", "DESC",
+}
+_AGGREGATES = {"COUNT", "MIN", "MAX"}
+
+
+def _tokenize(sql: str) -> List[Tuple[str, Any]]:
+    tokens = []
+    pos = 0
+    sql = sql.strip().rstrip(";")
+    while pos < len(sql):
+        match = _TOKEN_RE.match(sql, pos)
+        if not match or match.end() == pos:
+            if sql[pos:].strip() == "":
+                break
+            raise ValueError(f"Lakehouse SQL: unsupported syntax near '{sql[pos:pos + 20]}'")
+        pos = match.end()
+        kind = match.lastgroup
+        text = match.group(kind)
+        if kind == "string":
+            tokens.append(("literal", text[1:-1].replace("''", "'")))
+        elif kind == "number":
+            tokens.append(("literal", float(text) if any(c in text for c in ".eE") else int(text)))
+        elif kind == "ident" and text[0] in "\"`":
+            tokens.append(("ident", text[1:-1]))
+        elif kind == "ident" and text.upper() in _KEYWORDS:
+            tokens.append(("keyword", text.upper()))
+        else:
+            tokens.append((kind, text))
+    return tokens
+
+
+class SelectQuery:
+    """
+    Parsed form of the SELECT shapes SemanticViewDataFetcher generates:
+    SELECT [DISTINCT] *|cols|COUNT(1)|MIN(c)|MAX(c) [AS alias] FROM t
+    [WHERE predicate] [ORDER BY c [ASC|DESC], ...] [LIMIT n]
+    """
+
+    def __init__(self):
+        self.table: Optional[str] = None
+        self.columns: Optional[List[str]] = None
+        self.aggregates: List[Tuple[str, Optional[str], str]] = []
+        self.distinct = False
+        self.where = None
+        self.order_by: List[Tuple[str, str]] = []
+        self.limit: Optional[int] = None
+
+
+class _Parser:
+    def __init__(self, sql: str):
+        self.tokens = _tokenize(sql)
+        self.pos = 0
+
+    def peek(self, offset: int = 0):
+        index = self.pos + offset
+        return self.tokens[index] if index < len(self.tokens) else (None, None)
+
+    def next(self):
+        token = self.peek()
+        self.pos += 1
+        return token
+
+    def accept(self, kind: str, value: Any = None) -> bool:
+        token_kind, token_value = self.peek()
+        if token_kind == kind and (value is None or token_value == value):
+            self.pos += 1
+            return True
+        return False
+
+    def expect(self, kind: str, value: Any = None):
+        token = self.next()
+        if token[0] != kind or (value is not None and token[1] != value):
+            raise ValueError(f"Lakehouse SQL: expected {value or kind}, got {token[1]!r}")
+        return token[1]
+
+    def parse_select(self) -> SelectQuery:
+        query = SelectQuery()
+        self.expect("keyword", "SELECT")
+        query.distinct = self.accept("keyword", "DISTINCT")
+
+        if self.accept("op", "*"):
+            query.columns = None
+        else:
+            columns = []
+            while True:
+                kind, value = self.peek()
+                if kind == "ident" and value.upper() in _AGGREGATES and self.peek(1) == ("op", "("):
+                    self.pos += 2
+                    func = value.upper()
+                    if self.accept("op", "*"):
+                        arg = None
+                    else:
+                        arg_kind, arg = self.next()
+                        arg = None if func == "COUNT" and arg_kind == "literal" else arg
+                    self.expect("op", ")")
+                    alias = self.expect("ident") if self.accept("keyword", "AS") else f"{func}_{arg or 'ALL'}"
+                    query.aggregates.append((func, arg, alias))
+                else:
+                    columns.append(self.expect("ident"))
+                if not self.accept("op", ","):
+                    break
+            query.columns = columns or None
+
+        self.expect("keyword", "FROM")
+        query.table = self.expect("ident")
+
+        if self.accept("keyword", "WHERE"):
+            query.where = self.parse_or()
+        if self.accept("keyword", "ORDER"):
+            self.expect("keyword", "BY")
+            while True:
+                column = self.expect("ident")
+                direction = "descending" if self.accept("keyword", "DESC") else "ascending"
+                self.accept("keyword", "ASC")
+                query.order_by.append((column, direction))
+                if not self.accept("op", ","):
+                    break
+        if self.accept("keyword", "LIMIT"):
+            query.limit = int(self.expect("literal"))
+        if self.peek()[0] is not None:
+            raise ValueError(f"Lakehouse SQL: unexpected {self.peek()[1]!r}")
+        return query
+
+    # Predicates are parsed into nested tuples and compiled against the dataset schema later
+
+    def parse_or(self):
+        node = self.parse_and()
+        while self.accept("keyword", "OR"):
+            node = ("or", node, self.parse_and())
+        return node
+
+    def parse_and(self):
+        node = self.parse_not()
+        while self.accept("keyword", "AND"):
+            node = ("and", node, self.parse_not())
+        return node
+
+    def parse_not(self):
+        if self.accept("keyword", "NOT"):
+            return ("not", self.parse_not())
+        return self.parse_predicate()
+
+    def parse_predicate(self):
+        if self.accept("op", "("):
+            node = self.parse_or()
+            self.expect("op", ")")
+            return node
+
+        left = self.parse_operand()
+        negate = self.accept("keyword", "NOT")
+        if self.accept("keyword", "IN"):
+            self.expect("op", "(")
+            values = [self.parse_operand()]
+            while self.accept("op", ","):
+                values.append(self.parse_operand())
+            self.expect("op", ")")
+            node = ("in", left, values)
+        elif self.accept("keyword", "BETWEEN"):
+            low = self.parse_operand()
+            self.expect("keyword", "AND")
+            node = ("between", left, low, self.parse_operand())
+        elif self.accept("keyword", "IS"):
+            negate = self.accept("keyword", "NOT")
+            self.expect("keyword", "NULL")
+            node = ("is_null", left)
+        else:
+            kind, op = self.next()
+            if kind != "op" or op not in ("=", "<>", "!=", "<", "<=", ">", ">="):
+                raise ValueError(f"Lakehouse SQL: unsupported predicate operator {op!r}")
+            node = ("cmp", op, left, self.parse_operand())
+        return ("not", node) if negate else node
+
+    def parse_operand(self):
+        kind, value = self.next()
+        if kind == "ident":
+            return ("field", value)
+        if kind == "literal":
+            return ("literal", value)
+        if kind == "keyword" and value in ("TRUE", "FALSE"):
+            return ("literal", value == "TRUE")
+        if kind == "keyword" and value == "NULL":
+            return ("literal", None)
+        raise ValueError(f"Lakehouse SQL: unsupported operand {value!r}")
+
+
+def parse_select(sql: str) -> SelectQuery:
+    return _Parser(sql).parse_select()
+
+
+class LakehouseConnection:
+    """
+    File-based stand-in for a DB-API connection over local Parquet / Delta tables.
+
+    Table names resolve to <path>/<name> (dots become directories) or to an explicit
+    config['tables'] entry. Queries are executed with pyarrow.dataset:
+    - the SELECT list becomes column pruning
+    - WHERE becomes a dataset filter, so hive partitions and Parquet row groups whose
+      statistics cannot match are skipped
+    - LIMIT without ORDER BY stops scanning early (Dataset.head)
+    - files are read through memory-mapped local I/O
+    """
+
+    def __init__(self, config: Dict[str, Any]):
+        self.root = Path(config.get('path', '.'))
+        self.tables = config.get('tables', {})
+        self.partitioning = config.get('partitioning', 'hive')
+        self.filesystem = fs.LocalFileSystem(use_mmap=config.get('memory_map', True))
+        self._datasets: Dict[str, ds.Dataset] = {}
+
+    def dataset(self, name: str) -> ds.Dataset:
+        if name not in self._datasets:
+            path = Path(self.tables.get(name) or self.root.joinpath(*name.split('.')))
+            if not path.exists():
+                raise ValueError(f"Lakehouse table not found: {name} ({path})")
+            if (path / '_delta_log').is_dir():
+                self._datasets[name] = self._delta_dataset(path)
+            else:
+                self._datasets[name] = ds.dataset(
+                    str(path), format='parquet', partitioning=self.partitioning, filesystem=self.filesystem
+                )
+        return self._datasets[name]
+
+    def _delta_dataset(self, path: Path) -> ds.Dataset:
+        """
+        Current snapshot of a Delta table: deltalake when installed, otherwise a replay of
+        the JSON commit log (tables without checkpoints only).
+        """
+        try:
+            from deltalake import DeltaTable
+        except ImportError:
+            DeltaTable = None
+        if DeltaTable is not None:
+            return DeltaTable(str(path)).to_pyarrow_dataset()
+
+        log_dir = path / '_delta_log'
+        if (log_dir / '_last_checkpoint').exists():
+            raise ValueError(f"Delta table {path} has checkpoints; install deltalake to read it.")
+        files: Dict[str, bool] = {}
+        for commit in sorted(log_dir.glob('*.json')):
+            for line in commit.read_text(encoding='utf-8').splitlines():
+                if not line.strip():
+                    continue
+                action = json.loads(line)
+                if 'add' in action:
+                    files[action['add']['path']] = True
+                elif 'remove' in action:
+                    files.pop(action['remove']['path'], None)
+        return ds.dataset(
+            [str(path / file) for file in files],
+            format='parquet',
+            partitioning=self.partitioning,
+            partition_base_dir=str(path),
+            filesystem=self.filesystem,
+        )
+
+    def query_arrow(self, sql: str) -> pa.Table:
+        query = parse_select(sql)
+        dataset = self.dataset(query.table)
+        schema = dataset.schema
+        condition = _compile(query.where, schema) if query.where is not None else None
+
+        if query.aggregates:
+            return self._aggregate(dataset, query, condition)
+
+        columns = [_resolve(schema, col) for col in query.columns] if query.columns else None
+        if query.limit is not None and not query.order_by and not query.distinct:
+            return dataset.head(query.limit, columns=columns, filter=condition)
+
+        table = dataset.to_table(columns=columns, filter=condition)
+        if query.distinct:
+            table = table.group_by(table.column_names).aggregate([])
+        if query.order_by:
+            table = table.sort_by([(_resolve(schema, col), direction) for col, direction in query.order_by])
+        if query.limit is not None:
+            table = table.slice(0, query.limit)
+        return table
+
+    def iter_arrow(self, sql: str, chunk_rows: int) -> Iterator[pa.Table]:
+        query = parse_select(sql)
+        if query.aggregates or query.order_by or query.distinct:
+            yield self.query_arrow(sql)
+            return
+
+        dataset = self.dataset(query.table)
+        schema = dataset.schema
+        condition = _compile(query.where, schema) if query.where is not None else None
+        columns = [_resolve(schema, col) for col in query.columns] if query.columns else None
+        remaining = query.limit
+        for batch in dataset.to_batches(columns=columns, filter=condition, batch_size=chunk_rows):
+            if remaining is not None:
+                if remaining <= 0:
+                    break
+                batch = batch.slice(0, remaining)
+                remaining -= batch.num_rows
+            if batch.num_rows:
+                yield pa.Table.from_batches([batch])
+
+    def columns(self, sql: str) -> List[str]:
+        query = parse_select(sql)
+        if query.aggregates:
+            return [alias for _, _, alias in query.aggregates]
+        schema = self.dataset(query.table).schema
+        return [_resolve(schema, col) for col in query.columns] if query.columns else schema.names
+
+    def _aggregate(self, dataset: ds.Dataset, query: SelectQuery, condition) -> pa.Table:
+        schema = dataset.schema
+        needed = sorted({_resolve(schema, arg) for func, arg, _ in query.aggregates if arg is not None})
+        table = dataset.to_table(columns=needed, filter=condition) if needed else None
+
+        values = {}
+        for func, arg, alias in query.aggregates:
+            if func == "COUNT":
+                if arg is None:
+                    # Row counts come from Parquet metadata when there is no filter
+                    values[alias] = [dataset.count_rows(filter=condition) if table is None else table.num_rows]
+                else:
+                    values[alias] = [pc.count(table.column(_resolve(schema, arg))).as_py()]
+            else:
+                min_max = pc.min_max(table.column(_resolve(schema, arg))).as_py()
+                values[alias] = [min_max["min" if func == "MIN" else "max"]]
+        return pa.table(values)
+
+    def close(self):
+        self._datasets.clear()
+
+
+def _resolve(schema: pa.Schema, name: str) -> str:
+    """
+    Column name lookup that is case-insensitive like SQL identifiers.
+    """
+    if name in schema.names:
+        return name
+    matches = [field for field in schema.names if field.lower() == name.lower()]
+    if len(matches) != 1:
+        raise ValueError(f"Lakehouse SQL: unknown or ambiguous column {name!r}")
+    return matches[0]
+
+
+def _literal(value: Any, field_type: Optional[pa.DataType]):
+    """
+    Literal as a pyarrow scalar, coerced to the compared column's type when possible
+    (e.g. 'YYYY-MM-DD HH:MM:SS' strings against timestamp columns, 1/0 against booleans).
+    """
+    if value is None or field_type is None:
+        return pa.scalar(value)
+    if isinstance(value, str) and (pa.types.is_timestamp(field_type) or pa.types.is_date(field_type)):
+        timestamp = pd.Timestamp(value)
+        value = timestamp.date() if pa.types.is_date(field_type) else timestamp.to_pydatetime()
+        return pa.scalar(value, type=field_type)
+    try:
+        return pa.scalar(value).cast(field_type)
+    except (pa.ArrowInvalid, pa.ArrowNotImplementedError, pa.ArrowTypeError):
+        return pa.scalar(value)
+
+
+def _compile(node, schema: pa.Schema) -> ds.Expression:
+    kind = node[0]
+    if kind == "and":
+        return _compile(node[1], schema) & _compile(node[2], schema)
+    if kind == "or":
+        return _compile(node[1], schema) | _compile(node[2], schema)
+    if kind == "not":
+        return ~_compile(node[1], schema)
+
+    def operand(term, other=None):
+        if term[0] == "field":
+            return ds.field(_resolve(schema, term[1]))
+        other_type = schema.field(_resolve(schema, other[1])).type if other and other[0] == "field" else None
+        return ds.scalar(_literal(term[1], other_type))
+
+    if kind == "is_null":
+        return operand(node[1]).is_null()
+    if kind == "in":
+        left = node[1]
+        if left[0] != "field":
+            raise ValueError("Lakehouse SQL: IN needs a column on the left side")
+        field_type = schema.field(_resolve(schema, left[1])).type
+        values = pa.array([_literal(term[1], field_type).as_py() for term in node[2]], type=field_type)
+        # SQL: NULL IN (...) is NULL (so NOT IN drops it too), Arrow's is_in says false
+        field = operand(left)
+        return pc.if_else(field.is_null(), pa.scalar(None, type=pa.bool_()), field.isin(values))
+    if kind == "between":
+        left = operand(node[1])
+        return (left >= operand(node[2], node[1])) & (left <= operand(node[3], node[1]))
+
+    _, op, left_term, right_term = node
+    left, right = operand(left_term, right_term), operand(right_term, left_term)
+    if op == "=":
+        return left == right
+    if op in ("<>", "!="):
+        return left != right
+    if op == "<":
+        return left < right
+    if op == "<=":
+        return left <= right
+    if op == ">":
+        return left > right
+    return left >= right
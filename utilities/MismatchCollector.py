@@ -0,0 +1,102 @@
+import uuid
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+import numpy as np
+import pandas as pd
+
+
+class MismatchCollector:
+    """
+    Bounded collector for comparison detail rows.
+
+    Keeps an in-memory reservoir sample of at most sample_size example rows per issue
+    type and optionally streams every detail chunk to partitioned Parquet
+    (details_dir/ISSUE_TYPE=<type>/part-N.parquet) while the comparison runs.
+    Exact counts live in the comparison result meta.
+    """
+
+    def __init__(
+        self,
+        sample_size: Optional[int] = None,
+        details_dir: Optional[str] = None,
+        seed: Optional[int] = None,
+    ):
+        """
+        :param sample_size: Max example rows kept in memory per issue type (None = keep all)
+        :param details_dir: Directory to stream full details to as partitioned Parquet
+        :param seed: Seed for the reservoir sampling
+        """
+        self.sample_size = sample_size
+        self.details_dir = Path(details_dir) if details_dir else None
+        self._rng = np.random.default_rng(seed)
+        self._samples: Dict[str, pd.DataFrame] = {}
+        self._priorities: Dict[str, np.ndarray] = {}
+        self._parts_written = 0
+        self._run_id = uuid.uuid4().hex[:8]
+
+    def add(self, details: Optional[pd.DataFrame]):
+        """
+        Account for one chunk of detail rows (as produced by compare_by_keys).
+        """
+        if details is None or details.empty:
+            return
+
+        if self.details_dir is not None:
+            self._write_parquet(details)
+
+        for issue_type, issue_rows in details.groupby("ISSUE_TYPE", sort=False):
+            self._sample(issue_type, issue_rows)
+
+    def sample(self) -> Optional[pd.DataFrame]:
+        """
+        Example rows kept in memory (all rows if sample_size is None).
+        """
+        samples = [df for df in self._samples.values() if not df.empty]
+        if not samples:
+            return None
+        return pd.concat(samples, ignore_index=True)
+
+    def meta(self) -> Dict[str, Any]:
+        meta: Dict[str, Any] = {}
+        if self.sample_size is not None:
+            meta["sample_size"] = self.sample_size
+        if self.details_dir is not None:
+            meta["details_path"] = str(self.details_dir)
+        return meta
+
+    def _sample(self, issue_type: str, rows: pd.DataFrame):
+        """
+        Bottom-k reservoir: every row gets a random priority and the k smallest are kept,
+        which is a uniform sample without replacement over everything seen so far.
+        """
+        if self.sample_size is None:
+            current = self._samples.get(issue_type)
+            self._samples[issue_type] = rows if current is None else pd.concat([current, rows], ignore_index=True)
+            return
+
+        priorities = self._rng.random(len(rows))
+        current = self._samples.get(issue_type)
+        if current is not None:
+            rows = pd.concat([current, rows], ignore_index=True)
+            priorities = np.concatenate([self._priorities[issue_type], priorities])
+
+        if len(rows) > self.sample_size:
+            keep = np.sort(np.argpartition(priorities, self.sample_size - 1)[:self.sample_size])
+            rows = rows.iloc[keep].reset_index(drop=True)
+            priorities = priorities[keep]
+
+        self._samples[issue_type] = rows
+        self._priorities[issue_type] = priorities
+
+    def _write_parquet(self, details: pd.DataFrame):
+        self._parts_written += 1
+        for issue_type, issue_rows in details.groupby("ISSUE_TYPE", sort=False):
+            part_dir = self.details_dir / f"ISSUE_TYPE={issue_type}"
+            part_dir.mkdir(parents=True, exist_ok=True)
+            issue_rows = issue_rows.drop(columns=["ISSUE_TYPE"])
+            # Long-form value columns mix types across COLUMN_NAMEs; store them as strings
+            for col in ("ACTUAL_VALUE", "EXPECTED_VALUE"):
+                if col in issue_rows.columns:
+                    issue_rows[col] = issue_rows[col].astype("string")
+            issue_rows.to_parquet(part_dir / f"part-{self._run_id}-{self._parts_written:06d}.parquet", index=False)
@@ -0,0 +1,158 @@
+import shutil
+import tempfile
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Union
+
+import numpy as np
+import pandas as pd
+
+from .DataComparator import DataComparator, DataComparisonResult, canonical_key_strings
+
+FrameSource = Union[pd.DataFrame, Iterable[pd.DataFrame]]
+
+
+class PartitionedComparator:
+    """
+    Out-of-core (spill-to-disk) variant of DataComparator.compare_by_keys for views
+    that do not fit in memory.
+
+    Both inputs are hash-partitioned by key into N buckets written as Parquet files,
+    then bucket pairs are compared one at a time, so peak memory is roughly one
+    input chunk or one bucket pair instead of both full DataFrames plus the merge.
+
+    Keys are hashed in their canonical string form (canonical_key_strings), so equal
+    keys land in the same bucket even when the key dtypes differ between the sides
+    (e.g. int64 vs float64 with NULLs vs Decimal).
+    """
+
+    def __init__(
+        self,
+        comparator: Optional[DataComparator] = None,
+        num_buckets: int = 16,
+        spill_dir: Optional[str] = None,
+    ):
+        """
+        :param comparator: DataComparator used for each bucket pair
+        :param num_buckets: Number of on-disk hash buckets per side
+        :param spill_dir: Parent directory for bucket files (defaults to the system temp dir)
+        """
+        if num_buckets < 1:
+            raise ValueError("num_buckets must be >= 1")
+        self.comparator = comparator or DataComparator()
+        self.num_buckets = num_buckets
+        self.spill_dir = spill_dir
+
+    def compare_by_keys(
+        self,
+        actual: FrameSource,
+        expected: FrameSource,
+        key_columns: List[str],
+        value_columns: Optional[List[str]] = None,
+        numeric_tolerance: Union[float, Dict[str, float]] = 0.0,
+        relative_tolerance: Union[float, Dict[str, float]] = 0.0,
+        duplicate_policy: str = "fail",
+    ) -> DataComparisonResult:
+        """
+        Compare two DataFrames (or iterables of DataFrame chunks, e.g. from a chunked
+        fetch) bucket by bucket and merge the per-bucket results.
+        """
+        work_dir = Path(tempfile.mkdtemp(prefix="compare_", dir=self.spill_dir))
+        try:
+            actual_schema = self._spill(actual, key_columns, work_dir / "actual")
+            expected_schema = self._spill(expected, key_columns, work_dir / "expected")
+
+            # A side that yielded no chunks at all is treated as empty with the other side's schema
+            if actual_schema is None:
+                actual_schema = pd.DataFrame(
+                    columns=list(expected_schema.columns) if expected_schema is not None else key_columns
+                )
+            if expected_schema is None:
+                expected_schema = pd.DataFrame(columns=list(actual_schema.columns))
+
+            if value_columns is None:
+                common_cols = (
+                    set(actual_schema.columns) & set(expected_schema.columns)
+                ) - set(key_columns)
+                value_columns = sorted(list(common_cols))
+
+            results = []
+            collector = self.comparator.create_collector()
+            for bucket in range(self.num_buckets):
+                actual_bucket = self._load_bucket(work_dir / "actual", bucket, actual_schema)
+                expected_bucket = self._load_bucket(work_dir / "expected", bucket, expected_schema)
+                if actual_bucket.empty and expected_bucket.empty:
+                    continue
+
+                # Raw bucket details, so each row reaches the collector exactly once
+                result = self.comparator._compare_by_keys(
+                    actual_bucket,
+                    expected_bucket,
+                    key_columns,
+                    value_columns,
+                    numeric_tolerance,
+                    relative_tolerance,
+                    duplicate_policy,
+                )
+                collector.add(result.details)
+                result.details = None
+                results.append(result)
+
+            merged = self.comparator.merge_results(results, collector)
+            merged.meta["num_buckets"] = self.num_buckets
+            return merged
+        finally:
+            shutil.rmtree(work_dir, ignore_errors=True)
+
+    def _spill(
+        self,
+        source: FrameSource,
+        key_columns: List[str],
+        side_dir: Path,
+    ) -> Optional[pd.DataFrame]:
+        """
+        Hash-partition every chunk of source by key and append it to the bucket
+        directories. Returns an empty frame with the source schema, or None if
+        the source yielded no chunks.
+        """
+        chunks = [source] if isinstance(source, pd.DataFrame) else source
+        schema = None
+
+        for chunk_no, chunk in enumerate(chunks):
+            if schema is None:
+                schema = chunk.iloc[0:0]
+            if chunk.empty:
+                continue
+
+            missing_keys = [col for col in key_columns if col not in chunk.columns]
+            if missing_keys:
+                raise ValueError(f"Key column(s) {missing_keys} missing in input chunk.")
+
+            canonical_keys = pd.DataFrame({col: canonical_key_strings(chunk[col]) for col in key_columns})
+            buckets = (
+                pd.util.hash_pandas_object(canonical_keys, index=False).to_numpy()
+                % np.uint64(self.num_buckets)
+            ).astype(np.int64)
+            order = np.argsort(buckets, kind="stable")
+            bounds = np.searchsorted(buckets[order], np.arange(self.num_buckets + 1))
+
+            for bucket in range(self.num_buckets):
+                start, stop = bounds[bucket], bounds[bucket + 1]
+                if start == stop:
+                    continue
+                bucket_dir = side_dir / f"bucket={bucket}"
+                bucket_dir.mkdir(parents=True, exist_ok=True)
+                part = chunk.iloc[order[start:stop]]
+                part.to_parquet(bucket_dir / f"part-{chunk_no:06d}.parquet", index=False)
+
+        return schema
+
+    @staticmethod
+    def _load_bucket(side_dir: Path, bucket: int, schema: pd.DataFrame) -> pd.DataFrame:
+        """
+        Read all parts of one bucket back into memory (empty frame if the bucket is empty).
+        """
+        bucket_dir = side_dir / f"bucket={bucket}"
+        parts = sorted(bucket_dir.glob("*.parquet")) if bucket_dir.exists() else []
+        if not parts:
+            return schema.copy()
+        return pd.concat([pd.read_parquet(part) for part in parts], ignore_index=True)
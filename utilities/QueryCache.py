@@ -0,0 +1,244 @@
+import hashlib
+import json
+import os
+import re
+import threading
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+import pandas as pd
+
+
+def normalize_sql(sql: str) -> str:
+    """
+    Canonical form of a query for cache keys: whitespace outside string literals is
+    collapsed and a trailing semicolon is dropped. Literals are kept verbatim.
+    """
+    parts = re.split(r"('(?:[^']|'')*')", sql.strip().rstrip(";").strip())
+    return "".join(
+        part if part.startswith("'") else re.sub(r"\s+", " ", part)
+        for part in parts
+    ).strip()
+
+
+class QueryCache:
+    """
+    Two-tier cache for query results:
+    - in-memory LRU bounded by max_memory_bytes (DataFrame deep memory usage)
+    - optional on-disk Parquet tier in cache_dir, bounded by max_disk_bytes, so results
+      survive across test runs
+
+    Entries are keyed by normalized SQL + connection fingerprint, expire after
+    ttl_seconds and can be invalidated per view.
+    """
+
+    def __init__(
+        self,
+        max_memory_bytes: int = 256 * 1024 ** 2,
+        cache_dir: Optional[str] = None,
+        ttl_seconds: Optional[float] = 3600.0,
+        max_disk_bytes: int = 2 * 1024 ** 3,
+    ):
+        """
+        :param max_memory_bytes: Budget of the in-memory tier
+        :param cache_dir: Directory of the Parquet tier (None = memory only)
+        :param ttl_seconds: Entry lifetime in both tiers (None = no expiry)
+        :param max_disk_bytes: Budget of the Parquet tier; oldest entries are evicted first
+        """
+        self.max_memory_bytes = max_memory_bytes
+        self.cache_dir = Path(cache_dir) if cache_dir else None
+        self.ttl_seconds = ttl_seconds
+        self.max_disk_bytes = max_disk_bytes
+
+        self._lock = threading.RLock()
+        # key -> (DataFrame, size in bytes, created timestamp, views)
+        self._memory: "OrderedDict[str, Tuple[pd.DataFrame, int, float, List[str]]]" = OrderedDict()
+        self._memory_bytes = 0
+        self._stats = {
+            "memory_hits": 0,
+            "disk_hits": 0,
+            "misses": 0,
+            "puts": 0,
+            "evictions": 0,
+            "expired": 0,
+            "invalidations": 0,
+        }
+        if self.cache_dir is not None:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+
+    @staticmethod
+    def make_key(sql: str, fingerprint: str) -> str:
+        payload = f"{fingerprint}\n{normalize_sql(sql)}"
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def get(self, sql: str, fingerprint: str) -> Optional[pd.DataFrame]:
+        """
+        Cached result of sql on the given connection, or None. Returns a copy, so callers
+        may modify it freely.
+        """
+        key = self.make_key(sql, fingerprint)
+        with self._lock:
+            entry = self._memory.get(key)
+            if entry is not None:
+                df, size, created, views = entry
+                if self._expired(created):
+                    self._stats["expired"] += 1
+                    self._drop_memory(key)
+                else:
+                    self._memory.move_to_end(key)
+                    self._stats["memory_hits"] += 1
+                    return df.copy()
+
+            df, created, views = self._read_disk(key)
+            if df is None:
+                self._stats["misses"] += 1
+                return None
+            self._stats["disk_hits"] += 1
+            self._put_memory(key, df, created, views)
+            return df.copy()
+
+    def put(self, sql: str, fingerprint: str, df: pd.DataFrame, views: Optional[List[str]] = None):
+        """
+        Store a result. views lists the view/table names the query reads, for invalidate_view.
+        """
+        key = self.make_key(sql, fingerprint)
+        views = [view.upper() for view in views or []]
+        created = time.time()
+        df = df.copy()
+        with self._lock:
+            self._stats["puts"] += 1
+            self._put_memory(key, df, created, views)
+            self._write_disk(key, sql, df, created, views)
+
+    def invalidate_view(self, view_name: str) -> int:
+        """
+        Drop every entry (both tiers) that reads view_name. Returns the number of entries dropped.
+        """
+        view = view_name.upper()
+        with self._lock:
+            keys = {key for key, entry in self._memory.items() if view in entry[3]}
+            keys |= {meta_path.stem for meta_path, meta in self._disk_entries() if view in meta.get("views", [])}
+            for key in keys:
+                if key in self._memory:
+                    self._drop_memory(key)
+                if self.cache_dir is not None:
+                    self._remove_disk(key)
+            self._stats["invalidations"] += len(keys)
+        return len(keys)
+
+    def clear(self):
+        with self._lock:
+            self._memory.clear()
+            self._memory_bytes = 0
+            for meta_path, _ in self._disk_entries():
+                self._remove_disk(meta_path.stem)
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            stats = dict(self._stats)
+            lookups = stats["memory_hits"] + stats["disk_hits"] + stats["misses"]
+            stats.update({
+                "memory_entries": len(self._memory),
+                "memory_bytes": self._memory_bytes,
+                "hit_ratio": (stats["memory_hits"] + stats["disk_hits"]) / lookups if lookups else 0.0,
+            })
+            if self.cache_dir is not None:
+                stats["disk_bytes"] = self._disk_bytes()
+            return stats
+
+    def _expired(self, created: float) -> bool:
+        return self.ttl_seconds is not None and time.time() - created > self.ttl_seconds
+
+    def _put_memory(self, key: str, df: pd.DataFrame, created: float, views: List[str]):
+        size = int(df.memory_usage(index=True, deep=True).sum())
+        if key in self._memory:
+            self._drop_memory(key)
+        if size > self.max_memory_bytes:
+            # Larger than the whole budget: keep it on disk only
+            return
+        self._memory[key] = (df, size, created, views)
+        self._memory_bytes += size
+        while self._memory_bytes > self.max_memory_bytes:
+            oldest = next(iter(self._memory))
+            self._drop_memory(oldest)
+            self._stats["evictions"] += 1
+
+    def _drop_memory(self, key: str):
+        _, size, _, _ = self._memory.pop(key)
+        self._memory_bytes -= size
+
+    def _disk_entries(self):
+        if self.cache_dir is None:
+            return []
+        entries = []
+        for meta_path in self.cache_dir.glob("*.json"):
+            try:
+                entries.append((meta_path, json.loads(meta_path.read_text(encoding="utf-8"))))
+            except (OSError, ValueError):
+                continue
+        return entries
+
+    def _read_disk(self, key: str):
+        if self.cache_dir is None:
+            return None, None, None
+        meta_path = self.cache_dir / f"{key}.json"
+        data_path = self.cache_dir / f"{key}.parquet"
+        if not meta_path.exists() or not data_path.exists():
+            return None, None, None
+        try:
+            meta = json.loads(meta_path.read_text(encoding="utf-8"))
+            if self._expired(meta["created"]):
+                self._stats["expired"] += 1
+                self._remove_disk(key)
+                return None, None, None
+            df = pd.read_parquet(data_path)
+        except (OSError, ValueError, KeyError):
+            self._remove_disk(key)
+            return None, None, None
+        df.attrs.update(meta.get("attrs", {}))
+        # Mark as recently used for the size-based eviction
+        os.utime(data_path)
+        return df, meta["created"], meta.get("views", [])
+
+    def _write_disk(self, key: str, sql: str, df: pd.DataFrame, created: float, views: List[str]):
+        if self.cache_dir is None:
+            return
+        data_path = self.cache_dir / f"{key}.parquet"
+        try:
+            df.to_parquet(data_path, index=False)
+        except Exception:
+            # Columns Parquet cannot represent (e.g. mixed-type objects) stay memory-only
+            data_path.unlink(missing_ok=True)
+            return
+        meta = {"sql": normalize_sql(sql), "views": views, "created": created, "attrs": df.attrs}
+        (self.cache_dir / f"{key}.json").write_text(json.dumps(meta, default=str), encoding="utf-8")
+        self._evict_disk()
+
+    def _remove_disk(self, key: str):
+        for suffix in (".parquet", ".json"):
+            (self.cache_dir / f"{key}{suffix}").unlink(missing_ok=True)
+
+    def _disk_bytes(self) -> int:
+        return sum(path.stat().st_size for path in self.cache_dir.glob("*.parquet"))
+
+    def _evict_disk(self):
+        """
+        Remove expired entries, then least recently used ones until under max_disk_bytes.
+        """
+        created = {meta_path.stem: meta.get("created", 0.0) for meta_path, meta in self._disk_entries()}
+        files = []
+        for data_path in self.cache_dir.glob("*.parquet"):
+            stat = data_path.stat()
+            files.append((stat.st_mtime, stat.st_size, data_path.stem))
+        files.sort()
+
+        total = sum(size for _, size, _ in files)
+        for _, size, key in files:
+            expired = self._expired(created.get(key, 0.0))
+            if not expired and total <= self.max_disk_bytes:
+                continue
+            self._remove_disk(key)
+            total -= size
+            self._stats["expired" if expired else "evictions"] += 1
@@ -0,0 +1,131 @@
+import sqlite3
+import threading
+from pathlib import Path
+from typing import Any, Dict, List, Set
+
+import numpy as np
+import pandas as pd
+
+from .DataComparator import canonical_key_strings
+
+# Separator between the parts of a composite key in the index
+KEY_SEPARATOR = "\x1f"
+
+
+def key_strings(df: pd.DataFrame, key_columns: List[str]) -> pd.Series:
+    """
+    One string per row identifying its (possibly composite) key, used as index key.
+    Parts are canonical (canonical_key_strings), so a key read as 1 from the view and
+    as 1.0 or Decimal("1") from the source maps to the same index entry.
+    """
+    keys = canonical_key_strings(df[key_columns[0]])
+    for col in key_columns[1:]:
+        keys = keys.str.cat(canonical_key_strings(df[col]), sep=KEY_SEPARATOR)
+    return keys.reset_index(drop=True)
+
+
+def hashes_to_int64(values) -> np.ndarray:
+    """
+    Row hashes as signed 64-bit integers (SQLite INTEGER). Unsigned / Decimal / float
+    hashes from different drivers are mapped onto the same int64 value.
+    """
+    array = np.asarray(values)
+    if array.dtype == np.uint64:
+        return array.view(np.int64)
+    if array.dtype == np.int64:
+        return array
+    wrapped = [int(value) % 2 ** 64 for value in array]
+    return np.array([value - 2 ** 64 if value >= 2 ** 63 else value for value in wrapped], dtype=np.int64)
+
+
+class RowHashIndex:
+    """
+    Persistent key -> row hash index in SQLite, one table per namespace (e.g. a view name).
+
+    Comparing the current hashes with the stored ones yields the keys that are new,
+    changed or deleted since the index was last replaced, so only those rows need to be
+    fetched and validated.
+    """
+
+    def __init__(self, path: str):
+        """
+        :param path: SQLite database file (created if missing)
+        """
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(self.path), check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+
+    @staticmethod
+    def _table(namespace: str) -> str:
+        return '"idx_' + namespace.replace('"', '""') + '"'
+
+    def _ensure_table(self, namespace: str):
+        self._conn.execute(
+            f"CREATE TABLE IF NOT EXISTS {self._table(namespace)} "
+            "(ROW_KEY TEXT PRIMARY KEY, ROW_HASH INTEGER NOT NULL) WITHOUT ROWID"
+        )
+
+    def size(self, namespace: str) -> int:
+        with self._lock:
+            self._ensure_table(namespace)
+            return self._conn.execute(f"SELECT COUNT(*) FROM {self._table(namespace)}").fetchone()[0]
+
+    def changed_keys(self, namespace: str, keys: pd.Series, hashes) -> Set[str]:
+        """
+        Keys that are new, whose hash differs, or that disappeared compared with the index.
+        """
+        table = self._table(namespace)
+        rows = zip(keys.tolist(), hashes_to_int64(hashes).tolist())
+        with self._lock:
+            self._ensure_table(namespace)
+            cursor = self._conn.cursor()
+            try:
+                cursor.execute("DROP TABLE IF EXISTS temp.current_hashes")
+                cursor.execute(
+                    "CREATE TEMP TABLE current_hashes (ROW_KEY TEXT PRIMARY KEY, ROW_HASH INTEGER) WITHOUT ROWID"
+                )
+                cursor.executemany("INSERT OR REPLACE INTO current_hashes VALUES (?, ?)", rows)
+                changed = cursor.execute(
+                    f"SELECT c.ROW_KEY FROM current_hashes c LEFT JOIN {table} i ON i.ROW_KEY = c.ROW_KEY "
+                    "WHERE i.ROW_KEY IS NULL OR i.ROW_HASH <> c.ROW_HASH "
+                    "UNION ALL "
+                    f"SELECT i.ROW_KEY FROM {table} i LEFT JOIN current_hashes c ON c.ROW_KEY = i.ROW_KEY "
+                    "WHERE c.ROW_KEY IS NULL"
+                ).fetchall()
+                cursor.execute("DROP TABLE temp.current_hashes")
+            finally:
+                cursor.close()
+        return {row[0] for row in changed}
+
+    def replace(self, namespace: str, keys: pd.Series, hashes):
+        """
+        Store the current hashes as the new state of the namespace (one transaction).
+        """
+        table = self._table(namespace)
+        rows = zip(keys.tolist(), hashes_to_int64(hashes).tolist())
+        with self._lock, self._conn:
+            self._ensure_table(namespace)
+            self._conn.execute(f"DELETE FROM {table}")
+            self._conn.executemany(f"INSERT OR REPLACE INTO {table} VALUES (?, ?)", rows)
+
+    def drop(self, namespace: str):
+        with self._lock, self._conn:
+            self._conn.execute(f"DROP TABLE IF EXISTS {self._table(namespace)}")
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            tables = [
+                row[0] for row in self._conn.execute(
+                    "SELECT name FROM sqlite_master WHERE type = 'table' AND name LIKE 'idx_%'"
+                )
+            ]
+            return {
+                name[len("idx_"):]: self._conn.execute(f'SELECT COUNT(*) FROM "{name}"').fetchone()[0]
+                for name in tables
+            }
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
@@ -1,17 +1,165 @@
-from typing import Dict, List, Optional
+import hashlib
+from concurrent.futures import as_completed
+from datetime import date, datetime
+from decimal import Decimal
+from typing import Dict, Iterator, List, Optional, Tuple
+import numpy as np
 import pandas as pd
 
+from .ConcurrentQueryRunner import ConcurrentQueryRunner
+from .DataComparator import row_fingerprints
+from .QueryCache import QueryCache
+
+
+def sql_literal(value, backend=None) -> str:
+    """
+    Render a Python/pandas scalar as a SQL literal.
+    :param backend: DBBackend of the target database; timestamps and dates then become
+        its typed literals, truncated to its precision. Without one they are plain
+        strings at full precision.
+    """
+    if value is None or (not isinstance(value, str) and pd.isna(value)):
+        return "NULL"
+    if isinstance(value, (bool, np.bool_)):
+        return "1" if value else "0"
+    if isinstance(value, Decimal):
+        return str(value)
+    if isinstance(value, (int, float, np.integer, np.floating)):
+        return repr(value.item() if isinstance(value, np.generic) else value)
+    if isinstance(value, (pd.Timestamp, datetime, np.datetime64)):
+        if backend is not None:
+            return backend.timestamp_literal(pd.Timestamp(value))
+        # Full precision (fractional seconds) and the UTC offset of tz-aware values
+        return f"'{pd.Timestamp(value).isoformat(sep=' ')}'"
+    if isinstance(value, date):
+        return backend.date_literal(value) if backend is not None else f"'{value.isoformat()}'"
+    return "'" + str(value).replace("'", "''") + "'"
+
+
+def _exact_number(value):
+    """
+    int for integral values (Python/NumPy ints, integral Decimals and floats), else an
+    exact Decimal, so range edges can be computed without float rounding.
+    """
+    if isinstance(value, (int, np.integer)) and not isinstance(value, (bool, np.bool_)):
+        return int(value)
+    if isinstance(value, (float, np.floating)):
+        value = Decimal(float(value))
+    elif not isinstance(value, Decimal):
+        raise ValueError(f"Range partitioning needs a numeric key column, got {type(value).__name__}.")
+    return int(value) if value == value.to_integral_value() else value
+
+
+def sample_buckets(df: pd.DataFrame, key_columns: List[str], modulus: int) -> np.ndarray:
+    """
+    Python twin of SemanticViewDataFetcher.sample_filter: bucket of every row's key in
+    0..modulus-1, from the first 32 bits of MD5('k1|k2|...') so SQL and pandas agree.
+    Integral float keys (integer columns with NULLs) are rendered without '.0'.
+    """
+    def render(value) -> str:
+        if isinstance(value, (float, np.floating)) and float(value).is_integer():
+            return str(int(value))
+        return str(value)
+
+    parts = [df[col].map(render) for col in key_columns]
+    keys = parts[0]
+    for part in parts[1:]:
+        keys = keys.str.cat(part, sep="|")
+    return np.fromiter(
+        (int(hashlib.md5(key.encode("utf-8")).hexdigest()[:8], 16) % modulus for key in keys),
+        dtype=np.int64,
+        count=len(keys),
+    )
+
+
+def _quantile_name(q: float) -> str:
+    return f"p{q * 100:g}"
+
+
+def _is_numeric_column(series: pd.Series) -> bool:
+    """
+    Numeric dtype, or object values that are all numbers (Decimal from NUMBER columns).
+    """
+    if pd.api.types.is_bool_dtype(series):
+        return False
+    if pd.api.types.is_numeric_dtype(series):
+        return True
+    values = series.dropna()
+    return not values.empty and all(
+        isinstance(value, (int, float, Decimal, np.integer, np.floating)) and not isinstance(value, bool)
+        for value in values
+    )
+
+
+def _profile_frame(rows: List[Dict], quantiles: Tuple[float, ...]) -> pd.DataFrame:
+    columns = ["column", "count", "null_count", "mean", "min", "max", "approx_distinct"]
+    columns += [_quantile_name(q) for q in quantiles]
+    return pd.DataFrame(rows).reindex(columns=columns)
+
+
+def _profile_arrow(table, columns: List[str], numeric_columns: List[str], quantiles: Tuple[float, ...]) -> pd.DataFrame:
+    """
+    Same profile as SemanticViewDataFetcher.profile_columns, computed with pyarrow.compute
+    on a local (lakehouse) table; quantiles use the t-digest approximation.
+    """
+    import pyarrow as pa
+    import pyarrow.compute as pc
+
+    rows = []
+    for column in columns:
+        values = table.column(column)
+        min_max = pc.min_max(values).as_py()
+        row = {
+            "column": column,
+            "count": pc.count(values).as_py(),
+            "null_count": values.null_count,
+            "min": min_max["min"],
+            "max": min_max["max"],
+            "approx_distinct": pc.count_distinct(values).as_py(),
+        }
+        if column in numeric_columns:
+            if pa.types.is_decimal(values.type):
+                values = values.cast(pa.float64())
+            row["mean"] = pc.mean(values).as_py()
+            digest = pc.tdigest(values, q=list(quantiles)).to_pylist() if values.length() else []
+            for q, value in zip(quantiles, digest or [None] * len(quantiles)):
+                row[_quantile_name(q)] = value
+        rows.append(row)
+    return _profile_frame(rows, quantiles)
+
+
 class SemanticViewDataFetcher:
     """
     Generic data fetcher for semantic views across multiple databases.
     Expects a connection manager with an execute_query(sql: str) -> pd.DataFrame method.
     """
 
-    def __init__(self, connection_manager):
+    def __init__(self, connection_manager, cache: Optional[QueryCache] = None):
         """
         :param connection_manager: Instance of your MultiDBConnectionManager (or similar)
+        :param cache: Optional QueryCache for fetch_view_data / fetch_row_count / fetch_distinct_values
         """
         self.conn_mgr = connection_manager
+        self.cache = cache
+
+    def _execute_cached(self, sql: str, view_name: str) -> pd.DataFrame:
+        """
+        Run sql through the cache (if any), keyed by the SQL and the connection fingerprint.
+        """
+        if self.cache is None:
+            return self.conn_mgr.execute_query(sql)
+        fingerprint = getattr(self.conn_mgr, "fingerprint", self.conn_mgr.db_type)
+        df = self.cache.get(sql, fingerprint)
+        if df is None:
+            df = self.conn_mgr.execute_query(sql)
+            self.cache.put(sql, fingerprint, df, views=[view_name])
+        return df
+
+    def invalidate_view(self, view_name: str) -> int:
+        """
+        Drop cached results of a view, e.g. after reloading it. Returns the number of entries dropped.
+        """
+        return self.cache.invalidate_view(view_name) if self.cache is not None else 0
 
     def _build_select_query(
         self,
@@ -63,7 +211,37 @@ class SemanticViewDataFetcher:
             order_by=order_by,
             limit=limit,
         )
-        return self.conn_mgr.execute_query(sql)
+        return self._execute_cached(sql, view_name)
+
+    def fetch_view_data_iter(
+        self,
+        view_name: str,
+        columns: Optional[List[str]] = None,
+        filters: Optional[str] = None,
+        order_by: Optional[str] = None,
+        limit: Optional[int] = None,
+        chunk_rows: int = 100_000,
+        chunk_bytes: Optional[int] = None,
+        as_arrow: bool = False,
+    ) -> Iterator[pd.DataFrame]:
+        """
+        Streams data from a semantic view in chunks (DataFrames, or Arrow tables with
+        as_arrow=True) so normalization/comparison can run without the whole view in memory.
+        With order_by on the key columns the chunks can feed SortedMergeComparator directly.
+        """
+        sql = self._build_select_query(
+            view_name=view_name,
+            columns=columns,
+            filters=filters,
+            order_by=order_by,
+            limit=limit,
+        )
+        return self.conn_mgr.execute_query_iter(
+            sql,
+            chunk_rows=chunk_rows,
+            chunk_bytes=chunk_bytes,
+            as_arrow=as_arrow,
+        )
 
     def fetch_row_count(self, view_name: str, filters: Optional[str] = None) -> int:
         """
@@ -73,8 +251,84 @@ class SemanticViewDataFetcher:
         query = f"SELECT COUNT(1) AS ROW_COUNT FROM {view_name}"
         if filters:
             query += f" WHERE {filters}"
-        df = self.conn_mgr.execute_query(query)
-        return int(df.iloc[0]["ROW_COUNT"])
+        df = self._execute_cached(query, view_name)
+        # Positional access: some backends return the alias in lower case
+        return int(df.iloc[0, 0])
+
+    def fetch_view_columns(self, view_name: str, filters: Optional[str] = None) -> List[str]:
+        """
+        Column names of a view from a zero-row query (cursor.description only, no data transfer).
+        """
+        predicate = f"({filters}) AND 1 = 0" if filters else "1 = 0"
+        return self.conn_mgr.fetch_columns(f"SELECT * FROM {view_name} WHERE {predicate}")
+
+    def build_key_filter(
+        self,
+        key_columns: List[str],
+        keys_df: pd.DataFrame,
+        max_keys: int = 1000,
+    ) -> Optional[str]:
+        """
+        WHERE predicate restricting a view to the keys present in keys_df:
+        - up to max_keys distinct keys: IN list (single key) or OR of AND terms (composite)
+        - more keys: MIN/MAX range on each key column
+        Returns None if no usable predicate can be built (e.g. no keys).
+        """
+        keys = keys_df[key_columns].dropna().drop_duplicates()
+        if keys.empty:
+            return None
+        backend = getattr(self.conn_mgr, "backend", None)
+
+        if len(keys) <= max_keys:
+            if len(key_columns) == 1:
+                values = ", ".join(sql_literal(value, backend) for value in keys[key_columns[0]])
+                return f"{key_columns[0]} IN ({values})"
+            terms = [
+                "(" + " AND ".join(f"{col} = {sql_literal(value, backend)}" for col, value in zip(key_columns, row)) + ")"
+                for row in keys.itertuples(index=False, name=None)
+            ]
+            return "(" + " OR ".join(terms) + ")"
+
+        ranges = []
+        for col in key_columns:
+            try:
+                low, high = keys[col].min(), keys[col].max()
+            except TypeError:
+                continue
+            ranges.append(f"{col} BETWEEN {sql_literal(low, backend)} AND {sql_literal(high, backend)}")
+        return " AND ".join(ranges) if ranges else None
+
+    def diff_against_frame(
+        self,
+        view_name: str,
+        expected_df: pd.DataFrame,
+        columns: List[str],
+        filters: Optional[str] = None,
+    ) -> Tuple[pd.DataFrame, pd.DataFrame]:
+        """
+        Bulk-loads expected_df[columns] into a session temp table and diffs it with the view
+        using set operations in the database (EXCEPT, MINUS on Oracle).
+        Returns (view_only_rows, expected_only_rows): only rows without an exact match
+        on the other side are transferred back.
+        """
+        set_op = "MINUS" if self.conn_mgr.db_type.lower() == "oracle" else "EXCEPT"
+        col_expr = ", ".join(columns)
+        view_select = self._build_select_query(view_name=view_name, columns=columns, filters=filters)
+        # The queries are format strings with a {table} placeholder; escape braces from filters
+        view_select = view_select.replace("{", "{{").replace("}", "}}")
+        table_select = f"SELECT {col_expr} FROM {{table}}"
+
+        view_only, expected_only = self.conn_mgr.query_with_temp_table(
+            expected_df[columns],
+            [
+                f"{view_select} {set_op} {table_select}",
+                f"{table_select} {set_op} {view_select}",
+            ],
+        )
+        # Result column names follow the backend's identifier case; restore the requested names
+        view_only.columns = columns
+        expected_only.columns = columns
+        return view_only, expected_only
 
     def fetch_distinct_values(
         self,
@@ -97,4 +351,381 @@ class SemanticViewDataFetcher:
             else:
                 base_query += f" LIMIT {limit}"
 
-        return self.conn_mgr.execute_query(base_query)
+        return self._execute_cached(base_query, view_name)
+
+    def _profile_exprs(self, column: str, numeric: bool, quantiles: Tuple[float, ...]) -> List[Tuple[str, str]]:
+        """
+        (stat name, SQL aggregate) pairs profiling one column on the current backend.
+        """
+        db_type = self.conn_mgr.db_type.lower()
+        exprs = [
+            ("count", f"COUNT({column})"),
+            ("min", f"MIN({column})"),
+            ("max", f"MAX({column})"),
+            ("approx_distinct", f"APPROX_COUNT_DISTINCT({column})"),
+        ]
+        if not numeric:
+            return exprs
+
+        exprs.append(("mean", f"AVG(CAST({column} AS FLOAT))" if db_type == "azure_sql" else f"AVG({column})"))
+        for q in quantiles:
+            if db_type == "snowflake":
+                expr = f"APPROX_PERCENTILE({column}, {q})"
+            elif db_type == "databricks":
+                expr = f"PERCENTILE_APPROX({column}, {q})"
+            elif db_type == "oracle":
+                expr = f"APPROX_PERCENTILE({q}) WITHIN GROUP (ORDER BY {column})"
+            elif db_type == "azure_sql":
+                expr = f"APPROX_PERCENTILE_CONT({q}) WITHIN GROUP (ORDER BY {column})"
+            else:
+                raise ValueError(f"Column profiling not supported for DB type: {db_type}")
+            exprs.append((_quantile_name(q), expr))
+        return exprs
+
+    def profile_columns(
+        self,
+        view_name: str,
+        columns: Optional[List[str]] = None,
+        filters: Optional[str] = None,
+        quantiles: Tuple[float, ...] = (0.25, 0.5, 0.75),
+        numeric_columns: Optional[List[str]] = None,
+    ) -> pd.DataFrame:
+        """
+        Column profile of a view computed in the database with one aggregate query:
+        count, null_count, min, max, approx_distinct and, for numeric columns, mean and
+        approximate quantiles. One row per column (same layout as DataHelpers.get_column_stats
+        plus the extra statistics), so only the profile is transferred.
+
+        :param numeric_columns: Columns that get mean/quantiles; detected from a small sample if None
+        """
+        if columns is None:
+            columns = self.fetch_view_columns(view_name)
+        if numeric_columns is None:
+            sample = self.fetch_view_data(view_name=view_name, columns=columns, filters=filters, limit=1000)
+            numeric_columns = [col for col in columns if _is_numeric_column(sample[col])]
+
+        if self.conn_mgr.db_type.lower() == "lakehouse":
+            table = self.conn_mgr.execute_query_arrow(
+                self._build_select_query(view_name=view_name, columns=columns, filters=filters)
+            )
+            return _profile_arrow(table, columns, numeric_columns, quantiles)
+
+        select = ["COUNT(*)"]
+        stats: List[Tuple[str, str]] = []
+        for column in columns:
+            for stat, expr in self._profile_exprs(column, column in numeric_columns, quantiles):
+                select.append(expr)
+                stats.append((column, stat))
+
+        query = f"SELECT {', '.join(f'{expr} AS P{i}' for i, expr in enumerate(select))} FROM {view_name}"
+        if filters:
+            query += f" WHERE {filters}"
+        row = self.conn_mgr.execute_query(query).iloc[0].tolist()
+
+        # Results are read by position, aliases are only there to keep them short and unique
+        row_count = int(row[0])
+        profile = {column: {"column": column, "null_count": None} for column in columns}
+        for (column, stat), value in zip(stats, row[1:]):
+            profile[column][stat] = value
+        for column in columns:
+            profile[column]["null_count"] = row_count - int(profile[column]["count"])
+        return _profile_frame(list(profile.values()), quantiles)
+
+    def _hash_bucket_expr(self, columns: List[str], num_buckets: int) -> str:
+        """
+        DB-specific SQL expression mapping the given key columns to a bucket 0..num_buckets-1.
+        """
+        db_type = self.conn_mgr.db_type.lower()
+        cols = ", ".join(columns)
+        if db_type == "snowflake":
+            return f"MOD(ABS(HASH({cols})), {num_buckets})"
+        if db_type == "databricks":
+            return f"PMOD(HASH({cols}), {num_buckets})"
+        if db_type == "oracle":
+            concatenated = " || '|' || ".join(columns)
+            return f"ORA_HASH({concatenated}, {num_buckets - 1})"
+        if db_type == "azure_sql":
+            return f"ABS(CHECKSUM({cols}) % {num_buckets})"
+        raise ValueError(f"Hash partitioning not supported for DB type: {db_type}")
+
+    def _key_hash_expr(self, columns: List[str]) -> str:
+        """
+        DB-specific non-negative integer hash of the key columns.
+        Buckets are MOD(key_hash, B^level), so every bucket splits cleanly into B child buckets.
+        """
+        db_type = self.conn_mgr.db_type.lower()
+        cols = ", ".join(columns)
+        if db_type == "snowflake":
+            return f"ABS(HASH({cols}))"
+        if db_type == "databricks":
+            return f"ABS(CAST(HASH({cols}) AS BIGINT))"
+        if db_type == "oracle":
+            concatenated = " || '|' || ".join(columns)
+            return f"ORA_HASH({concatenated})"
+        if db_type == "azure_sql":
+            return f"ABS(CAST(CHECKSUM({cols}) AS BIGINT))"
+        raise ValueError(f"Checksum comparison not supported for DB type: {db_type}")
+
+    def _row_hash_expr(self, columns: List[str]) -> str:
+        """
+        DB-specific integer hash of a whole row, wide enough to be SUMmed without overflow.
+        """
+        db_type = self.conn_mgr.db_type.lower()
+        cols = ", ".join(columns)
+        if db_type == "snowflake":
+            return f"HASH({cols})"
+        if db_type == "databricks":
+            return f"CAST(XXHASH64({cols}) AS DECIMAL(38, 0))"
+        if db_type == "oracle":
+            concatenated = " || '|' || ".join(columns)
+            return f"ORA_HASH({concatenated})"
+        if db_type == "azure_sql":
+            return f"CAST(BINARY_CHECKSUM({cols}) AS BIGINT)"
+        raise ValueError(f"Checksum comparison not supported for DB type: {db_type}")
+
+    def _mod_expr(self, expr: str, modulus: int) -> str:
+        if self.conn_mgr.db_type.lower() == "azure_sql":
+            return f"({expr}) % {modulus}"
+        return f"MOD({expr}, {modulus})"
+
+    def bucket_filter(self, key_columns: List[str], modulus: int, buckets: List[int]) -> str:
+        """
+        WHERE predicate selecting the rows whose MOD(key_hash, modulus) is in buckets.
+        """
+        bucket_list = ", ".join(str(int(bucket)) for bucket in buckets)
+        return f"{self._mod_expr(self._key_hash_expr(key_columns), modulus)} IN ({bucket_list})"
+
+    def _md5_bucket_expr(self, columns: List[str]) -> str:
+        """
+        DB-specific first 32 bits of MD5('k1|k2|...') as an integer (see sample_buckets).
+        """
+        db_type = self.conn_mgr.db_type.lower()
+        if db_type == "snowflake":
+            key = " || '|' || ".join(f"TO_VARCHAR({col})" for col in columns)
+            return f"TO_NUMBER(SUBSTR(MD5({key}), 1, 8), 'XXXXXXXX')"
+        if db_type == "databricks":
+            key = ", ".join(f"CAST({col} AS STRING)" for col in columns)
+            return f"CAST(CONV(SUBSTR(MD5(CONCAT_WS('|', {key})), 1, 8), 16, 10) AS BIGINT)"
+        if db_type == "oracle":
+            key = " || '|' || ".join(f"TO_CHAR({col})" for col in columns)
+            return f"TO_NUMBER(SUBSTR(RAWTOHEX(STANDARD_HASH({key}, 'MD5')), 1, 8), 'XXXXXXXX')"
+        if db_type == "azure_sql":
+            key = ", '|', ".join(f"CAST({col} AS VARCHAR(4000))" for col in columns)
+            key = f"CONCAT({key})" if len(columns) > 1 else key
+            return f"CAST(CAST(HASHBYTES('MD5', {key}) AS BINARY(4)) AS BIGINT)"
+        raise ValueError(f"Hash sampling not supported for DB type: {db_type}")
+
+    def sample_filter(self, key_columns: List[str], modulus: int, keep: int) -> str:
+        """
+        WHERE predicate keeping the keys whose MD5 bucket is < keep out of modulus, i.e. a
+        deterministic keep/modulus sample that sample_buckets reproduces on a DataFrame.
+        """
+        return f"{self._mod_expr(self._md5_bucket_expr(key_columns), modulus)} < {keep}"
+
+    def fetch_view_sample(
+        self,
+        view_name: str,
+        key_columns: List[str],
+        modulus: int,
+        keep: int,
+        columns: Optional[List[str]] = None,
+        filters: Optional[str] = None,
+    ) -> pd.DataFrame:
+        """
+        Deterministic key sample of a view (same keys as sample_buckets(...) < keep on the
+        expected side). Lakehouse files are local, so they are filtered in pandas.
+        """
+        if self.conn_mgr.db_type.lower() == "lakehouse":
+            df = self.fetch_view_data(view_name=view_name, columns=columns, filters=filters)
+            return df[sample_buckets(df, key_columns, modulus) < keep].reset_index(drop=True)
+
+        predicate = self.sample_filter(key_columns, modulus, keep)
+        return self.fetch_view_data(
+            view_name=view_name,
+            columns=columns,
+            filters=f"({filters}) AND {predicate}" if filters else predicate,
+        )
+
+    def fetch_bucket_checksums(
+        self,
+        view_name: str,
+        key_columns: List[str],
+        value_columns: List[str],
+        modulus: int,
+        filters: Optional[str] = None,
+        parent: Optional[Tuple[int, List[int]]] = None,
+    ) -> pd.DataFrame:
+        """
+        Per-bucket aggregates computed in the database: one row per non-empty bucket
+        MOD(key_hash, modulus) with BUCKET_ID, ROW_COUNT and ROW_CHECKSUM (SUM of row hashes).
+
+        :param parent: (parent_modulus, parent_buckets) to only aggregate rows inside those
+                       buckets when drilling down from a coarser level
+        """
+        columns = list(dict.fromkeys(list(key_columns) + list(value_columns)))
+        inner = (
+            f"SELECT {self._key_hash_expr(key_columns)} AS KEY_HASH, "
+            f"{self._row_hash_expr(columns)} AS ROW_HASH FROM {view_name}"
+        )
+        if filters:
+            inner += f" WHERE {filters}"
+
+        bucket_expr = self._mod_expr("KEY_HASH", modulus)
+        query = (
+            f"SELECT {bucket_expr} AS BUCKET_ID, COUNT(*) AS ROW_COUNT, SUM(ROW_HASH) AS ROW_CHECKSUM "
+            f"FROM ({inner}) hashed"
+        )
+        if parent is not None:
+            parent_modulus, parent_buckets = parent
+            bucket_list = ", ".join(str(int(bucket)) for bucket in parent_buckets)
+            query += f" WHERE {self._mod_expr('KEY_HASH', parent_modulus)} IN ({bucket_list})"
+        query += f" GROUP BY {bucket_expr}"
+
+        df = self.conn_mgr.execute_query(query)
+        df.columns = [col.upper() for col in df.columns]
+        # Drivers return NUMBER/DECIMAL aggregates as Decimal, float or int; normalize for comparison
+        df["BUCKET_ID"] = df["BUCKET_ID"].astype("int64")
+        df["ROW_COUNT"] = df["ROW_COUNT"].astype("int64")
+        df["ROW_CHECKSUM"] = df["ROW_CHECKSUM"].map(lambda value: "" if pd.isna(value) else str(int(value)))
+        return df[["BUCKET_ID", "ROW_COUNT", "ROW_CHECKSUM"]]
+
+    def fetch_row_hashes(
+        self,
+        view_name: str,
+        key_columns: List[str],
+        value_columns: List[str],
+        filters: Optional[str] = None,
+    ) -> pd.DataFrame:
+        """
+        Key columns + ROW_HASH per row, with the hash computed in the database so only keys
+        and one integer per row are transferred. Lakehouse files are local, so their rows
+        are read and hashed with row_fingerprints instead.
+        """
+        columns = list(dict.fromkeys(list(key_columns) + list(value_columns)))
+        if self.conn_mgr.db_type.lower() == "lakehouse":
+            df = self.fetch_view_data(view_name=view_name, columns=columns, filters=filters)
+            hashes = df[key_columns].reset_index(drop=True)
+            hashes["ROW_HASH"] = row_fingerprints(df, value_columns)
+            return hashes
+
+        select = ", ".join(key_columns) + f", {self._row_hash_expr(columns)} AS ROW_HASH"
+        query = f"SELECT {select} FROM {view_name}"
+        if filters:
+            query += f" WHERE {filters}"
+        df = self.conn_mgr.execute_query(query)
+        df.columns = list(key_columns) + ["ROW_HASH"]
+        return df
+
+    def _partition_filters(
+        self,
+        view_name: str,
+        key_columns: List[str],
+        num_partitions: int,
+        strategy: str,
+        filters: Optional[str],
+    ) -> List[str]:
+        """
+        One WHERE predicate per disjoint slice of the view.
+        """
+        if strategy == "hash":
+            bucket_expr = self._hash_bucket_expr(key_columns, num_partitions)
+            return [f"{bucket_expr} = {i}" for i in range(num_partitions)]
+
+        if strategy != "range":
+            raise ValueError(f"Unsupported partition strategy '{strategy}'. Use 'hash' or 'range'.")
+        if len(key_columns) != 1:
+            raise ValueError("Range partitioning needs exactly one numeric key column.")
+
+        key = key_columns[0]
+        query = f"SELECT MIN({key}) AS MIN_VALUE, MAX({key}) AS MAX_VALUE FROM {view_name}"
+        if filters:
+            query += f" WHERE {filters}"
+        bounds = self.conn_mgr.execute_query(query)
+        bounds.columns = [col.upper() for col in bounds.columns]
+        low, high = bounds.iloc[0]["MIN_VALUE"], bounds.iloc[0]["MAX_VALUE"]
+        if pd.isna(low) or pd.isna(high):
+            return [f"{key} IS NULL"]
+
+        # Exact arithmetic: float edges would skip or double-count BIGINT keys above 2^53
+        low, high = _exact_number(low), _exact_number(high)
+        if isinstance(low, int) and isinstance(high, int):
+            edges = [low + (high - low) * i // num_partitions for i in range(num_partitions)]
+        else:
+            edges = [low + (high - low) * i / num_partitions for i in range(num_partitions)]
+        # Interior cut points; the first and last slices are open-ended, so keys at MIN/MAX
+        # (or added outside them since the MIN/MAX query) are never dropped
+        cuts = [str(edge) if isinstance(edge, int) else format(edge, "f") for edge in sorted(set(edges))[1:]]
+        if not cuts:
+            return [f"{key} IS NOT NULL", f"{key} IS NULL"]
+
+        predicates = [f"{key} < {cuts[0]}"]
+        predicates += [f"{key} >= {cuts[i]} AND {key} < {cuts[i + 1]}" for i in range(len(cuts) - 1)]
+        predicates.append(f"{key} >= {cuts[-1]}")
+        predicates.append(f"{key} IS NULL")
+        return predicates
+
+    def iter_view_partitions(
+        self,
+        view_name: str,
+        key_columns: List[str],
+        num_partitions: int = 8,
+        strategy: str = "hash",
+        columns: Optional[List[str]] = None,
+        filters: Optional[str] = None,
+        runner: Optional[ConcurrentQueryRunner] = None,
+    ) -> Iterator[Tuple[int, pd.DataFrame]]:
+        """
+        Splits a view into disjoint slices (MOD(HASH(keys), N) or MIN/MAX key ranges),
+        fetches them concurrently and yields (partition_no, DataFrame) as slices complete,
+        so they can be streamed to a comparator without reassembling the whole view.
+        Use a pooled connection manager (use_pool=True) to run slices in parallel.
+        """
+        predicates = self._partition_filters(view_name, key_columns, num_partitions, strategy, filters)
+        queries = [
+            self._build_select_query(
+                view_name=view_name,
+                columns=columns,
+                filters=f"({filters}) AND ({predicate})" if filters else predicate,
+            )
+            for predicate in predicates
+        ]
+
+        owns_runner = runner is None
+        if owns_runner:
+            # More workers than pooled connections would just time out waiting on checkout
+            max_workers = min(len(queries), getattr(self.conn_mgr, "max_concurrency", len(queries)))
+            runner = ConcurrentQueryRunner(max_workers=max(max_workers, 1))
+        try:
+            futures = {runner.submit(self.conn_mgr, sql): i for i, sql in enumerate(queries)}
+            for future in as_completed(futures):
+                yield futures[future], future.result()
+        finally:
+            if owns_runner:
+                runner.shutdown(wait=False)
+
+    def fetch_view_data_partitioned(
+        self,
+        view_name: str,
+        key_columns: List[str],
+        num_partitions: int = 8,
+        strategy: str = "hash",
+        columns: Optional[List[str]] = None,
+        filters: Optional[str] = None,
+        runner: Optional[ConcurrentQueryRunner] = None,
+    ) -> pd.DataFrame:
+        """
+        Fetches a view as N concurrently fetched slices and reassembles them into one DataFrame.
+        """
+        parts = dict(
+            self.iter_view_partitions(
+                view_name,
+                key_columns,
+                num_partitions=num_partitions,
+                strategy=strategy,
+                columns=columns,
+                filters=filters,
+                runner=runner,
+            )
+        )
+        frames = [parts[i] for i in sorted(parts)]
+        return pd.concat(frames, ignore_index=True) if frames else pd.DataFrame()
@@ -0,0 +1,197 @@
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple, Union
+
+import numpy as np
+import pandas as pd
+
+from .DataComparator import DataComparator, DataComparisonResult
+
+
+class SortedMergeComparator:
+    """
+    Streaming merge-join comparison for inputs that are already sorted by the key
+    columns (e.g. fetched with ORDER BY <keys>).
+
+    Both sides are consumed as chunk iterators in lockstep: every row whose key is
+    < the smaller of the two buffered "last keys" is final on both sides and is
+    compared immediately, so memory stays at about one chunk per side. Rows equal
+    to a side's last key stay buffered until a larger key (or the end) arrives on
+    that side, so duplicates split across a chunk boundary are compared together.
+
+    The database ORDER BY must agree with Python ordering of the key values
+    (no NULL keys, consistent collation for string keys).
+    """
+
+    def __init__(self, comparator: Optional[DataComparator] = None):
+        """
+        :param comparator: DataComparator used to compare each aligned slice
+        """
+        self.comparator = comparator or DataComparator()
+
+    def compare_by_keys(
+        self,
+        actual_chunks: Iterable[pd.DataFrame],
+        expected_chunks: Iterable[pd.DataFrame],
+        key_columns: List[str],
+        value_columns: Optional[List[str]] = None,
+        numeric_tolerance: Union[float, Dict[str, float]] = 0.0,
+        relative_tolerance: Union[float, Dict[str, float]] = 0.0,
+        duplicate_policy: str = "fail",
+    ) -> DataComparisonResult:
+        """
+        Compare two sorted chunk streams and merge the per-slice results into one result.
+        """
+        results = []
+        collector = self.comparator.create_collector()
+        for result in self.iter_compare_by_keys(
+            actual_chunks,
+            expected_chunks,
+            key_columns,
+            value_columns=value_columns,
+            numeric_tolerance=numeric_tolerance,
+            relative_tolerance=relative_tolerance,
+            duplicate_policy=duplicate_policy,
+        ):
+            collector.add(result.details)
+            result.details = None
+            results.append(result)
+        return self.comparator.merge_results(results, collector)
+
+    def iter_compare_by_keys(
+        self,
+        actual_chunks: Iterable[pd.DataFrame],
+        expected_chunks: Iterable[pd.DataFrame],
+        key_columns: List[str],
+        value_columns: Optional[List[str]] = None,
+        numeric_tolerance: Union[float, Dict[str, float]] = 0.0,
+        relative_tolerance: Union[float, Dict[str, float]] = 0.0,
+        duplicate_policy: str = "fail",
+    ) -> Iterator[DataComparisonResult]:
+        """
+        Yield one DataComparisonResult per aligned key range as soon as it is final,
+        so missing and mismatched rows can be reported while the streams are read.
+        """
+        actual_side = _SortedStream(actual_chunks, key_columns, "actual")
+        expected_side = _SortedStream(expected_chunks, key_columns, "expected")
+
+        while True:
+            actual_side.fill()
+            expected_side.fill()
+
+            if actual_side.exhausted and expected_side.exhausted:
+                break
+
+            # A side's last key may continue in its next chunk, so only keys below the
+            # smallest open last key are final; a finished side bounds nothing
+            open_keys = [side.last_key() for side in (actual_side, expected_side) if not side.done]
+            if not open_keys:
+                actual_ready, expected_ready = actual_side.take_all(), expected_side.take_all()
+            else:
+                watermark = min(open_keys)
+                actual_ready = actual_side.take_below(watermark)
+                expected_ready = expected_side.take_below(watermark)
+
+            if actual_ready is None:
+                actual_ready = expected_ready.iloc[0:0][key_columns]
+            if expected_ready is None:
+                expected_ready = actual_ready.iloc[0:0][key_columns]
+
+            if value_columns is None:
+                value_columns = sorted(
+                    (set(actual_side.columns or actual_ready.columns)
+                     & set(expected_side.columns or expected_ready.columns))
+                    - set(key_columns)
+                )
+
+            # Raw per-slice details: compare_by_keys folds them into its one collector
+            yield self.comparator._compare_by_keys(
+                actual_ready,
+                expected_ready,
+                key_columns,
+                value_columns,
+                numeric_tolerance,
+                relative_tolerance,
+                duplicate_policy,
+            )
+
+
+class _SortedStream:
+    """
+    Buffers one sorted chunk iterator and hands out key-bounded prefixes.
+    """
+
+    def __init__(self, chunks: Iterable[pd.DataFrame], key_columns: List[str], name: str):
+        self.chunks = iter(chunks)
+        self.key_columns = key_columns
+        self.name = name
+        self.buffer: Optional[pd.DataFrame] = None
+        self.columns: Optional[List[str]] = None
+        self.done = False
+        self._previous_last: Optional[Tuple[Any, ...]] = None
+
+    @property
+    def exhausted(self) -> bool:
+        return self.done and self.buffer is None
+
+    def fill(self):
+        """
+        Pull chunks until the buffer holds a key below its last key (rows that are
+        final on this side) or the iterator is exhausted.
+        """
+        while not self.done and (self.buffer is None or self._first_key() == self.last_key()):
+            try:
+                chunk = next(self.chunks)
+            except StopIteration:
+                self.done = True
+                return
+            if self.columns is None:
+                self.columns = list(chunk.columns)
+            if chunk.empty:
+                continue
+            self._check_sorted(chunk)
+            self.buffer = chunk if self.buffer is None else pd.concat([self.buffer, chunk], ignore_index=True)
+
+    def last_key(self) -> Tuple[Any, ...]:
+        return tuple(self.buffer[self.key_columns].iloc[-1])
+
+    def take_all(self) -> Optional[pd.DataFrame]:
+        ready, self.buffer = self.buffer, None
+        return ready
+
+    def take_below(self, watermark: Tuple[Any, ...]) -> Optional[pd.DataFrame]:
+        """
+        Split off the sorted prefix of the buffer with key < watermark.
+        """
+        if self.buffer is None:
+            return None
+        cut = int(_lexicographic_lt(self.buffer, self.key_columns, watermark).sum())
+        ready = self.buffer.iloc[:cut]
+        self.buffer = self.buffer.iloc[cut:] if cut < len(self.buffer) else None
+        return ready
+
+    def _first_key(self) -> Tuple[Any, ...]:
+        return tuple(self.buffer[self.key_columns].iloc[0])
+
+    def _check_sorted(self, chunk: pd.DataFrame):
+        keys = chunk[self.key_columns]
+        index = pd.MultiIndex.from_frame(keys) if len(self.key_columns) > 1 else pd.Index(keys.iloc[:, 0])
+        first = tuple(keys.iloc[0])
+        if not index.is_monotonic_increasing or (
+            self._previous_last is not None and first < self._previous_last
+        ):
+            raise ValueError(
+                f"{self.name} chunks are not sorted by {self.key_columns}; "
+                "fetch them with ORDER BY on the key columns."
+            )
+        self._previous_last = tuple(keys.iloc[-1])
+
+
+def _lexicographic_lt(df: pd.DataFrame, key_columns: List[str], watermark: Tuple[Any, ...]) -> np.ndarray:
+    """
+    Vectorized (k1, k2, ...) < watermark over a DataFrame.
+    """
+    result = np.zeros(len(df), dtype=bool)
+    # Build from the last key outwards: lt = (k < w) | ((k == w) & lt_rest)
+    for col, bound in reversed(list(zip(key_columns, watermark))):
+        values = df[col].to_numpy()
+        result = (values < bound) | ((values == bound) & result)
+    return result